@@ -1,13 +1,16 @@
 import numpy as np
 import pygame
+from imgcache import scaled_cache
 
 #------------------------------AnimatedGif Class------------------------------
 #Custom object containing data for displaying an animated GIF
 #Created as python is not very friendly when it comes to interacting with animated GIFs
 class AnimatedGif:
     #Constructor - Should be relatively self-explanatory. new_paths is an array of file paths as strings
-    def __init__(self, new_x, new_y, new_w, new_h, new_paths):
+    #new_frameTime is how long (ms) each frame is shown for, used by screens that only redraw when a timer tells them the next frame is due
+    def __init__(self, new_x, new_y, new_w, new_h, new_paths, new_frameTime=100):
         self.frameCounter = 0 #Index of frame array that contains the next image to be displayed
+        self.frameTime = new_frameTime
         self.gif_x = new_x
         self.gif_y = new_y
         self.gif_w = new_w
@@ -16,7 +19,7 @@ class AnimatedGif:
         self.framePaths = np.array(new_paths) #Array of string, to store the file paths
         self.frames = np.array([None] * self.noOfFrames) #Array of pygame Surface objects, to store the actual graphical frames
         for n in range(self.noOfFrames):
-            self.frames[n] = pygame.transform.scale(pygame.image.load(new_paths[n]), [self.gif_w, self.gif_h])
+            self.frames[n] = scaled_cache.loadScaled(new_paths[n], [self.gif_w, self.gif_h], False) #GIFs sharing the same frames and size (e.g. the two coins) share one set of scaled images
 
     #Return next frame of the GIF to be displayed
     #Set to loop the GIF indefinitely
@@ -24,4 +27,14 @@ class AnimatedGif:
         self.frameCounter = self.frameCounter + 1
         if self.frameCounter  >= self.noOfFrames:
             self.frameCounter = 0 #Play GIF from beginning as frame cycle completed
+        return self.frames[self.frameCounter]
+
+    #Move on to the next frame without returning it
+    def nextFrame(self):
+        self.frameCounter = self.frameCounter + 1
+        if self.frameCounter >= self.noOfFrames:
+            self.frameCounter = 0
+
+    #Return the frame currently being shown, without moving on
+    def getFrame(self):
         return self.frames[self.frameCounter]
\ No newline at end of file
@@ -0,0 +1 @@
+from .assetbundle import Bundle_Error, AssetBundle, asset_bundle, DEFAULT_BUNDLE_PATH, getImageKey, getGeneratedKey, writeBundle, readIndex, loadImage, preloadImage, setDisplayFormat, toDisplayFormat
\ No newline at end of file
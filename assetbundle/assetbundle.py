@@ -0,0 +1,206 @@
+import json
+import mmap
+import os
+import struct
+import pygame
+
+#------------------------------Asset Bundle Format------------------------------
+#Single file holding every image used at start-up, already scaled to the size it is shown at, and the title deeds that would otherwise be rendered with fonts
+#Images are stored as raw pixel buffers, so at launch the file is memory-mapped and each one is turned into a Surface with pygame.image.frombuffer: no PNG decoding, no resampling and no font rendering
+#Layout (little-endian):
+#   header  - magic b'DFAB', format version (unsigned short), length of the index (unsigned int)
+#   index   - JSON object:
+#             sources - file path -> [size, modification time (ns)] of every image file baked into the bundle, so a bundle built from older images is not used
+#             assets  - key -> [offset from the start of the pixels, width, height, pixel format ('RGB' or 'RGBA')] of every image
+#   pixels  - starting on the first 64 byte boundary after the index, each image's rows one after another with no padding, every image starting on a 64 byte boundary
+#Build with bundle.py (python bundle.py); the game still loads everything itself if there is no bundle or it is out of date
+
+BUNDLE_MAGIC = b'DFAB'
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = struct.Struct('<4sHI')
+BUNDLE_ALIGN = 64
+DEFAULT_BUNDLE_PATH = 'img/Assets.dfa'
+
+class Bundle_Error(Exception):
+    pass
+
+#Key of an image file in a bundle, optionally scaled to size ([width, height]) with smoothscale (smooth=True) or scale
+def getImageKey(path, size=None, smooth=True):
+    if size == None:
+        return path
+    return path + '@' + str(int(size[0])) + 'x' + str(int(size[1])) + ('' if smooth else '/fast')
+
+#Key of a generated image (e.g. a title deed) in a bundle, made from the kind of image and every value it is drawn from
+#As the values are part of the key, changing them (e.g. a property's rent) just means the image is not found in the bundle, rather than an out of date one being shown
+def getGeneratedKey(kind, *values):
+    return kind + '/' + '|'.join(str(value) for value in values)
+
+#Write a bundle file. assets is a dictionary of key -> Surface, and sources a list of the image files they were made from
+def writeBundle(path, assets, sources):
+    index = {'sources': {}, 'assets': {}}
+    for source in sources:
+        index['sources'][source] = [os.path.getsize(source), os.stat(source).st_mtime_ns]
+
+    pixel_data = []
+    offset = 0
+    for key in assets:
+        surface = assets[key]
+        pixel_format = 'RGB'
+        if surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() != None: #Alpha is kept even if every pixel is opaque, as scaling it later can still leave some pixels slightly see-through
+            pixel_format = 'RGBA'
+        pixels = pygame.image.tobytes(surface, pixel_format)
+        padding = -offset % BUNDLE_ALIGN
+        pixel_data.append(b'\0' * padding)
+        offset += padding
+        index['assets'][key] = [offset, surface.get_width(), surface.get_height(), pixel_format]
+        pixel_data.append(pixels)
+        offset += len(pixels)
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    start = getPixelsStart(len(index_bytes))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as fh:
+        fh.write(BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(index_bytes)))
+        fh.write(index_bytes)
+        fh.write(b'\0' * (start - BUNDLE_HEADER.size - len(index_bytes)))
+        for chunk in pixel_data:
+            fh.write(chunk)
+    os.replace(tmp_path, path)
+    return start + offset #Size of the bundle in bytes
+
+#Offset in a bundle file of the start of the pixels, which follow the header and index
+def getPixelsStart(index_len):
+    start = BUNDLE_HEADER.size + index_len
+    return start + (-start % BUNDLE_ALIGN)
+
+
+#------------------------------AssetBundle Class------------------------------
+#An open bundle file. Images are only turned into Surfaces when first asked for, and the pixels are only read from disk when first drawn
+class AssetBundle:
+    def __init__(self):
+        self.path = None
+        self.mm = None #Memory map of the bundle file; None if no bundle is open
+        self.assets = {} #Key -> [offset in the file, width, height, pixel format]
+        self.surfaces = {} #Key -> Surface of every image asked for so far
+        self.changed_source = None #Image file that had changed since the bundle was built, if that is why the last bundle opened could not be used
+        self.hits = 0
+        self.misses = 0
+
+    #Open a bundle file, returning whether it can be used. A missing, damaged or out of date bundle is not an error; the game just loads everything itself
+    def open(self, path=DEFAULT_BUNDLE_PATH):
+        self.close()
+        self.changed_source = None
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as fh:
+                #Copy-on-write, so surfaces made from the bundle can still be drawn on without the file being changed
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+            index = readIndex(mm)
+        except (OSError, ValueError, Bundle_Error):
+            return False
+        for source in index['sources']:
+            if not os.path.exists(source) or [os.path.getsize(source), os.stat(source).st_mtime_ns] != index['sources'][source]:
+                self.changed_source = source
+                mm.close()
+                return False
+        self.path = path
+        self.mm = mm
+        self.assets = index['assets']
+        return True
+
+    #Surface of an image in the bundle, or None if it is not in the bundle (or no bundle is open)
+    #The same Surface is returned every time a key is asked for, just as with SurfaceCache
+    def get(self, key):
+        if key in self.surfaces:
+            self.hits += 1
+            return self.surfaces[key]
+        if key not in self.assets:
+            self.misses += 1
+            return None
+        offset, width, height, pixel_format = self.assets[key]
+        length = width * height * len(pixel_format)
+        self.surfaces[key] = toDisplayFormat(pygame.image.frombuffer(memoryview(self.mm)[offset:offset+length], (width, height), pixel_format))
+        self.hits += 1
+        return self.surfaces[key]
+
+    def isOpen(self):
+        return self.mm != None
+
+    #Stop using the bundle. Surfaces already made from it keep the memory map alive until they are gone, so it is not closed directly
+    def close(self):
+        self.path = None
+        self.mm = None
+        self.assets = {}
+        self.surfaces = {}
+
+    def getReport(self):
+        if not self.isOpen():
+            return 'Asset bundle: not in use'
+        return 'Asset bundle: %s, %d images, %d used from the bundle, %d not in it' % (self.path, len(self.assets), self.hits, self.misses)
+
+#Read and check the header and index at the start of a bundle
+def readIndex(data):
+    if len(data) < BUNDLE_HEADER.size:
+        raise Bundle_Error('File is too short to be an asset bundle')
+    magic, version, index_len = BUNDLE_HEADER.unpack_from(data, 0)
+    if magic != BUNDLE_MAGIC:
+        raise Bundle_Error('File is not an asset bundle')
+    if version != BUNDLE_VERSION:
+        raise Bundle_Error('Asset bundle is version ' + str(version) + ', but only version ' + str(BUNDLE_VERSION) + ' can be read')
+    index = json.loads(bytes(data[BUNDLE_HEADER.size:BUNDLE_HEADER.size+index_len]).decode('utf-8'))
+    start = getPixelsStart(index_len)
+    for key in index['assets']:
+        index['assets'][key][0] += start #Now from the start of the file
+        offset, width, height, pixel_format = index['assets'][key]
+        if offset + width * height * len(pixel_format) > len(data):
+            raise Bundle_Error('Asset bundle is cut short')
+    return index
+
+
+#------------------------------Display Format------------------------------
+#Surfaces in a different pixel format to the display (PNGs load as ABGR or RGB, bundle images are RGB or RGBA) are converted pixel by pixel every time they are blitted
+#Every image is converted to the display's format once, as it is loaded; before there is a display (e.g. headless games and benchmarks), images are kept as they are
+display_formats = {} #Has per-pixel alpha (True/False) -> 1x1 Surface in the display's format, set by setDisplayFormat
+
+#Called on the main thread each time the display is created, as convert and convert_alpha read the display's format
+#Images can then be converted on any thread: converting to these surfaces' formats is the same thing but without touching the display
+def setDisplayFormat():
+    if pygame.display.get_surface() == None:
+        return
+    display_formats[True] = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    display_formats[False] = pygame.Surface((1, 1)).convert()
+
+#surface in the display's format (keeping its per-pixel alpha, if it has any), or surface itself if there is no display or it is already in that format
+def toDisplayFormat(surface):
+    template = display_formats.get(bool(surface.get_flags() & pygame.SRCALPHA))
+    if template == None or (surface.get_masks() == template.get_masks() and surface.get_bitsize() == template.get_bitsize()):
+        return surface
+    return surface.convert(template)
+
+
+asset_bundle = AssetBundle() #Bundle shared by every screen; opened by main.py before the loading screen
+preloaded_images = {} #Key -> Surface of each image loaded ahead of time by preloadImage
+
+#Load an image file, optionally scaled to size and converted to the display's format, taking it from the shared bundle if it has been baked into it
+#Every image file the game shows is loaded through here. Unlike SurfaceCache.loadScaled, the full-size image is not kept after scaling, which matters for the large images (cards, board) only ever shown at one size
+def loadImage(path, size=None, smooth=True):
+    key = getImageKey(path, size, smooth)
+    ret_surface = preloaded_images.get(key)
+    if ret_surface != None:
+        return ret_surface
+    ret_surface = asset_bundle.get(key)
+    if ret_surface != None:
+        return ret_surface
+    ret_surface = pygame.image.load(path)
+    if size != None:
+        if smooth:
+            ret_surface = pygame.transform.smoothscale(ret_surface, [int(size[0]), int(size[1])])
+        else:
+            ret_surface = pygame.transform.scale(ret_surface, [int(size[0]), int(size[1])])
+    return toDisplayFormat(ret_surface)
+
+#Load an image ahead of time (e.g. on a BackgroundLoader worker thread), so that loadImage returns it straight away when it is needed
+#The images kept are only the ones a game holds on to anyway (cards, board, dice, pieces), so they are never thrown away
+def preloadImage(path, size=None, smooth=True):
+    preloaded_images[getImageKey(path, size, smooth)] = loadImage(path, size, smooth)
@@ -0,0 +1,53 @@
+#Times drawing the cards, dice, pieces and thumbnails as pygame loads them from their files, against drawing them out of the sprite atlas, and how long building the atlas takes
+#Uses SDL's dummy video driver, so no window is opened. The asset bundle is not used
+#Run from anywhere with: python bench/atlas.py [frames]
+import os
+import sys
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Image files are opened with paths relative to the repository root
+
+import pygame
+from assetbundle import getImageKey, loadImage, setDisplayFormat
+from spriteatlas import SpriteAtlas
+from new import getAtlasImages
+
+#Median time to blit every image once onto the screen, over a number of frames
+def timeFrames(no_of_frames, screen, imgs):
+    times = []
+    for counter in range(no_of_frames):
+        start = time.perf_counter()
+        for img_no in range(len(imgs)):
+            screen.blit(imgs[img_no], [(img_no * 37) % 700, (img_no * 53) % 500])
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times)//2]
+
+if __name__ == '__main__':
+    no_of_frames = 200
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    images = getAtlasImages()
+
+    start = time.perf_counter()
+    loaded = [loadImage(path, size, smooth) for path, size, smooth in images] #Before setDisplayFormat, so not converted to the display's format
+    load_time = time.perf_counter() - start
+    setDisplayFormat()
+    atlas = SpriteAtlas()
+    start = time.perf_counter()
+    atlas.build(images)
+    build_time = time.perf_counter() - start
+    sprites = [atlas.get(getImageKey(path, size, smooth)) for path, size, smooth in images]
+
+    loaded_time = timeFrames(no_of_frames, screen, loaded)
+    atlas_time = timeFrames(no_of_frames, screen, sprites)
+    print('Loading %d images: %.0f ms, building the atlas from their files: %.0f ms' % (len(images), 1000 * load_time, 1000 * build_time))
+    print('Drawing every image as loaded:      %.2f ms per frame' % (1000 * loaded_time))
+    print('Drawing every image from the atlas: %.2f ms per frame (%.1fx faster)' % (1000 * atlas_time, loaded_time / atlas_time))
+    print(atlas.getReport())
@@ -0,0 +1,60 @@
+#Compares how long the game's own thread is held up by saving when autosaves are written straight away, and when they are handed to the SaveWriter thread
+#Games are played by the Turn_Engine with autosave turned on, so a save happens every time play returns to the first player
+#A slow disk (such as a home directory on a network drive) can be imitated by adding a delay, in ms, to every fsync
+#Run from anywhere with: python bench/autosave.py [turns] [fsync delay in ms]
+import os
+import sys
+import random
+import tempfile
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Turn_Engine
+from new import createHeadlessGame
+from savefile import readSave, save_writer
+
+#Play a game for a number of turns, returning the time taken by each turn in ms
+def timeTurns(no_of_turns, save_path, background):
+    random.seed(1)
+    game = createHeadlessGame(['Player 1', 'Player 2', 'Player 3', 'Player 4'])
+    game.save_path = save_path
+    game.autosave = True
+    if not background:
+        game.autosaveGame = game.saveGame #Write every autosave before carrying on, as the game used to
+    engine = Turn_Engine(game, new_max_turns=no_of_turns)
+
+    turn_times = []
+    while not engine.isDone():
+        start = time.perf_counter()
+        engine.step()
+        turn_times.append(1000 * (time.perf_counter() - start))
+    save_writer.flush()
+    readSave(save_path) #Last autosave must have been written completely
+    return sorted(turn_times)
+
+def describe(name, turn_times):
+    print('%-12s mean %.3f ms  p99 %.3f ms  max %.3f ms per turn, %.1f ms in total' % (name, sum(turn_times) / len(turn_times), turn_times[int(len(turn_times) * 0.99)], turn_times[-1], sum(turn_times)))
+
+if __name__ == '__main__':
+    no_of_turns = 2000
+    fsync_delay = 0
+    if len(sys.argv) > 1:
+        no_of_turns = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        fsync_delay = float(sys.argv[2])
+
+    if fsync_delay > 0:
+        real_fsync = os.fsync
+        def slowFsync(fd):
+            time.sleep(fsync_delay / 1000)
+            real_fsync(fd)
+        os.fsync = slowFsync
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        print('Turns: ' + str(no_of_turns) + ', fsync delay ' + str(fsync_delay) + ' ms')
+        describe('Synchronous', timeTurns(no_of_turns, os.path.join(save_dir, 'sync.dfo'), False))
+        describe('Background', timeTurns(no_of_turns, os.path.join(save_dir, 'background.dfo'), True))
+        print(save_writer.getReport())
@@ -0,0 +1,70 @@
+#Checks snapshots of the board made with Board_Arrays, and the vectorised calculations on them, against the Property objects during real (headless) games, then times both
+#Run from anywhere with: python bench/board_arrays.py [number of games]
+import os
+import sys
+import random
+import timeit
+
+import numpy as np
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Prop_Type, Turn_Engine, Board_Arrays
+from new import createHeadlessGame
+
+#Rent for every square worked out one Property object at a time, by the same rules as Game.determineRent
+def objectRents(board, dice_roll):
+    ret_rents = []
+    for counter in range(board.max_pos + 1):
+        prop = board.getProp(counter)
+        rent = 0
+        if prop.prop_type == Prop_Type.PAYMENT:
+            rent = prop.surcharge
+        elif prop.prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION) and prop.prop_owner != -1:
+            if prop.prop_type == Prop_Type.NORMAL:
+                rent = prop.getRent()
+                if board.wholeGroupOwned(prop.prop_owner, counter) and prop.C_Houses == 0:
+                    rent = rent * 2
+            elif prop.prop_type == Prop_Type.SCHOOL:
+                rent = prop.getRent(board, prop.prop_owner)
+            else:
+                rent = prop.getRent(board, prop.prop_owner, dice_roll)
+        ret_rents.append(rent)
+    return np.array(ret_rents)
+
+def checkBoard(game, dice_roll):
+    board = game.board
+    arrays = Board_Arrays(board)
+    no_of_players = len(game.players)
+    assert (arrays.getRents(dice_roll, no_of_players) == objectRents(board, dice_roll)).all()
+    assert list(arrays.getAssetsVals(no_of_players)) == [board.getPortfolio(counter).assets_val for counter in range(no_of_players)]
+    assert list(arrays.getObtainMons(no_of_players)) == [board.getPortfolio(counter).obtain_mon for counter in range(no_of_players)]
+    houses, blocks = arrays.getUpgradeCounts(no_of_players)
+    assert list(houses) == [board.getPortfolio(counter).C_Houses for counter in range(no_of_players)]
+    assert list(blocks) == [board.getPortfolio(counter).T_Blocks for counter in range(no_of_players)]
+
+if __name__ == '__main__':
+    no_of_games = 20
+    if len(sys.argv) > 1:
+        no_of_games = int(sys.argv[1])
+
+    random.seed(5)
+    checks = 0
+    for counter in range(no_of_games):
+        game = createHeadlessGame(['Player ' + str(p_count+1) for p_count in range(4)])
+        engine = Turn_Engine(game, new_max_turns=500)
+        while engine.step():
+            if engine.turns_played % 10 == 0:
+                checkBoard(game, random.randint(2, 12))
+                checks += 1
+        checkBoard(game, 7)
+    print('States checked: ' + str(checks) + ' (all identical)')
+
+    repeats = 2000
+    object_time = timeit.timeit(lambda: objectRents(game.board, 7), number=repeats)
+    arrays = Board_Arrays(game.board)
+    array_time = timeit.timeit(lambda: arrays.getRents(7, 4), number=repeats)
+    print('Rents for all squares, Property objects: %.1f us' % (object_time / repeats * 1e6))
+    print('Rents for all squares, Board_Arrays:     %.1f us' % (array_time / repeats * 1e6))
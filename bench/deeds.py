@@ -0,0 +1,50 @@
+#Times LoadProperties drawing every title deed, against reusing the deeds already made by an earlier game, against a fresh start that finds them in the disk cache
+#Uses SDL's dummy video driver, so no window is opened. The asset bundle is not used
+#Run from anywhere with: python bench/deeds.py [calls of each]
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+import warnings
+warnings.simplefilter('ignore') #pygame warns on every font when it cannot list the system's fonts
+import pygame
+import new
+from deedfactory import DeedFactory
+
+#Median time of LoadProperties over a number of calls, with a new DeedFactory made for each call by make_factory (or the same one kept for every call if it is None)
+def timeLoads(no_of_calls, factory, make_factory=None):
+    times = []
+    for counter in range(no_of_calls):
+        if make_factory != None:
+            factory = make_factory()
+        new.deed_factory = factory
+        start = time.perf_counter()
+        new.LoadProperties("data/Property Values.txt")
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times)//2], factory
+
+if __name__ == '__main__':
+    no_of_calls = 10
+    if len(sys.argv) > 1:
+        no_of_calls = int(sys.argv[1])
+
+    pygame.init()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        new.LoadProperties("data/Property Values.txt") #Creates the fonts, which happens once per run of the game whichever way deeds are made
+        draw_time, factory = timeLoads(no_of_calls, None, lambda: DeedFactory(None))
+        timeLoads(1, DeedFactory(cache_dir)) #Fills the disk cache
+        reuse_time, factory = timeLoads(no_of_calls, factory)
+        cache_time, factory = timeLoads(no_of_calls, None, lambda: DeedFactory(cache_dir)) #As if the game had been started again
+        cache_size = sum(os.path.getsize(os.path.join(cache_dir, file_name)) for file_name in os.listdir(cache_dir))
+
+    print('Drawing every deed:           %.1f ms per LoadProperties' % (1000 * draw_time))
+    print('Deeds made by an earlier game: %.1f ms (%.0fx faster)' % (1000 * reuse_time, draw_time / reuse_time))
+    print('Deeds from the disk cache:     %.1f ms (%.0fx faster), cache %.1f MB' % (1000 * cache_time, draw_time / cache_time, cache_size / 1e6))
+    print(factory.getReport())
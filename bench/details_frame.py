@@ -0,0 +1,93 @@
+#Opens the property details screen on SDL's dummy video driver for a player owning every property on a board many times the size of the real one,
+#clicking a Mortgage button every so often, and reports the time per frame and how many rows of the table were drawn again
+#Run from anywhere with: python bench/details_frame.py [copies of the board] [number of frames] [frames between clicks]
+import os
+import sys
+import random
+import time
+import warnings
+import numpy as np
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+sys.path.insert(0, os.path.join(sys.path[0], 'bench'))
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from cls import Prop_Type
+from framesched import frame_scheduler
+from imgcache import text_cache
+from main_frame import createGuiGame
+from new import LoadProperties, createBoard
+import details
+
+#Used in place of pygame.time.Clock: does not wait, clicks the first row's Mortgage button every so often, and quits after a number of frames
+class Click_Clock:
+    def __init__(self, no_of_frames, click_every):
+        self.no_of_frames = no_of_frames
+        self.click_every = click_every
+        self.frames = 0
+
+    def tick(self, fps=0):
+        self.frames += 1
+        if self.frames % self.click_every == 0:
+            pygame.mouse.set_pos([660, details.TABLE_Y + 10])
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(660, details.TABLE_Y + 10), button=1))
+        if self.frames >= self.no_of_frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return 0
+
+#Game whose board is the real board repeated a number of times, with every property owned by the first player
+def createLargeGame(copies):
+    game = createGuiGame(['Player 1', 'Player 2'])
+    props = np.concatenate([LoadProperties("data/Property Values.txt") for counter in range(copies)])
+    game.board = createBoard("data/Board_Data.txt", props, game.board.PL_Deck, game.board.CC_Deck, "img/Board.png", 600)
+    for b_pos in range(game.board.max_pos + 1):
+        if game.board.getProp(b_pos).prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION):
+            game.board.buyProperty(b_pos, 0)
+    return game
+
+if __name__ == '__main__':
+    copies = 10
+    no_of_frames = 300
+    click_every = 10
+    if len(sys.argv) > 1:
+        copies = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        no_of_frames = int(sys.argv[2])
+    if len(sys.argv) > 3:
+        click_every = int(sys.argv[3])
+
+    random.seed(1)
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    game = createLargeGame(copies)
+    frame_scheduler.idle_timeout = 0 #Frames are driven by the script rather than real time, so never sleep between them
+    table = details.details_table
+
+    start = time.perf_counter()
+    details.PropDetails(game, screen, Click_Clock(1, click_every)) #Opening the screen makes the whole table
+    open_time = time.perf_counter() - start
+    rows = len(table.board_poses)
+
+    pygame.event.clear()
+    renders_before = table.row_renders
+    clock = Click_Clock(no_of_frames, click_every)
+    start = time.perf_counter()
+    details.PropDetails(game, screen, clock)
+    frame_time = (time.perf_counter() - start) / clock.frames
+    clicks = clock.frames // click_every
+
+    #What drawing every row again on every frame costs, as the screen did before the table was kept
+    start = time.perf_counter()
+    for row_num in range(rows):
+        table.drawRow(row_num, text_cache.getFont('Arial', 20), text_cache.getFont('Arial', 16))
+    all_rows_time = time.perf_counter() - start
+
+    print('Rows in the table:           ' + str(rows))
+    print('Opening the screen:          %.2f ms (makes the whole table)' % (open_time * 1000))
+    print('Time per frame:              %.3f ms over %d frames, %d of them after a click' % (frame_time * 1000, clock.frames, clicks))
+    print('Rows drawn per click:        %.1f' % ((table.row_renders - renders_before) / max(1, clicks)))
+    print('Drawing every row instead:   %.2f ms per frame' % (all_rows_time * 1000))
@@ -0,0 +1,64 @@
+#Times the main screen with every image kept in the pixel format it was loaded in, against every image converted to the display's format as it is loaded (see setDisplayFormat in assetbundle)
+#Reports the time per frame of MainScreen with scripted clicks (as bench/main_frame.py), and of a full redraw: the board, a title deed, a card, both dice and every piece blitted once
+#Each mode is a fresh process, as loaded images are kept for the rest of the process. Uses SDL's dummy video driver, so no window is opened. The asset bundle is not used
+#Run from anywhere with: python bench/display_format.py [number of frames]
+import os
+import sys
+import random
+import subprocess
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data and image files are opened with paths relative to the repository root
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from assetbundle import setDisplayFormat
+from dirtyrects import pixel_counter
+from framesched import frame_scheduler
+from main_frame import createGuiGame, Script_Clock
+import maingame
+
+#Median time to blit the images a full redraw of the main screen uses, over a number of redraws
+def timeRedraws(no_of_redraws, screen, game):
+    imgs = [[game.board.board_img, [0, 0]], [game.board.getProp(1).getTitleDeed(), [630, 80]], [game.board.PL_Deck.card_arr[0].card_img, [650, 450]]]
+    imgs += [[die.getImg([70, 70]), [40 + 80 * die_no, 620]] for die_no, die in enumerate([game.getDie(0), game.getDie(1)])]
+    imgs += [[player.player_piece.piece_img, [100 + 40 * player_no, 100]] for player_no, player in enumerate(game.players)]
+    times = []
+    for counter in range(no_of_redraws):
+        start = time.perf_counter()
+        for img, pos in imgs:
+            screen.blit(img, pos)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times)//2]
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--child': #One timed run, started by the parent below
+        random.seed(1)
+        pygame.init()
+        screen = pygame.display.set_mode([1024, 768])
+        if sys.argv[2] == 'display':
+            setDisplayFormat()
+        game = createGuiGame(['Player 1', 'Player 2', 'Player 3'])
+        redraw_time = timeRedraws(int(sys.argv[3]), screen, game)
+        clock = Script_Clock(int(sys.argv[3]), 10)
+        frame_scheduler.idle_timeout = 0 #Frames are driven by the script rather than real time, so never sleep between them
+        start = time.perf_counter()
+        maingame.MainScreen(game, screen, clock)
+        print('%f %f' % ((time.perf_counter() - start) / pixel_counter.frames, redraw_time))
+        sys.exit(0)
+
+    no_of_frames = 300
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+
+    results = {}
+    for mode in ['loaded', 'display']:
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, str(no_of_frames)], check=True, capture_output=True, text=True).stdout.split()
+        results[mode] = [float(value) for value in output]
+    print('Images as loaded:             %.3f ms per main screen frame, %.2f ms per full redraw' % (1000 * results['loaded'][0], 1000 * results['loaded'][1]))
+    print('Images in the display format: %.3f ms per main screen frame (%.1fx faster), %.2f ms per full redraw (%.1fx faster)' % (1000 * results['display'][0], results['loaded'][0] / results['display'][0], 1000 * results['display'][1], results['loaded'][1] / results['display'][1]))
@@ -0,0 +1,42 @@
+#Throughput benchmark for the headless Turn_Engine
+#Run from anywhere with: python bench/engine_throughput.py [number of games] [number of players]
+import os
+import sys
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Turn_Engine
+from new import createHeadlessGame
+
+def runGames(no_of_games, no_of_players):
+    names = ['Player ' + str(counter+1) for counter in range(no_of_players)]
+    total_turns = 0
+    ends = {'won': 0, 'stalemate': 0, 'turn_limit': 0} #How many games ended each way (see Turn_Engine.getEndReason)
+
+    start = time.perf_counter()
+    for counter in range(no_of_games):
+        engine = Turn_Engine(createHeadlessGame(names))
+        engine.playUntilDone()
+        ends[engine.getEndReason()] += 1
+        total_turns += engine.turns_played
+    elapsed = time.perf_counter() - start
+    return elapsed, total_turns, ends
+
+if __name__ == '__main__':
+    no_of_games = 200
+    no_of_players = 4
+    if len(sys.argv) > 1:
+        no_of_games = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        no_of_players = int(sys.argv[2])
+
+    elapsed, total_turns, ends = runGames(no_of_games, no_of_players)
+    print('Games played:   ' + str(no_of_games) + ' (' + str(no_of_players) + ' players)')
+    print('Games ended:    %d won, %d stalemates, %d at the turn limit' % (ends['won'], ends['stalemate'], ends['turn_limit']))
+    print('Turns played:   ' + str(total_turns))
+    print('Time taken:     %.3f s' % elapsed)
+    print('Games/sec:      %.1f (%.0f per minute on one core)' % (no_of_games / elapsed, 60 * no_of_games / elapsed))
+    print('Turns/sec:      %.1f' % (total_turns / elapsed))
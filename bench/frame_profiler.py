@@ -0,0 +1,57 @@
+#Plays the same scripted MainScreen game as main_frame.py with the frame profiler off, recording, and showing its overlay, to check what it costs
+#Run from anywhere with: python bench/frame_profiler.py [number of frames] [file to dump the recorded spans to (.json or .csv)]
+import os
+import sys
+import random
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+sys.path.insert(0, os.path.join(sys.path[0], 'bench'))
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from framesched import frame_scheduler
+from frameprof import frame_profiler
+from main_frame import createGuiGame, Script_Clock
+import maingame
+
+#Time per frame (ms) of a scripted game, with the same seed each time so every run plays the same moves
+def timeFrames(screen, no_of_frames):
+    random.seed(1)
+    game = createGuiGame(['Player 1', 'Player 2', 'Player 3'])
+    pygame.event.clear()
+    clock = Script_Clock(no_of_frames, 10)
+    start = time.perf_counter()
+    maingame.MainScreen(game, screen, clock)
+    return (time.perf_counter() - start) / clock.frames * 1000
+
+if __name__ == '__main__':
+    no_of_frames = 500
+    dump_path = None
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        dump_path = sys.argv[2]
+
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    frame_scheduler.idle_timeout = 0 #Frames are driven by the script rather than real time, so never sleep between them
+    timeFrames(screen, 50) #Warm the image and text caches, so the first run is not slower for the wrong reasons
+
+    off_ms = timeFrames(screen, no_of_frames)
+    frame_profiler.setDumpPath(dump_path or 'unused.json') #Recording without the overlay
+    recording_ms = timeFrames(screen, no_of_frames)
+    frame_profiler.toggleOverlay()
+    overlay_ms = timeFrames(screen, no_of_frames)
+
+    print('Profiler off:      %.3f ms per frame' % off_ms)
+    print('Recording:         %.3f ms per frame (%+.3f ms)' % (recording_ms, recording_ms - off_ms))
+    print('Showing overlay:   %.3f ms per frame (%+.3f ms)' % (overlay_ms, overlay_ms - off_ms))
+    print(frame_profiler.getReport())
+    if dump_path != None:
+        frame_profiler.dump(dump_path)
+        print('Spans written to ' + dump_path)
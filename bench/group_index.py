@@ -0,0 +1,71 @@
+#Micro-benchmark comparing the original whole-board colour group scans with the Board's group index
+#Run from anywhere with: python bench/group_index.py [number of repeats]
+import os
+import sys
+import random
+import timeit
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Prop_Type
+from new import createHeadlessGame
+
+#The scans that Board.wholeGroupOwned and Board.countGroupSize used to do, kept here for comparison
+def scanWholeGroupOwned(board, player_num, prop_num):
+    if board.getProp(prop_num).prop_type != Prop_Type.NORMAL:
+        return False
+    find_col = board.getProp(prop_num).group_col
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type == Prop_Type.NORMAL:
+            if board.getProp(counter).group_col == find_col and board.getProp(counter).prop_owner != player_num:
+                return False
+    return True
+
+def scanCountGroupSize(board, player_num, prop_num):
+    if board.getProp(prop_num).prop_type != Prop_Type.NORMAL:
+        return 0
+    group_count = 0
+    find_col = board.getProp(prop_num).group_col
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type == Prop_Type.NORMAL:
+            if board.getProp(counter).group_col == find_col and board.getProp(counter).prop_owner == player_num:
+                group_count += 1
+    return group_count
+
+#Board where every ownable property has been given to a random player (or left unowned)
+def createRandomBoard(no_of_players, seed):
+    rand = random.Random(seed)
+    board = createHeadlessGame(['Player ' + str(counter+1) for counter in range(no_of_players)]).board
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION):
+            owner = rand.randrange(-1, no_of_players)
+            if owner != -1:
+                board.buyProperty(counter, owner)
+    return board
+
+if __name__ == '__main__':
+    repeats = 200
+    if len(sys.argv) > 1:
+        repeats = int(sys.argv[1])
+
+    board = createRandomBoard(4, 1)
+    for player_num in range(4): #Index must give the same answers as the scans
+        for counter in range(board.max_pos + 1):
+            assert scanWholeGroupOwned(board, player_num, counter) == board.wholeGroupOwned(player_num, counter)
+            assert scanCountGroupSize(board, player_num, counter) == board.countGroupSize(player_num, counter)
+
+    def allQueries(whole_func, count_func):
+        for player_num in range(4):
+            for counter in range(board.max_pos + 1):
+                whole_func(board, player_num, counter)
+                count_func(board, player_num, counter)
+
+    queries = 2 * 4 * (board.max_pos + 1) * repeats
+    scan_time = timeit.timeit(lambda: allQueries(scanWholeGroupOwned, scanCountGroupSize), number=repeats)
+    index_time = timeit.timeit(lambda: allQueries(lambda b, p, n: b.wholeGroupOwned(p, n), lambda b, p, n: b.countGroupSize(p, n)), number=repeats)
+    print('Queries:        ' + str(queries))
+    print('Board scans:    %.3f s (%.2f us/query)' % (scan_time, scan_time / queries * 1e6))
+    print('Group index:    %.3f s (%.2f us/query)' % (index_time, index_time / queries * 1e6))
+    print('Speed-up:       %.1fx' % (scan_time / index_time))
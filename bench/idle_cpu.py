@@ -0,0 +1,63 @@
+#Leaves each of the in-game screens open with nobody doing anything, in real time on SDL's dummy video driver, and reports how much CPU they use
+#Run from anywhere with: python bench/idle_cpu.py [seconds per screen]
+import os
+import sys
+import random
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+sys.path.insert(0, os.path.join(sys.path[0], 'bench'))
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from framesched import frame_scheduler, IDLE_CPU_TARGET
+from main_frame import createGuiGame
+import maingame
+import details
+import leaderboard
+
+#Real clock that quits the screen after a number of seconds
+#Time is measured from the end of the first frame, so that setting up the screen is not counted as being idle
+class Timed_Clock:
+    def __init__(self, seconds):
+        self.clock = pygame.time.Clock()
+        self.seconds = seconds
+        self.wall_start = None
+        self.cpu_start = None
+
+    def tick(self, fps=0):
+        ret_time = self.clock.tick(fps)
+        if self.wall_start == None:
+            self.wall_start = time.perf_counter()
+            self.cpu_start = time.process_time()
+        elif time.perf_counter() - self.wall_start >= self.seconds:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return ret_time
+
+if __name__ == '__main__':
+    seconds = 5
+    if len(sys.argv) > 1:
+        seconds = float(sys.argv[1])
+
+    random.seed(1)
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    game = createGuiGame(['Player 1', 'Player 2'])
+
+    frame_scheduler.idle_timeout = 250 #Wake up often enough to notice the end of the run
+    for name, screen_func in [('MainScreen', maingame.MainScreen), ('PropDetails', details.PropDetails), ('Leaderboards', leaderboard.Leaderboards)]:
+        pygame.event.clear()
+        frames_before = frame_scheduler.frames
+        waits_before = frame_scheduler.waits
+        clock = Timed_Clock(seconds)
+        screen_func(game, screen, clock)
+        cpu_percent = 100 * (time.process_time() - clock.cpu_start) / (time.perf_counter() - clock.wall_start)
+        if cpu_percent <= IDLE_CPU_TARGET:
+            target_str = 'within'
+        else:
+            target_str = 'ABOVE'
+        print('%-13s %5.2f%% CPU over %.1f s (%s the %.1f%% target), %d frames drawn, %d slept until an event' % (name, cpu_percent, time.perf_counter() - clock.wall_start, target_str, IDLE_CPU_TARGET, frame_scheduler.frames - frames_before, frame_scheduler.waits - waits_before))
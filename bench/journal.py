@@ -0,0 +1,76 @@
+#Compares the cost of adding one event to a game's turn journal with writing a full save, and times loading a save with a journal to play back
+#A game is played by the Turn_Engine with autosave on, so every roll, move, rent payment etc. is added to the journal as it happens
+#Run from anywhere with: python bench/journal.py [turns]
+import os
+import sys
+import random
+import tempfile
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Turn_Engine
+from new import createHeadlessGame
+from savefile import TurnJournal, loadSave, readSave, save_writer
+
+if __name__ == '__main__':
+    no_of_turns = 1000
+    if len(sys.argv) > 1:
+        no_of_turns = int(sys.argv[1])
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        save_path = os.path.join(save_dir, 'game.dfo')
+        random.seed(1)
+        game = createHeadlessGame(['Player 1', 'Player 2', 'Player 3', 'Player 4'])
+        game.save_path = save_path
+        game.autosave = True
+        game.saveGame()
+
+        #Time every journal append made while the game is played
+        append_times = []
+        real_append = TurnJournal.append
+        def timedAppend(journal, *args):
+            start = time.perf_counter()
+            seq = real_append(journal, *args)
+            append_times.append(time.perf_counter() - start)
+            return seq
+        TurnJournal.append = timedAppend
+
+        engine = Turn_Engine(game, new_max_turns=no_of_turns)
+        engine.playUntilDone()
+        save_writer.flush()
+        TurnJournal.append = real_append
+        if loadSave(save_path) != game.getSaveRows():
+            raise Exception('Save file and journal do not load back the game')
+
+        #Full saves, as written by autosave and the pause menu
+        start = time.perf_counter()
+        for counter in range(100):
+            game.saveGame()
+        save_time = (time.perf_counter() - start) / 100
+
+        #Loading a save with a long journal tail to play back: leave the save at the start of a game and journal a whole game on top of it
+        random.seed(2)
+        tail_game = createHeadlessGame(['Player 1', 'Player 2', 'Player 3', 'Player 4'])
+        tail_game.save_path = os.path.join(save_dir, 'tail.dfo')
+        tail_game.autosave = True
+        tail_game.saveGame()
+        tail_game.autosaveGame = lambda: None #No saves, so every event stays in the journal
+        Turn_Engine(tail_game, new_max_turns=no_of_turns).playUntilDone()
+        start = time.perf_counter()
+        readSave(tail_game.save_path)
+        plain_load = time.perf_counter() - start
+        start = time.perf_counter()
+        tail_rows = loadSave(tail_game.save_path)
+        journal_load = time.perf_counter() - start
+        if tail_rows != tail_game.getSaveRows():
+            raise Exception('Journal tail does not play back to the game')
+
+    append_times.sort()
+    print('Turns: %d, journal events: %d (%.1f per turn)' % (engine.turns_played, len(append_times), len(append_times) / max(engine.turns_played, 1)))
+    print('Journal append:  mean %.1f us, p99 %.1f us' % (1e6 * sum(append_times) / len(append_times), 1e6 * append_times[int(len(append_times) * 0.99)]))
+    print('Full save:       %.1f us (%.0fx an append)' % (1e6 * save_time, save_time / (sum(append_times) / len(append_times))))
+    print('Load:            %.2f ms for the save alone, %.2f ms with %d journal events played back' % (1000 * plain_load, 1000 * journal_load, tail_game.journal.seq))
+    print(save_writer.getReport())
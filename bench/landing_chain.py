@@ -0,0 +1,65 @@
+#Builds the Markov chain of landing probabilities, times it, and checks it against the same rules being played turn by turn through Game.rollDice
+#Prints the expected rent per turn for every property at every rent level
+#Run from anywhere with: python bench/landing_chain.py [number of turns to play]
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+import numpy as np
+from cls import Landing_Chain, Prop_Type
+from new import createHeadlessGame
+
+#Play turns for one player, who never leaves Bogside early, counting where each turn ends (and whether in Bogside)
+def playTurns(game, no_of_turns):
+    squares = game.board.max_pos + 1
+    counts = np.zeros(2 * squares)
+    player = game.getCurPlayer()
+    for counter in range(no_of_turns):
+        game.controller.reset()
+        while game.controller.player_rolled == False:
+            game.rollDice()
+            game.useCard()
+        player.player_nextRollMod = 1 #Roll-changing cards are not part of the chain
+        player.player_pos = player.player_pos % squares #Moving back past the Job Centre leaves a negative position
+        counts[player.player_pos + squares * int(player.player_inJail)] += 1
+    return counts / no_of_turns
+
+if __name__ == '__main__':
+    no_of_turns = 200000
+    if len(sys.argv) > 1:
+        no_of_turns = int(sys.argv[1])
+
+    random.seed(7)
+    game = createHeadlessGame(['Player 1', 'Player 2'])
+    board = game.board
+
+    start = time.perf_counter()
+    chain = Landing_Chain(board)
+    expected_rents = chain.getExpectedRents()
+    chain_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    played = playTurns(game, no_of_turns)
+    play_time = time.perf_counter() - start
+    difference = 0.5 * np.abs(played - chain.state_probs).sum() #Total variation distance between the two distributions
+
+    print('%-28s %7s %7s  %s' % ('Square', 'Land %', 'Stay %', 'Expected rent per turn at each level'))
+    for counter in range(board.max_pos + 1):
+        prop = board.getProp(counter)
+        levels = 0
+        if prop.prop_type == Prop_Type.NORMAL:
+            levels = 6
+        elif prop.prop_type == Prop_Type.SCHOOL:
+            levels = 4
+        elif prop.prop_type == Prop_Type.STATION:
+            levels = 2
+        print('%-28s %7.3f %7.3f  %s' % (prop.prop_title.strip(), 100 * chain.landing_rates[counter], 100 * chain.end_probs[counter], ' '.join('%7.2f' % rent for rent in expected_rents[counter][:levels])))
+    print()
+    print('Chain built and solved in:   %.2f ms' % (chain_time * 1000))
+    print('Turns played for checking:   %d in %.2f s' % (no_of_turns, play_time))
+    print('Total variation distance:    %.4f between the chain and the played turns' % difference)
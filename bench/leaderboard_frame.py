@@ -0,0 +1,71 @@
+#Leaves the leaderboards screen open on SDL's dummy video driver, reporting the time per frame and how often the table is worked out and its texts rendered
+#The screen is opened again after a turn has been played, to check that the table is only worked out again once the game has changed
+#Run from anywhere with: python bench/leaderboard_frame.py [number of frames]
+import os
+import sys
+import random
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+sys.path.insert(0, os.path.join(sys.path[0], 'bench'))
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from cls import Turn_Engine
+from framesched import frame_scheduler
+from imgcache import text_cache
+from main_frame import createGuiGame
+import leaderboard
+
+#Used in place of pygame.time.Clock: does not wait, and quits after a number of frames
+#Texts rendered are counted from the second frame on, as the first frame of a newly opened screen is allowed to render
+class Idle_Clock:
+    def __init__(self, no_of_frames):
+        self.no_of_frames = no_of_frames
+        self.frames = 0
+        self.text_renders = 0
+
+    def tick(self, fps=0):
+        self.frames += 1
+        if self.frames > 1:
+            self.text_renders += text_cache.last_frame_renders
+        if self.frames >= self.no_of_frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return 0
+
+#Open the leaderboards for a number of frames, returning the time per frame (ms), texts rendered after the first frame, and times the table was worked out
+def openLeaderboards(game, screen, no_of_frames):
+    builds_before = leaderboard.leaderboard_cache.builds
+    pygame.event.clear()
+    clock = Idle_Clock(no_of_frames)
+    start = time.perf_counter()
+    leaderboard.Leaderboards(game, screen, clock)
+    return (time.perf_counter() - start) / clock.frames * 1000, clock.text_renders, leaderboard.leaderboard_cache.builds - builds_before
+
+if __name__ == '__main__':
+    no_of_frames = 500
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+
+    random.seed(1)
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    game = createGuiGame(['Player 1', 'Player 2', 'Player 3', 'Player 4', 'Player 5', 'Player 6'])
+    engine = Turn_Engine(game, new_max_turns=100) #Part of the way through a game, so the table has something in it
+    engine.playUntilDone()
+    frame_scheduler.idle_timeout = 0 #Frames are driven by the script rather than real time, so never sleep between them
+
+    print('%-34s %10s %14s %12s' % ('', 'ms/frame', 'Text renders', 'Table builds'))
+    for label in ['First opened', 'Opened again, game unchanged']:
+        frame_ms, text_renders, builds = openLeaderboards(game, screen, no_of_frames)
+        print('%-34s %10.3f %14d %12d' % (label, frame_ms, text_renders, builds))
+
+    version_before = game.state_version
+    engine.max_turns += 1
+    engine.step() #One more turn changes the game
+    frame_ms, text_renders, builds = openLeaderboards(game, screen, no_of_frames)
+    print('%-34s %10.3f %14d %12d' % ('Opened after a turn (version +%d)' % (game.state_version - version_before), frame_ms, text_renders, builds))
@@ -0,0 +1,94 @@
+#Compares sorting the leaderboards with getSortOrder against the recursive quickSort it replaced, for far more players than a real game has
+#(simulation reports rank thousands of simulated players), checking that both put the sorted column in the same order
+#Run from anywhere with: python bench/leaderboard_sort.py [largest number of players]
+import os
+import sys
+import time
+from copy import copy
+import numpy as np
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so leaderboard can be imported
+os.chdir(sys.path[0])
+
+from leaderboard import getSortOrder
+
+QUICKSORT_LIMIT = 6000 #The old quickSort is too slow to be worth timing beyond this many players
+
+#The quickSort that leaderboard.py used to sort with, kept here for comparison. Sorts sort_arr in place, swapping copies of its rows
+def quickSort(sort_arr, first, last, sort_col, asc):
+    low = first
+    high = last
+    midValue = sort_arr[int((first+last)/2)][sort_col]
+
+    while low <= high:
+        if asc:
+            while sort_arr[low][sort_col] < midValue:
+                low += 1
+            while sort_arr[high][sort_col] > midValue:
+                high -= 1
+        else:
+            while sort_arr[low][sort_col] > midValue:
+                low += 1
+            while sort_arr[high][sort_col] < midValue:
+                high -= 1
+
+        if low <= high:
+            sort_arr[low], sort_arr[high] = copy(sort_arr[high]), copy(sort_arr[low])
+            low += 1
+            high -= 1
+
+    if first < high:
+        sort_arr = quickSort(sort_arr, first, high, sort_col, asc)
+    if low < last:
+        sort_arr = quickSort(sort_arr, low, last, sort_col, asc)
+    return sort_arr
+
+#Leaderboards array of random (but seeded) values for a number of players, laid out as setup2DArray makes it
+#Money is rounded to the nearest £10 so that there are plenty of ties to break
+def createLeadArr(rand, no_of_players):
+    lead_arr = np.zeros((no_of_players, 4), int)
+    lead_arr[:,0] = np.arange(no_of_players)
+    lead_arr[:,1] = rand.integers(-50, 300, no_of_players) * 10
+    lead_arr[:,2] = lead_arr[:,1] + rand.integers(0, 500, no_of_players) * 10
+    lead_arr[:,3] = lead_arr[:,1] + (lead_arr[:,2] - lead_arr[:,1]) // 2
+    return lead_arr
+
+#Seconds taken by func on average, running it for at least a tenth of a second
+def timeFunc(func):
+    calls = 0
+    start = time.perf_counter()
+    while calls == 0 or time.perf_counter() - start < 0.1:
+        func()
+        calls += 1
+    return (time.perf_counter() - start) / calls
+
+if __name__ == '__main__':
+    max_players = 100000
+    if len(sys.argv) > 1:
+        max_players = int(sys.argv[1])
+
+    rand = np.random.default_rng(23)
+    sys.setrecursionlimit(10000)
+    print('%-8s %16s %18s %8s' % ('Players', 'quickSort (ms)', 'getSortOrder (ms)', 'Speedup'))
+    no_of_players = 6
+    while no_of_players <= max_players:
+        lead_arr = createLeadArr(rand, no_of_players)
+        for sort_col in range(1, 4):
+            for asc in (False, True):
+                order = getSortOrder(lead_arr, sort_col, asc)
+                if no_of_players <= QUICKSORT_LIMIT:
+                    assert np.array_equal(lead_arr[order, sort_col], quickSort(lead_arr.copy(), 0, no_of_players-1, sort_col, asc)[:, sort_col]), 'Column ' + str(sort_col) + ' sorted differently'
+                for row_num in range(1, no_of_players): #Ties are broken by the other money columns, largest first, then by player number
+                    prev, cur = lead_arr[order[row_num-1]], lead_arr[order[row_num]]
+                    if prev[sort_col] == cur[sort_col]:
+                        tie_cols = [col for col in (1, 2, 3) if col != sort_col]
+                        assert (-prev[tie_cols[0]], -prev[tie_cols[1]], prev[0]) < (-cur[tie_cols[0]], -cur[tie_cols[1]], cur[0]), 'Tie broken wrongly'
+
+        new_time = timeFunc(lambda: [getSortOrder(lead_arr, sort_col, asc) for sort_col in range(1, 4) for asc in (False, True)]) / 6
+        if no_of_players <= QUICKSORT_LIMIT:
+            old_time = timeFunc(lambda: [quickSort(lead_arr.copy(), 0, no_of_players-1, sort_col, asc) for sort_col in range(1, 4) for asc in (False, True)]) / 6
+            print('%-8d %16.3f %18.3f %7.1fx' % (no_of_players, old_time * 1000, new_time * 1000, old_time / new_time))
+        else:
+            print('%-8d %16s %18.3f %8s' % (no_of_players, '-', new_time * 1000, '-'))
+        no_of_players *= 10
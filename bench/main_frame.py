@@ -0,0 +1,82 @@
+#Plays MainScreen on SDL's dummy video driver with scripted clicks, reporting the time per frame and how many pixels are sent to the display
+#Run from anywhere with: python bench/main_frame.py [number of frames] [frames between clicks]
+import os
+import sys
+import random
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from dirtyrects import pixel_counter
+from framesched import frame_scheduler
+from imgcache import text_cache
+from new import createPlayers, LoadProperties, createDeck, createBoard, createGame
+import maingame
+
+#Stands in for the name text boxes of the New Game screen
+class Name_Box:
+    def __init__(self, name):
+        self.name = name
+
+    def getContents(self):
+        return self.name
+
+#Create a game with all images, title deeds and fonts, as the New Game screen does
+def createGuiGame(player_names):
+    boxes = [Name_Box(name) for name in player_names] + [Name_Box('')] * (6 - len(player_names))
+    players = createPlayers(boxes, 600, "data/Player_Data.txt")
+    props = LoadProperties("data/Property Values.txt")
+    Pot_Luck_Deck = createDeck("Pot Luck", "img/PL/Pot Luck ", "data/Card_Texts.txt", "data/PL Master.txt", 16)
+    Council_Chest_Deck = createDeck("Council Chest", "img/CC/Council Chest ", "data/Card_Texts.txt", "data/CC Master.txt", 16)
+    board = createBoard("data/Board_Data.txt", props, Pot_Luck_Deck, Council_Chest_Deck, "img/Board.png", 600)
+    return createGame(players, board, None, "img/Dice/", False)
+
+#Used in place of pygame.time.Clock: does not wait, clicks the Roll Dice/End Turn button every so often, and quits after a number of frames
+class Script_Clock:
+    def __init__(self, no_of_frames, click_every):
+        self.no_of_frames = no_of_frames
+        self.click_every = click_every
+        self.frames = 0
+        self.text_renders = 0
+
+    def tick(self, fps=0):
+        self.frames += 1
+        self.text_renders += text_cache.last_frame_renders
+        if self.frames % self.click_every == 0:
+            pygame.mouse.set_pos([200, 640])
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(200, 640), button=1))
+        if self.frames >= self.no_of_frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return 0
+
+if __name__ == '__main__':
+    no_of_frames = 500
+    click_every = 10
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        click_every = int(sys.argv[2])
+
+    random.seed(1)
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    game = createGuiGame(['Player 1', 'Player 2', 'Player 3'])
+    clock = Script_Clock(no_of_frames, click_every)
+    frame_scheduler.idle_timeout = 0 #Frames are driven by the script rather than real time, so never sleep between them
+
+    start = time.perf_counter()
+    maingame.MainScreen(game, screen, clock)
+    elapsed = time.perf_counter() - start
+
+    full_pixels = screen.get_width() * screen.get_height()
+    print('Frames:                   ' + str(pixel_counter.frames))
+    print('Time per frame:           %.3f ms' % (elapsed / pixel_counter.frames * 1000))
+    print('Pixels pushed per frame:  %.0f (%.1f%% of a full flip)' % (pixel_counter.pixels_pushed / pixel_counter.frames, 100 * pixel_counter.pixels_pushed / (pixel_counter.frames * full_pixels)))
+    print('Pixels pushed per second: %.0f at 10 fps, against %d for full flips' % (10 * pixel_counter.pixels_pushed / pixel_counter.frames, 10 * full_pixels))
+    print('Texts rendered per frame: %.2f' % (clock.text_renders / pixel_counter.frames))
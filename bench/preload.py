@@ -0,0 +1,62 @@
+#Times how long pressing Create on the New Game screen takes to make the board and decks, building them there and then against picking up the ones preloaded during the loading screen
+#Also times the loading screen's frames while the preload runs, to check the screen keeps animating. Images are loaded from their files, not the asset bundle
+#Each run is a fresh process, as preloaded images are kept for the rest of the process. Uses SDL's dummy video driver, so no window is opened
+#Run from anywhere with: python bench/preload.py [runs of each]
+import os
+import sys
+import subprocess
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data and image files are opened with paths relative to the repository root
+
+import warnings
+warnings.simplefilter('ignore') #pygame warns on every font when it cannot list the system's fonts
+import pygame
+from bgload import background_loader
+from imgcache import text_cache
+from new import preloadGame, getGameBoard
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--child': #One timed run, started by the parent below
+        pygame.init()
+        screen = pygame.display.set_mode([936, 360])
+        tip_font = text_cache.getFont('Arial', 24)
+        frame_times = [0]
+        if sys.argv[2] == 'preload':
+            preloadGame(background_loader)
+            start = time.perf_counter()
+            while not background_loader.isDone(): #Loading screen frames: coins move on every 100 ms, and the progress bar is drawn
+                frame_start = time.perf_counter()
+                screen.fill((0, 0, 0))
+                screen.blit(text_cache.render(tip_font, 'Top Tip:', True, (255, 255, 255)), [400, 150])
+                pygame.draw.rect(screen, (255, 255, 255), pygame.Rect(20, 350, int(896 * background_loader.getProgress()), 4))
+                pygame.display.flip()
+                frame_times.append(time.perf_counter() - frame_start)
+                time.sleep(max(0, 0.1 - (time.perf_counter() - frame_start)))
+            load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        game_board, game_rng = getGameBoard() #As when Create is pressed
+        create_time = time.perf_counter() - start
+        if sys.argv[2] != 'preload':
+            load_time = create_time
+        print('%f %f %f %d' % (create_time, load_time, max(frame_times), len(frame_times) - 1))
+        sys.exit(0)
+
+    no_of_runs = 5
+    if len(sys.argv) > 1:
+        no_of_runs = int(sys.argv[1])
+
+    for mode in ['create', 'preload']:
+        results = []
+        for counter in range(no_of_runs):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode], check=True, capture_output=True, text=True).stdout.split()
+            results.append([float(value) for value in output])
+        results.sort()
+        create_time, load_time, worst_frame, no_of_frames = results[len(results)//2] #Run with the median time on pressing Create
+        if mode == 'create':
+            print('Built when Create is pressed:  %.1f ms on pressing Create' % (1000 * create_time))
+        else:
+            print('Preloaded by the loading screen: %.1f ms on pressing Create, %.0f ms of loading in the background, %d loading screen frames (slowest %.1f ms)' % (1000 * create_time, 1000 * load_time, no_of_frames, 1000 * worst_frame))
@@ -0,0 +1,120 @@
+#Checks that school and station rents, and whole colour group ownership, worked out from the Board's ownership counts are identical to those
+#from the original board scans over many randomised ownership states, then times both rents
+#Every count is also checked against a full board scan after each buy, release and mortgage (and each bankruptcy in some headless games) using Board.debug_checks
+#Exits with an AssertionError (so a non-zero status) at the first mismatch
+#Run from anywhere with: python bench/rent_counts.py [number of random boards] [number of games]
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Prop_Type, Turn_Engine
+from new import createHeadlessGame
+
+#The rents that School_Property.getRent and Station_Property.getRent used to work out by scanning the board, kept here for comparison
+def scanRent(board, b_pos, dice_roll):
+    prop = board.getProp(b_pos)
+    if prop.mortgage_status:
+        return 0
+    rent_count = 0
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type == prop.prop_type and board.getProp(counter).prop_owner == prop.prop_owner:
+            rent_count += 1
+    if prop.prop_type == Prop_Type.SCHOOL:
+        return prop.rent_vals[rent_count-1]
+    return prop.rent_mods[rent_count-1] * dice_roll
+
+#Whether a player owns every property of a colour, worked out by scanning the board as Board.wholeGroupOwned used to
+def scanWholeGroup(board, player_num, b_pos):
+    if board.getProp(b_pos).prop_type != Prop_Type.NORMAL:
+        return False
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type == Prop_Type.NORMAL and board.getProp(counter).group_col == board.getProp(b_pos).group_col:
+            if board.getProp(counter).prop_owner != player_num:
+                return False
+    return True
+
+def scanTypeOwned(board, prop_type, player_num):
+    return len([counter for counter in range(board.max_pos + 1) if board.getProp(counter).prop_type == prop_type and board.getProp(counter).prop_owner == player_num])
+
+def countedRent(board, b_pos, dice_roll):
+    prop = board.getProp(b_pos)
+    if prop.prop_type == Prop_Type.SCHOOL:
+        return prop.getRent(board, prop.prop_owner)
+    return prop.getRent(board, prop.prop_owner, dice_roll)
+
+#Give every property to a random player (or nobody), then randomly mortgage or release some of them
+#Colour groups are often given to one player whole, so that wholeGroupOwned is true for some of them
+def randomiseOwnership(board, rand, no_of_players):
+    group_owners = [rand.randrange(-1, no_of_players) for group in board.groups]
+    for counter in range(board.max_pos + 1):
+        if board.getProp(counter).prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION):
+            board.releaseProperty(counter)
+            owner = rand.randrange(-1, no_of_players)
+            if board.group_ids[counter] != -1 and rand.random() < 0.7:
+                owner = group_owners[board.group_ids[counter]]
+            if owner != -1:
+                board.buyProperty(counter, owner)
+                if rand.random() < 0.2:
+                    board.setMortgage(counter, True)
+                if rand.random() < 0.1: #Released again, as happens on bankruptcy
+                    board.releaseProperty(counter)
+
+#Check every count against a board scan
+def checkCounts(board, no_of_players):
+    for player_num in range(no_of_players):
+        for prop_type in (Prop_Type.SCHOOL, Prop_Type.STATION):
+            assert board.countTypeOwned(prop_type, player_num) == scanTypeOwned(board, prop_type, player_num), prop_type.name + ' count differs for player ' + str(player_num)
+        for counter in range(board.max_pos + 1):
+            assert board.wholeGroupOwned(player_num, counter) == scanWholeGroup(board, player_num, counter), 'Whole group ownership differs at position ' + str(counter) + ' for player ' + str(player_num)
+
+if __name__ == '__main__':
+    no_of_boards = 2000
+    no_of_games = 20
+    if len(sys.argv) > 1:
+        no_of_boards = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        no_of_games = int(sys.argv[2])
+
+    rand = random.Random(4)
+    board = createHeadlessGame(['Player ' + str(counter+1) for counter in range(6)]).board
+    board.debug_checks = True #Counts and portfolios are checked against a board scan after every change
+    special_poses = [counter for counter in range(board.max_pos + 1) if board.getProp(counter).prop_type in (Prop_Type.SCHOOL, Prop_Type.STATION)]
+
+    checked = 0
+    scan_time = 0
+    count_time = 0
+    for counter in range(no_of_boards):
+        randomiseOwnership(board, rand, 6)
+        checkCounts(board, 6)
+        dice_roll = rand.randint(2, 12)
+        for b_pos in special_poses:
+            if board.getProp(b_pos).prop_owner == -1:
+                continue
+            start = time.perf_counter()
+            old_rent = scanRent(board, b_pos, dice_roll)
+            scan_time += time.perf_counter() - start
+            start = time.perf_counter()
+            new_rent = countedRent(board, b_pos, dice_roll)
+            count_time += time.perf_counter() - start
+            assert old_rent == new_rent, 'Rent differs at position ' + str(b_pos)
+            checked += 1
+
+    #Games played by the Turn_Engine, so counts are also checked through upgrades and bankruptcies
+    bankruptcies = 0
+    for counter in range(no_of_games):
+        random.seed(counter)
+        engine = Turn_Engine(createHeadlessGame(['Player ' + str(p_count+1) for p_count in range(4)]), new_max_turns=500)
+        engine.game.board.debug_checks = True
+        engine.playUntilDone()
+        checkCounts(engine.game.board, 4)
+        bankruptcies += len(engine.bankrupt_order)
+
+    print('Boards checked: ' + str(no_of_boards) + ' random boards and ' + str(no_of_games) + ' games (' + str(bankruptcies) + ' bankruptcies), all counts match board scans')
+    print('Rents checked:  ' + str(checked) + ' (all identical)')
+    print('Board scans:    %.2f us/rent' % (scan_time / checked * 1e6))
+    print('Counts:         %.2f us/rent' % (count_time / checked * 1e6))
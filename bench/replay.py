@@ -0,0 +1,35 @@
+#Records seeded headless games, then plays each one back from its replay, comparing the time taken and checking every replay ends in the recorded state
+#Run from anywhere with: python bench/replay.py [number of games] [turns per game]
+import os
+import sys
+import json
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from replay import recordGame, playReplay
+
+if __name__ == '__main__':
+    no_of_games = 20
+    max_turns = 1000
+    if len(sys.argv) > 1:
+        no_of_games = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        max_turns = int(sys.argv[2])
+
+    start = time.perf_counter()
+    replays = [recordGame(seed, 4, "data/Property Values.txt", max_turns) for seed in range(no_of_games)]
+    record_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for replay in replays:
+        playReplay(json.loads(json.dumps(replay))) #Through JSON, as if read from a file
+    play_time = time.perf_counter() - start
+
+    no_of_actions = sum(len(replay['actions']) for replay in replays)
+    no_of_turns = sum(replay['turns'] for replay in replays)
+    print('Games: %d, %d turns, %d actions, %.0f bytes of JSON per game' % (no_of_games, no_of_turns, no_of_actions, sum(len(json.dumps(replay, separators=(',', ':'))) for replay in replays) / no_of_games))
+    print('Recording (Turn_Engine making decisions): %.2f s, %.0f turns/sec' % (record_time, no_of_turns / record_time))
+    print('Replaying (no decisions):                 %.2f s, %.0f turns/sec, all final states match' % (play_time, no_of_turns / play_time))
@@ -0,0 +1,83 @@
+#Times saving and loading games in the text (.dfo) and binary (.dfb) save formats, checking that both load back exactly what was saved
+#Games are played part of the way through by the Turn_Engine so that their saves contain owned, upgraded and mortgaged properties
+#Run from anywhere with: python bench/save_load.py [number of games] [turns played in each game]
+import os
+import sys
+import random
+import tempfile
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+from cls import Turn_Engine
+from new import createHeadlessGame
+from savefile import readSave, convertSave, formatText, parseText, packBinary, unpackBinary
+
+#Save every game to a file with a certain ending, then load them all back, returning the seconds taken for each and the total size of the files
+def timeFormat(games, save_dir, ending):
+    paths = [os.path.join(save_dir, str(counter) + '.' + ending) for counter in range(len(games))]
+    start = time.perf_counter()
+    for counter in range(len(games)):
+        games[counter].save_path = paths[counter]
+        games[counter].saveGame()
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded = [readSave(path) for path in paths]
+    load_time = time.perf_counter() - start
+
+    for counter in range(len(games)):
+        if loaded[counter] != games[counter].getSaveRows():
+            raise Exception('Game ' + str(counter) + ' did not load back the same from the .' + ending + ' file')
+    return save_time, load_time, sum(os.path.getsize(path) for path in paths)
+
+#Time just turning save rows into the contents of a file and back, without any file access
+def timeEncoding(all_rows, encode, decode):
+    start = time.perf_counter()
+    encoded = [encode(rows) for rows in all_rows]
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for data in encoded:
+        decode(data)
+    return encode_time, time.perf_counter() - start
+
+if __name__ == '__main__':
+    no_of_games = 1000
+    no_of_turns = 150
+    if len(sys.argv) > 1:
+        no_of_games = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        no_of_turns = int(sys.argv[2])
+
+    games = []
+    for counter in range(no_of_games):
+        random.seed(counter)
+        engine = Turn_Engine(createHeadlessGame(['Player ' + str(p_num+1) for p_num in range(4)]), new_max_turns=no_of_turns)
+        engine.playUntilDone()
+        games.append(engine.game)
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        results = {}
+        for ending in ['dfo', 'dfb']:
+            results[ending] = timeFormat(games, save_dir, ending)
+        all_rows = [game.getSaveRows() for game in games]
+        encodings = {'dfo': timeEncoding(all_rows, formatText, parseText), 'dfb': timeEncoding(all_rows, packBinary, unpackBinary)}
+
+        #Converting each way must give back the same rows
+        for counter in range(min(no_of_games, 100)):
+            text_path = os.path.join(save_dir, str(counter) + '.dfo')
+            convertSave(text_path, os.path.join(save_dir, 'converted.dfb'))
+            convertSave(os.path.join(save_dir, 'converted.dfb'), os.path.join(save_dir, 'converted.dfo'))
+            if readSave(os.path.join(save_dir, 'converted.dfo')) != readSave(text_path):
+                raise Exception('Game ' + str(counter) + ' changed when converted between formats')
+
+    print('Games: ' + str(no_of_games) + ', ' + str(no_of_turns) + ' turns each')
+    for ending in results:
+        save_time, load_time, total_size = results[ending]
+        encode_time, decode_time = encodings[ending]
+        print('.%s  save %.1f us/game  load %.1f us/game  (encode %.1f us, decode %.1f us without file access)  %.0f bytes/game' % (ending, save_time / no_of_games * 1e6, load_time / no_of_games * 1e6,
+                                                                                                                          encode_time / no_of_games * 1e6, decode_time / no_of_games * 1e6, total_size / no_of_games))
+    print('Binary load is %.1fx faster (decode %.1fx), save %.1fx faster (encode %.1fx)' % (results['dfo'][1] / results['dfb'][1], encodings['dfo'][1] / encodings['dfb'][1],
+                                                                                             results['dfo'][0] / results['dfb'][0], encodings['dfo'][0] / encodings['dfb'][0]))
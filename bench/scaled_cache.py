@@ -0,0 +1,57 @@
+#Times showing title deeds and dice at 10 frames per second's worth of frames, resampling every frame (as MainScreen used to) against using the scaled-surface cache
+#Uses SDL's dummy video driver, so no window is opened
+#Run from anywhere with: python bench/scaled_cache.py [number of frames]
+import os
+import sys
+import random
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+
+import pygame
+from cls import Die, Prop_Type
+from imgcache import SurfaceCache
+from new import LoadProperties
+
+if __name__ == '__main__':
+    no_of_frames = 2000
+    if len(sys.argv) > 1:
+        no_of_frames = int(sys.argv[1])
+
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    props = LoadProperties("data/Property Values.txt")
+    deeds = [prop.getTitleDeed() for prop in props if prop.prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION)]
+    die = Die([pygame.image.load("img/Dice/" + str(counter+1) + ".png") for counter in range(6)])
+
+    #The deed on screen only changes when a player moves, so the same deed is shown for many frames in a row
+    rand = random.Random(3)
+    shown = []
+    for counter in range(no_of_frames):
+        if counter % 20 == 0:
+            cur_deed = rand.choice(deeds)
+            die.roll()
+        shown.append((cur_deed, die.cur_score))
+
+    start = time.perf_counter()
+    for deed, score in shown:
+        screen.blit(pygame.transform.smoothscale(deed, [270, 400]), [665, 230])
+        die.cur_score = score
+        screen.blit(pygame.transform.smoothscale(die.getImg(), [70, 70]), [185, 690])
+    uncached_time = time.perf_counter() - start
+
+    cache = SurfaceCache()
+    start = time.perf_counter()
+    for deed, score in shown:
+        screen.blit(cache.scale(deed, [270, 400]), [665, 230])
+        die.cur_score = score
+        screen.blit(cache.scale(die.getImg(), [70, 70]), [185, 690])
+    cached_time = time.perf_counter() - start
+
+    print('Frames:             ' + str(no_of_frames))
+    print('Resampled:          %.1f us/frame' % (uncached_time / no_of_frames * 1e6))
+    print('Cached:             %.1f us/frame' % (cached_time / no_of_frames * 1e6))
+    print('Cache hits/misses:  %d/%d (%.1f%% hit rate, %d evictions)' % (cache.hits, cache.misses, 100 * cache.getHitRate(), cache.evictions))
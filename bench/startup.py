@@ -0,0 +1,72 @@
+#Times start-up (the loading screen's images, the New Game screen's pieces and creating a game) loading every image file itself against taking them from the asset bundle
+#Each run is a fresh process, as the bundle's surfaces and pygame's fonts are only made once per process. Every image is drawn once, so the time includes reading the bundle's pages from disk
+#Builds the bundle first if there is not an up to date one. Uses SDL's dummy video driver, so no window is opened
+#Run from anywhere with: python bench/startup.py [runs of each]
+import os
+import sys
+import subprocess
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data and image files are opened with paths relative to the repository root
+
+import warnings
+warnings.simplefilter('ignore') #pygame warns on every font when it cannot list the system's fonts
+import pygame
+from anigif import AnimatedGif
+from assetbundle import asset_bundle, loadImage, DEFAULT_BUNDLE_PATH
+from new import LoadProperties, createDeck, createBoard, createGame, Game_RNG
+
+#The images and games made between the loading screen appearing and the main screen's first frame, drawn once each
+def startUp(screen):
+    main = loadImage("img/Title.png", [936, 180])
+    coin_paths = ["img/CA/coin_frame_" + str(counter+1) + ".png" for counter in range(12)]
+    coins = [AnimatedGif(100, 210, 128, 128, coin_paths), AnimatedGif(708, 210, 128, 128, coin_paths)]
+    pieces = [loadImage("img/Pieces/" + str(counter+1) + ".png", [50, 50]) for counter in range(6)]
+
+    prop_arr = LoadProperties("data/Property Values.txt")
+    game_rng = Game_RNG(1)
+    Pot_Luck_Deck = createDeck("Pot Luck", "img/PL/Pot Luck ", "data/Card_Texts.txt", "data/PL Master.txt", 16, game_rng.getSubstream('Pot Luck'))
+    Council_Chest_Deck = createDeck("Council Chest", "img/CC/Council Chest ", "data/Card_Texts.txt", "data/CC Master.txt", 16, game_rng.getSubstream('Council Chest'))
+    game_board = createBoard("data/Board_Data.txt", prop_arr, Pot_Luck_Deck, Council_Chest_Deck, "img/Board.png", 600)
+    game = createGame([], game_board, None, "img/Dice/", False, game_rng)
+
+    surfaces = [main, game_board.board_img] + list(coins[0].frames) + pieces + list(game.getDie(0).images)
+    surfaces += [card.card_img for card in Pot_Luck_Deck.card_arr] + [card.card_img for card in Council_Chest_Deck.card_arr]
+    for prop in prop_arr:
+        if hasattr(prop, 'title_deed'):
+            surfaces += [prop.title_deed, prop.mortgage_deed]
+    for surface in surfaces:
+        screen.blit(surface, [0, 0])
+    return len(surfaces)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--child': #One timed start-up, run by the parent below
+        pygame.init()
+        screen = pygame.display.set_mode([1024, 768])
+        start = time.perf_counter()
+        if sys.argv[2] == 'bundle' and not asset_bundle.open():
+            raise Exception('Asset bundle could not be opened')
+        no_of_surfaces = startUp(screen)
+        print('%f %d %d' % (time.perf_counter() - start, no_of_surfaces, asset_bundle.misses))
+        sys.exit(0)
+
+    no_of_runs = 5
+    if len(sys.argv) > 1:
+        no_of_runs = int(sys.argv[1])
+
+    if not asset_bundle.open():
+        print('Building asset bundle...')
+        subprocess.run([sys.executable, 'bundle.py'], check=True)
+    asset_bundle.close()
+
+    for mode in ['files', 'bundle']:
+        times = []
+        for counter in range(no_of_runs):
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode], check=True, capture_output=True, text=True).stdout.split()
+            times.append(float(output[0]))
+        times.sort()
+        print('%-7s %d surfaces: median %.1f ms, best %.1f ms, worst %.1f ms%s' % (mode, int(output[1]), 1000 * times[len(times)//2], 1000 * times[0], 1000 * times[-1], '' if mode == 'files' else ' (' + str(output[2]) + ' images not in the bundle)'))
+    print('Bundle size: %.1f MB' % (os.path.getsize(DEFAULT_BUNDLE_PATH) / 1e6))
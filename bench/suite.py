@@ -0,0 +1,278 @@
+#Repeatable benchmark suite for the hot paths of the game engine, saving and loading, and drawing the main game screen
+#Every case is set up from the same seed each run, so the same work is timed every time. Results are printed as JSON (or written to a file),
+#and can be compared against a stored baseline, failing (exit status 1) if any case has got slower by more than the threshold
+#Usage: python bench/suite.py [CASE ...] [--seed N] [--repeat N] [--output FILE] [--baseline FILE] [--threshold FRACTION] [--update-baseline] [--profile DIR] [--list]
+import argparse
+import cProfile
+import json
+import os
+import platform
+import pstats
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) #Repository root, so cls and new can be imported
+os.chdir(sys.path[0]) #Data files are opened with paths relative to the repository root
+sys.path.insert(0, os.path.join(sys.path[0], 'bench'))
+warnings.simplefilter('ignore') #pygame warns that system fonts cannot be listed without fc-list
+
+import pygame
+from cls import Prop_Type, Turn_Engine, Game_RNG
+from new import createHeadlessGame, LoadProperties, createDeck
+from lib import getObtainMon
+from savefile import loadSave
+import leaderboard
+
+DEFAULT_BASELINE = os.path.join('bench', 'baseline.json')
+DEFAULT_THRESHOLD = 0.25 #A case must be this much slower than its baseline (as a fraction) to count as a regression, as timings vary a little from run to run
+
+#------------------------------Setup Functions------------------------------
+#Seeded headless game played part of the way through, so that properties are owned, upgraded and mortgaged
+def createPlayedGame(seed, no_of_players=4, no_of_turns=150):
+    random.seed(seed)
+    engine = Turn_Engine(createHeadlessGame(['Player ' + str(counter+1) for counter in range(no_of_players)], seed=seed), new_max_turns=no_of_turns)
+    engine.playUntilDone()
+    return engine.game
+
+#Positions of every property that can be owned
+def getOwnablePoses(board):
+    return [b_pos for b_pos in range(board.max_pos + 1) if board.getProp(b_pos).prop_type in (Prop_Type.NORMAL, Prop_Type.SCHOOL, Prop_Type.STATION)]
+
+
+#------------------------------Benchmark Cases------------------------------
+#Each case is set up from a seed and returns a function with no arguments that does the work being timed, and how many operations one call is
+#Times are reported per operation, so cases that loop over every property or player can be compared with ones that do not
+
+#Rent for every player standing on every square of the board
+def setupDetermineRent(seed):
+    game = createPlayedGame(seed)
+    poses = list(range(game.board.max_pos + 1))
+    def run():
+        for player_num in range(len(game.players)):
+            game.cur_player = player_num
+            cur_player = game.getCurPlayer()
+            orig_pos = cur_player.player_pos
+            for b_pos in poses:
+                cur_player.player_pos = b_pos
+                game.determineRent()
+            cur_player.player_pos = orig_pos
+    return run, len(game.players) * len(poses)
+
+#Whether each player owns the whole group of every NORMAL property
+def setupWholeGroupOwned(seed):
+    game = createPlayedGame(seed)
+    poses = [b_pos for b_pos in getOwnablePoses(game.board) if game.board.getProp(b_pos).prop_type == Prop_Type.NORMAL]
+    def run():
+        for player_num in range(len(game.players)):
+            for b_pos in poses:
+                game.board.wholeGroupOwned(player_num, b_pos)
+    return run, len(game.players) * len(poses)
+
+#Every card in both decks applied to the current player in turn. The game is put back as it was after each card, so every call does the same work
+def setupApplyCardEffects(seed):
+    game = createPlayedGame(seed)
+    cards = list(game.board.PL_Deck.card_arr) + list(game.board.CC_Deck.card_arr)
+    saved_players = [(player.player_money, player.player_pos, player.player_piece.piece_x, player.player_piece.piece_y, player.player_hasBogMap,
+                      player.player_nextRollMod, player.player_turnsToMiss, player.player_inJail) for player in game.players]
+    def run():
+        for card in cards:
+            game.controller.card_effs = card.card_nums
+            game.applyCardEffects()
+            for counter in range(len(game.players)):
+                player = game.players[counter]
+                (player.player_money, player.player_pos, player.player_piece.piece_x, player.player_piece.piece_y, player.player_hasBogMap,
+                 player.player_nextRollMod, player.player_turnsToMiss, player.player_inJail) = saved_players[counter]
+    return run, len(cards)
+
+def setupSetup2DArray(seed):
+    game = createPlayedGame(seed, 6)
+    return (lambda: leaderboard.setup2DArray(game)), 1
+
+#Sorting the leaderboard on each of its columns, both ways, as clicking the sort arrows does
+def setupGetSortOrder(seed):
+    lead_arr = leaderboard.setup2DArray(createPlayedGame(seed, 6))
+    def run():
+        for sort_col in range(1, 4):
+            for asc in (False, True):
+                leaderboard.getSortOrder(lead_arr, sort_col, asc)
+    return run, 6
+
+def setupGetObtainMon(seed):
+    game = createPlayedGame(seed, 6)
+    def run():
+        for player_num in range(len(game.players)):
+            getObtainMon(game.board, player_num)
+    return run, len(game.players)
+
+#Saving to, and loading from, a file in each save format. Files are written to a temporary directory that is removed when the suite finishes
+def setupSaveGame(ending):
+    def setup(seed):
+        game = createPlayedGame(seed)
+        game.save_path = os.path.join(temp_dir.name, 'save_' + str(seed) + '.' + ending)
+        return game.saveGame, 1
+    return setup
+
+def setupLoadSave(ending):
+    def setup(seed):
+        game = createPlayedGame(seed)
+        game.save_path = os.path.join(temp_dir.name, 'load_' + str(seed) + '.' + ending)
+        game.saveGame()
+        return (lambda: loadSave(game.save_path)), 1
+    return setup
+
+#Properties without title deeds, as for headless games (title deeds are covered by bench/deeds.py)
+def setupLoadProperties(seed):
+    return (lambda: LoadProperties("data/Property Values.txt", False)), 1
+
+def setupCreateDeck(seed):
+    return (lambda: createDeck("Pot Luck", None, "data/Card_Texts.txt", "data/PL Master.txt", 16, Game_RNG(seed).getSubstream('Pot Luck'))), 1
+
+#Opening the main game screen and drawing its first frame on SDL's dummy video driver, with every image, title deed and font loaded as in the real game
+def setupMainScreenFrame(seed):
+    from main_frame import createGuiGame, Script_Clock
+    from framesched import frame_scheduler
+    import maingame
+    pygame.init()
+    screen = pygame.display.set_mode([1024, 768])
+    random.seed(seed)
+    game = createGuiGame(['Player 1', 'Player 2', 'Player 3'])
+    frame_scheduler.idle_timeout = 0 #Never sleep waiting for input
+    def run():
+        pygame.event.clear()
+        maingame.MainScreen(game, screen, Script_Clock(1, 2)) #Quits after the first frame, without clicking anything
+    return run, 1
+
+#Case name -> setup function, in the order they are run
+CASES = {'Game.determineRent': setupDetermineRent,
+         'Board.wholeGroupOwned': setupWholeGroupOwned,
+         'Game.applyCardEffects': setupApplyCardEffects,
+         'leaderboard.setup2DArray': setupSetup2DArray,
+         'leaderboard.getSortOrder': setupGetSortOrder,
+         'lib.getObtainMon': setupGetObtainMon,
+         'Game.saveGame (.dfo)': setupSaveGame('dfo'),
+         'Game.saveGame (.dfb)': setupSaveGame('dfb'),
+         'loadSave (.dfo)': setupLoadSave('dfo'),
+         'loadSave (.dfb)': setupLoadSave('dfb'),
+         'LoadProperties': setupLoadProperties,
+         'createDeck': setupCreateDeck,
+         'maingame.MainScreen (1 frame)': setupMainScreenFrame}
+
+temp_dir = None #Made by main, for the save and load cases
+
+
+#------------------------------Timing Functions------------------------------
+#Number of calls to run_func that take at least min_time seconds altogether, found by doubling as timeit does
+def getCallsPerRepeat(run_func, min_time=0.05):
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for counter in range(calls):
+            run_func()
+        if time.perf_counter() - start >= min_time or calls >= 1 << 20:
+            return calls
+        calls *= 2
+
+#Time one case, returning its results as a dictionary. Times are in microseconds per operation
+#If profile_path is given, one more repeat is run under cProfile and its stats are saved there
+def runCase(name, seed, repeat, profile_path=None):
+    run_func, ops_per_call = CASES[name](seed)
+    run_func() #Warm up caches (images, fonts, file system) so the first repeat is not slower for the wrong reasons
+    calls = getCallsPerRepeat(run_func)
+    times = []
+    for counter in range(repeat):
+        start = time.perf_counter()
+        for call_counter in range(calls):
+            run_func()
+        times.append((time.perf_counter() - start) / (calls * ops_per_call) * 1e6)
+    times.sort()
+
+    if profile_path != None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for call_counter in range(calls):
+            run_func()
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+
+    return {'best_us': times[0], 'median_us': times[len(times)//2], 'worst_us': times[-1], 'calls_per_repeat': calls, 'ops_per_call': ops_per_call, 'repeats': repeat}
+
+#Cases that have got slower than the baseline by more than threshold, as a list of (name, baseline time, current time)
+#The best time of each case is compared, as it is the least affected by whatever else the computer is doing
+def findRegressions(results, baseline, threshold):
+    regressions = []
+    for name in results:
+        if name in baseline['cases']:
+            base_us = baseline['cases'][name]['best_us']
+            if results[name]['best_us'] > base_us * (1 + threshold):
+                regressions.append((name, base_us, results[name]['best_us']))
+    return regressions
+
+def main():
+    global temp_dir
+    parser = argparse.ArgumentParser(description='Time the hot paths of Dunfermline-opoly against a stored baseline')
+    parser.add_argument('cases', nargs='*', help='Cases to run (all of them if none are given); any case containing one of these is run')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for the games every case is set up with')
+    parser.add_argument('--repeat', type=int, default=5, help='Times each case is timed; the best, median and worst are reported')
+    parser.add_argument('--output', help='Write the results to this JSON file instead of printing them')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Results to compare against (default: %(default)s)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Fraction slower than the baseline that counts as a regression (default: %(default)s)')
+    parser.add_argument('--update-baseline', action='store_true', help='Save these results as the new baseline instead of comparing against it')
+    parser.add_argument('--profile', metavar='DIR', help='Also run each case under cProfile, saving a .pstats file for it here and printing its top functions')
+    parser.add_argument('--list', action='store_true', help='List the cases and exit')
+    args = parser.parse_args()
+
+    if args.list:
+        print('\n'.join(CASES))
+        return 0
+    names = [name for name in CASES if len(args.cases) == 0 or any(case in name for case in args.cases)]
+    if args.profile != None:
+        os.makedirs(args.profile, exist_ok=True)
+
+    results = {}
+    temp_dir = tempfile.TemporaryDirectory()
+    try:
+        for name in names:
+            profile_path = None
+            if args.profile != None:
+                profile_path = os.path.join(args.profile, ''.join(char if char.isalnum() or char in '._' else '_' for char in name) + '.pstats')
+            results[name] = runCase(name, args.seed, args.repeat, profile_path)
+            print('%-32s %10.2f us/op (median %.2f)' % (name, results[name]['best_us'], results[name]['median_us']), file=sys.stderr)
+            if profile_path != None:
+                pstats.Stats(profile_path, stream=sys.stderr).sort_stats('cumulative').print_stats(10)
+    finally:
+        temp_dir.cleanup()
+
+    report = {'seed': args.seed, 'python': platform.python_version(), 'machine': platform.machine(), 'cases': results}
+    if args.update_baseline:
+        with open(args.baseline, 'w') as fh:
+            json.dump(report, fh, indent=1, sort_keys=True)
+        print('Baseline saved to ' + args.baseline, file=sys.stderr)
+        return 0
+
+    if args.output != None:
+        with open(args.output, 'w') as fh:
+            json.dump(report, fh, indent=1, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=1, sort_keys=True))
+
+    if not os.path.exists(args.baseline):
+        print('No baseline at ' + args.baseline + ' to compare against (make one with --update-baseline)', file=sys.stderr)
+        return 0
+    with open(args.baseline) as fh:
+        baseline = json.load(fh)
+    regressions = findRegressions(results, baseline, args.threshold)
+    for name, base_us, cur_us in regressions:
+        print('REGRESSION %s: %.2f us/op, against %.2f us/op in the baseline (%+.0f%%)' % (name, cur_us, base_us, 100 * (cur_us / base_us - 1)), file=sys.stderr)
+    if len(regressions) > 0:
+        return 1
+    print('No case is more than %.0f%% slower than the baseline' % (100 * args.threshold), file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+from .bgload import BackgroundLoader, background_loader
\ No newline at end of file
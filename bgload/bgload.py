@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+#------------------------------BackgroundLoader Class------------------------------
+#Runs loading work (decoding images, reading data files) on worker threads while a screen carries on drawing, e.g. the loading screen preparing a game before Play is pressed
+#Each task has a name, and its result is picked up with take. Decoding and scaling images happens in SDL with Python's lock released, so tasks really do run side by side on a multi-core machine
+#A task can name tasks it needs the results of (after); these must have been submitted first, so that a worker never waits on a task that no worker has started
+class BackgroundLoader:
+    def __init__(self, max_workers=None):
+        if max_workers == None:
+            max_workers = min(4, os.cpu_count() or 1)
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.executor = None #Made when the first task is submitted, and shut down once every task is done
+        self.futures = {} #Task name -> Future, until the result is taken
+
+        #Counters used for the progress bar and reporting
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.last_error = None #Exception raised by the last task that failed, if any
+        self.start_time = None
+        self.finish_time = None #When every task submitted so far was done
+
+    #Queue func(*args) to be run on a worker thread, as the task called name. Returns straight away
+    #If after is given, the task's function is passed the results of those tasks (in order) ahead of args, once they are done
+    def submit(self, name, func, *args, after=()):
+        with self.lock:
+            if self.executor == None:
+                self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='BackgroundLoader')
+            if self.submitted == self.completed:
+                self.start_time = time.perf_counter()
+                self.finish_time = None
+            needed = [self.futures[need_name] for need_name in after]
+            self.submitted += 1
+            if len(needed) == 0:
+                future = self.executor.submit(func, *args)
+            else:
+                future = self.executor.submit(lambda: func(*[need.result() for need in needed], *args))
+            self.futures[name] = future
+        future.add_done_callback(self.taskDone)
+        return future
+
+    def taskDone(self, future):
+        with self.lock:
+            self.completed += 1
+            if future.exception() != None:
+                self.failed += 1
+                self.last_error = future.exception()
+            if self.completed == self.submitted: #Nothing left to run, so the worker threads can go
+                self.finish_time = time.perf_counter()
+                self.executor.shutdown(wait=False)
+                self.executor = None
+
+    #Result of a task, waiting for it if it is not done yet. A result can only be taken once, as it may be changed by whoever takes it (e.g. a Board used by a game)
+    #Returns None if there is no such task (or it has already been taken) or it failed, in which case the caller should do the work itself
+    def take(self, name):
+        with self.lock:
+            future = self.futures.pop(name, None)
+        if future == None or future.exception() != None:
+            return None
+        return future.result()
+
+    #Wait for a task to be done without taking its result, e.g. for a task that fills something shared, such as the sprite atlas. Returns straight away if there is no such task
+    def wait(self, name):
+        with self.lock:
+            future = self.futures.get(name)
+        if future != None:
+            future.exception() #Waits, but does not raise if the task failed
+
+    #Fraction (0 to 1) of the tasks submitted that are done, for drawing a progress bar
+    def getProgress(self):
+        with self.lock:
+            if self.submitted == 0:
+                return 1
+            return self.completed / self.submitted
+
+    def isDone(self):
+        with self.lock:
+            return self.completed == self.submitted
+
+    #One line summary of the tasks run so far
+    def getReport(self):
+        with self.lock:
+            if self.submitted == 0:
+                return 'Background loader: nothing loaded'
+            report = 'Background loader: %d of %d tasks done on %d threads' % (self.completed, self.submitted, self.max_workers)
+            if self.finish_time != None:
+                report += ', all done %.0f ms after starting' % (1000 * (self.finish_time - self.start_time))
+            if self.failed > 0:
+                report += ', %d failed (last error: %s)' % (self.failed, self.last_error)
+            return report
+
+
+background_loader = BackgroundLoader() #Shared by every screen
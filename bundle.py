@@ -0,0 +1,74 @@
+#Builds the asset bundle: every image loaded at start-up, already scaled to the size it is shown at, and every title deed, already rendered (see assetbundle)
+#Needs running again whenever an image, the property values or the fonts change; until it is, the game notices the images have changed and loads them itself
+#Usage: python bundle.py [--output FILE] [--props FILE]
+import argparse
+import os
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+import numpy as np
+from assetbundle import DEFAULT_BUNDLE_PATH, getImageKey, writeBundle, loadImage
+from deedfactory import CreateTitleDeed, CreateMortDeed, getTitleDeedKey, getMortDeedKey
+from new import getGameImages
+
+#------------------------------Bundle Contents------------------------------
+#Image files and the sizes they are loaded at, as [path, size ([width, height], or None for the image as it is), smooth]
+def getImageList():
+    images = [["img/Title.png", [936, 180], True]] #LoadScreen title, at the loading screen's size
+    for counter in range(12):
+        images.append(["img/CA/coin_frame_" + str(counter+1) + ".png", [128, 128], False]) #Coin animation frames, which AnimatedGif scales with pygame.transform.scale
+    images += getGameImages() #Cards, board, dice and pieces
+    images.append(["img/Tower Block.png", [75, 75], True]) #Upgrade buttons on the main screen
+    images.append(["img/Council House.png", [75, 75], True])
+    return images
+
+#Read the property values file just as LoadProperties does, returning [property type, values] of each property
+def getPropValues(props_path):
+    prop_list = []
+    fh = open(props_path, "r")
+    for counter in range(40):
+        prop_type = int(fh.read(2)[:1])
+        prop_list.append([prop_type, np.array(fh.readline().split(","))])
+    fh.close()
+    return prop_list
+
+#Build every image that goes in the bundle, returning a dictionary of key -> Surface and a list of the image files used
+def buildAssets(props_path):
+    assets = {}
+    sources = []
+    for path, size, smooth in getImageList():
+        assets[getImageKey(path, size, smooth)] = loadImage(path, size, smooth)
+        if path not in sources:
+            sources.append(path)
+
+    for prop_type, prop_values in getPropValues(props_path):
+        if prop_type == 0: #Typical property, with a rendered title deed
+            assets[getTitleDeedKey(prop_values)] = CreateTitleDeed(prop_values)
+            assets[getMortDeedKey(prop_values[0], int(prop_values[10])*1.2)] = CreateMortDeed(prop_values[0], int(prop_values[10])*1.2)
+        elif prop_type == 1 or prop_type == 2: #School or station, whose title deed is an image, and which has a thumbnail with a smaller copy of it
+            mort_cost = int(prop_values[6 if prop_type == 1 else 4])*1.2
+            assets[getMortDeedKey(prop_values[0], mort_cost)] = CreateMortDeed(prop_values[0], mort_cost)
+            deed_path = "img/Deeds/" + str(prop_values[0]) + ".png"
+            thumb_path = "img/Thumbs/" + str(prop_values[0]) + ".png"
+            assets[getImageKey(deed_path)] = loadImage(deed_path)
+            assets[getImageKey(thumb_path, [35, 40])] = loadImage(thumb_path, [35, 40]) #Size used by CreateThumbImg
+            sources += [deed_path, thumb_path]
+    return assets, sources
+
+
+#------------------------------Bundle Entry Point------------------------------
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__))) #Image and data files are opened with paths relative to the repository root
+
+    parser = argparse.ArgumentParser(description='Build the asset bundle of pre-scaled images and rendered title deeds that Dunfermline-opoly loads at start-up')
+    parser.add_argument('--output', default=DEFAULT_BUNDLE_PATH, help='bundle file to write (the game only looks for ' + DEFAULT_BUNDLE_PATH + ')')
+    parser.add_argument('--props', default='data/Property Values.txt', help='property values file to render title deeds from')
+    args = parser.parse_args()
+
+    pygame.init()
+    start = time.perf_counter()
+    assets, sources = buildAssets(args.props)
+    bundle_size = writeBundle(args.output, assets, sources)
+    print('Wrote %s: %d images from %d files, %.1f MB, in %.2f s' % (args.output, len(assets), len(sources), bundle_size / 1e6, time.perf_counter() - start))
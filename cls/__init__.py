@@ -1,10 +1,15 @@
 from .board import Board
+from .board_arrays import Board_Arrays
 from .card import Card
 from .card_deck import Card_Deck
 from .die import Die
+from .engine import Sim_Policy, Turn_Engine
 from .game import Game, Game_Controller
+from .game_rng import Game_RNG
+from .landing_chain import Landing_Chain
 from .player import Player
 from .player_piece import Player_Piece
+from .portfolio import Portfolio
 from .property import *
 
 from.button import Button
\ No newline at end of file
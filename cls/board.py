@@ -1,6 +1,7 @@
 import pygame
 import numpy as np
 from .property import Prop_Type
+from .portfolio import Portfolio
 
 #------------------------------Board Class------------------------------
 #Used for storing all data for properties, the two decks of cards, as well as a few other pieces of information such as money collected on passing the Job Centre
@@ -12,68 +13,173 @@ class Board:
         self.JC_Money = new_JCmon 
         self.PL_Deck = new_PL #Card_Deck object
         self.CC_Deck = new_CC #Card_Deck object
-        self.board_img = pygame.transform.smoothscale(new_img, [int(768*new_sf), int(768*new_sf)]) #Pygame image of the actual board - the one that is displayed on screen
+        self.board_img = None #Pygame image of the actual board - the one that is displayed on screen. Stays None for headless games (e.g. simulations), which have no display
+        if new_img != None:
+            self.board_img = pygame.transform.smoothscale(new_img, [int(768*new_sf), int(768*new_sf)])
         self.board_sf = new_sf #Mainly used in determining the pieces' positions on the board; this was only optimised for a 768x768 board, so any other size requires this value to be scaled slightly
 
+        #Colour group index, built once here so that group queries only ever look at the 2 or 3 properties in a group, rather than scanning the whole board
+        self.group_ids = [-1] * (self.max_pos + 1) #Group number of each board position; -1 for properties that are not NORMAL (so have no colour group)
+        self.groups = [] #Board positions of the properties in each group, indexed by group number
+        group_cols = [] #Colour of each group, in the same order as self.groups
+        for counter in range(self.max_pos + 1):
+            if self.getProp(counter).prop_type == Prop_Type.NORMAL:
+                if self.getProp(counter).group_col not in group_cols: #First property found for this colour, so it is a new group
+                    group_cols.append(self.getProp(counter).group_col)
+                    self.groups.append([])
+                self.group_ids[counter] = group_cols.index(self.getProp(counter).group_col)
+                self.groups[self.group_ids[counter]].append(counter)
+        self.group_owned = [[0] * 6 for counter in range(len(self.groups))] #Number of properties in each group owned by each of the (max 6) players. Kept up to date by buyProperty and releaseProperty
+
+        self.type_owned = {Prop_Type.SCHOOL: [0] * 6, Prop_Type.STATION: [0] * 6} #Number of schools and stations owned by each of the (max 6) players, used when working out their rents. Kept up to date by buyProperty and releaseProperty
+
+        self.portfolios = self.buildPortfolios() #Portfolio object for each of the (max 6) players, kept up to date by every method that changes a property
+        self.debug_checks = False #If True, the portfolios and ownership counts are checked against ones rebuilt from scratch after every change. Slow, so only for debugging
+
     def getProp(self,b_pos):
         return self.properties[b_pos]
-        #Checks if the group to which a certain property belongs 
 
-    def wholeGroupOwned(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type != Prop_Type.NORMAL:
-            return False
-        find_col = self.getProp(prop_num).group_col #Colour of the group whose coalescence of ownership is being investigated
+    #Number of properties of a certain type (SCHOOL or STATION) owned by a player
+    def countTypeOwned(self, prop_type, player_num):
+        return self.type_owned[prop_type][player_num]
+
+    def getPortfolio(self, player_num):
+        return self.portfolios[player_num]
+
+    #Create a Portfolio for each player by scanning the whole board
+    #Used when the board is first set up or a game has been loaded, and for checking that the incrementally updated portfolios are correct
+    def buildPortfolios(self):
+        ret_portfolios = [Portfolio() for counter in range(6)]
         for counter in range(self.max_pos + 1):
-            if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner != player_num:
-                    #This property is the same colour as the one that is being examined, however, the owner is different so this player cannot own the entire group
-                    return False
+            if self.getProp(counter).prop_type == Prop_Type.NORMAL or self.getProp(counter).prop_type == Prop_Type.SCHOOL or self.getProp(counter).prop_type == Prop_Type.STATION:
+                if self.getProp(counter).prop_owner != -1:
+                    ret_portfolios[self.getProp(counter).prop_owner].addProp(counter, self.getProp(counter))
+        return ret_portfolios
+
+    #Rebuild all portfolios from scratch, e.g. after properties have had their attributes restored directly when loading a game
+    def rebuildPortfolios(self):
+        self.portfolios = self.buildPortfolios()
+
+    #Whether every player's portfolio matches one built from scratch
+    def checkPortfolios(self):
+        fresh = self.buildPortfolios()
+        for counter in range(len(fresh)):
+            if not self.portfolios[counter].matches(fresh[counter]):
+                return False
         return True
 
+    #Whether the group and school/station ownership counts match ones worked out by scanning the whole board
+    def checkCounts(self):
+        group_owned = [[0] * 6 for counter in range(len(self.groups))]
+        type_owned = {Prop_Type.SCHOOL: [0] * 6, Prop_Type.STATION: [0] * 6}
+        for counter in range(self.max_pos + 1):
+            if self.getProp(counter).prop_type == Prop_Type.NORMAL or self.getProp(counter).prop_type == Prop_Type.SCHOOL or self.getProp(counter).prop_type == Prop_Type.STATION:
+                if self.getProp(counter).prop_owner != -1:
+                    if self.group_ids[counter] != -1:
+                        group_owned[self.group_ids[counter]][self.getProp(counter).prop_owner] += 1
+                    if self.getProp(counter).prop_type in type_owned:
+                        type_owned[self.getProp(counter).prop_type][self.getProp(counter).prop_owner] += 1
+        return group_owned == self.group_owned and type_owned == self.type_owned
+
+    def debugCheck(self):
+        if self.debug_checks:
+            assert self.checkPortfolios(), 'Portfolio totals no longer match the board'
+            assert self.checkCounts(), 'Ownership counts no longer match the board'
+
+    #Board position of every property in the same colour group as the property at prop_num (empty if it has no group)
+    def getGroup(self, prop_num):
+        if self.group_ids[prop_num] == -1:
+            return []
+        return self.groups[self.group_ids[prop_num]]
+
+    #Give a property to a player, keeping the group ownership counts up to date. Should be used instead of calling the property's own buyProperty method
+    def buyProperty(self, b_pos, player_num):
+        if self.getProp(b_pos).prop_owner != -1: #Property can only be bought if no one owns it yet
+            return
+        self.getProp(b_pos).buyProperty(player_num)
+        if self.group_ids[b_pos] != -1:
+            self.group_owned[self.group_ids[b_pos]][player_num] += 1
+        if self.getProp(b_pos).prop_type in self.type_owned:
+            self.type_owned[self.getProp(b_pos).prop_type][player_num] += 1
+        self.portfolios[player_num].addProp(b_pos, self.getProp(b_pos))
+        self.debugCheck()
+
+    #Return a property to the bank (e.g. when its owner goes bankrupt), unmortgaged and without any upgrades
+    def releaseProperty(self, b_pos):
+        r_prop = self.getProp(b_pos)
+        if r_prop.prop_owner == -1:
+            return
+        self.portfolios[r_prop.prop_owner].removeProp(b_pos, r_prop) #Must be removed before its values are reset
+        if r_prop.prop_type in self.type_owned:
+            self.type_owned[r_prop.prop_type][r_prop.prop_owner] -= 1
+        if self.group_ids[b_pos] != -1:
+            self.group_owned[self.group_ids[b_pos]][r_prop.prop_owner] -= 1
+            r_prop.C_Houses = 0 #Only NORMAL properties (those with a group) have upgrades
+            r_prop.T_Blocks = 0
+        r_prop.prop_owner = -1
+        r_prop.mortgage_status = False
+        self.debugCheck()
+
+    #Mortgage (new_status True) or unmortgage (new_status False) an owned property
+    def setMortgage(self, b_pos, new_status):
+        m_prop = self.getProp(b_pos)
+        self.portfolios[m_prop.prop_owner].changeTotals(m_prop, -1) #Totals are updated by taking away the property's old values and adding its new ones
+        m_prop.mortgage_status = new_status
+        self.portfolios[m_prop.prop_owner].changeTotals(m_prop, 1)
+        self.debugCheck()
+
+    #Checks if the group to which a certain property belongs is entirely owned by one player
+    def wholeGroupOwned(self, player_num, prop_num):
+        if self.group_ids[prop_num] == -1: #Only NORMAL properties have a colour group
+            return False
+        if player_num < 0: #Not a player, so there are no counts kept; check the group itself
+            return self.countGroupSize(player_num, prop_num) == len(self.getGroup(prop_num))
+        return self.group_owned[self.group_ids[prop_num]][player_num] == len(self.groups[self.group_ids[prop_num]])
+
     #Counts the number of properties that are a memeber of a certain property's 'colour group'
     def countGroupSize(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type != Prop_Type.NORMAL: #Only NORMAL properties have a colour group
+        if self.group_ids[prop_num] == -1: #Only NORMAL properties have a colour group
             return 0
+        if player_num >= 0:
+            return self.group_owned[self.group_ids[prop_num]][player_num]
         group_count = 0
-        find_col = self.getProp(prop_num).group_col #Colour of the group which we are concerned with
-        for counter in range(self.max_pos + 1):
-            if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner == player_num:
-                    group_count += 1
+        for g_pos in self.getGroup(prop_num):
+            if self.getProp(g_pos).prop_owner == player_num:
+                group_count += 1
         return group_count
 
     #Add 1 Council House upgrade to every property in a certain group
     def buyCHGroup(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type == Prop_Type.NORMAL:
-            find_col = self.getProp(prop_num).group_col #Colour of the group which we are concerned with
-            for counter in range(self.max_pos + 1):
-                if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                    if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner == player_num:
-                        self.getProp(counter).buyCH()
+        for g_pos in self.getGroup(prop_num):
+            if self.getProp(g_pos).prop_owner == player_num:
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), -1)
+                self.getProp(g_pos).buyCH()
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), 1)
+        self.debugCheck()
 
     #Add 1 Tower Block upgrade to every property in a certain group
     def buyTBGroup(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type == Prop_Type.NORMAL:
-            find_col = self.getProp(prop_num).group_col #Colour of the group which we are concerned with
-            for counter in range(self.max_pos + 1):
-                if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                    if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner == player_num:
-                        self.getProp(counter).buyTB()
+        for g_pos in self.getGroup(prop_num):
+            if self.getProp(g_pos).prop_owner == player_num:
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), -1)
+                self.getProp(g_pos).buyTB()
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), 1)
+        self.debugCheck()
 
     #Remove 1 Council House upgrade from every property in a certain group
     def sellCHGroup(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type == Prop_Type.NORMAL:
-            find_col = self.getProp(prop_num).group_col #Colour of the group which we are concerned with
-            for counter in range(self.max_pos + 1):
-                if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                    if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner == player_num:
-                        self.getProp(counter).sellCH()
+        for g_pos in self.getGroup(prop_num):
+            if self.getProp(g_pos).prop_owner == player_num:
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), -1)
+                self.getProp(g_pos).sellCH()
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), 1)
+        self.debugCheck()
 
-    #Remove 1 Council House upgrade from every property in a certain group
+    #Remove 1 Tower Block upgrade from every property in a certain group
     def sellTBGroup(self, player_num, prop_num):
-        if self.getProp(prop_num).prop_type == Prop_Type.NORMAL:
-            find_col = self.getProp(prop_num).group_col #Colour of the group which we are concerned with
-            for counter in range(self.max_pos + 1):
-                if self.getProp(counter).prop_type == Prop_Type.NORMAL: #Prevents errors as no other types have a Group Colour
-                    if self.getProp(counter).group_col == find_col and self.getProp(counter).prop_owner == player_num:
-                        self.getProp(counter).sellTB()
\ No newline at end of file
+        for g_pos in self.getGroup(prop_num):
+            if self.getProp(g_pos).prop_owner == player_num:
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), -1)
+                self.getProp(g_pos).sellTB()
+                self.portfolios[player_num].changeTotals(self.getProp(g_pos), 1)
+        self.debugCheck()
@@ -0,0 +1,120 @@
+import numpy as np
+from .property import Prop_Type
+
+#------------------------------Board Arrays Class------------------------------
+#Structure-of-arrays snapshot of the board's economy: one NumPy array per attribute, with one element per board position
+#Lets rents, asset values etc. be worked out for every square or every player at once with vectorised NumPy expressions (e.g. by Landing_Chain)
+#The Property objects are still what the game and GUI use. The snapshot is not kept up to date as the game goes on, so a new one should be made whenever it is needed
+class Board_Arrays:
+    def __init__(self, board):
+        no_of_props = board.max_pos + 1
+        self.prop_type = np.zeros(no_of_props, int) #Prop_Type value of each property
+        self.owner = np.full(no_of_props, -1) #-1 if unowned (or cannot be owned)
+        self.C_Houses = np.zeros(no_of_props, int)
+        self.T_Blocks = np.zeros(no_of_props, int)
+        self.mortgaged = np.zeros(no_of_props, int) #1 if mortgaged, 0 if not
+        self.cost = np.zeros(no_of_props, int)
+        self.mortgage_val = np.zeros(no_of_props, int)
+        self.CH_cost = np.zeros(no_of_props, int)
+        self.TB_cost = np.zeros(no_of_props, int)
+        self.group_id = np.array(board.group_ids) #-1 for properties with no colour group
+        self.group_sizes = np.array([len(group) for group in board.groups])
+        #Rent matrix, one row per property:
+        #   NORMAL: rent with no upgrades, 1-4 Council Houses, then a Tower Block
+        #   SCHOOL: rent when 1-4 schools are owned
+        #   STATION: multiplier of the dice roll when 1-2 stations are owned
+        #   PAYMENT: the surcharge in the first column
+        self.rents = np.zeros((no_of_props, 6), int)
+
+        for counter in range(no_of_props):
+            prop = board.getProp(counter)
+            self.prop_type[counter] = prop.prop_type.value
+            if prop.prop_type == Prop_Type.NORMAL:
+                self.cost[counter] = prop.cost
+                self.mortgage_val[counter] = prop.mortgage_val
+                self.CH_cost[counter] = prop.CH_cost
+                self.TB_cost[counter] = prop.TB_cost
+                self.rents[counter] = [prop.rentNo] + list(prop.rentCH) + [prop.rentTB]
+            elif prop.prop_type == Prop_Type.SCHOOL:
+                self.cost[counter] = prop.cost
+                self.mortgage_val[counter] = prop.mortgage_val
+                self.rents[counter][:4] = prop.rent_vals
+            elif prop.prop_type == Prop_Type.STATION:
+                self.cost[counter] = prop.cost
+                self.mortgage_val[counter] = prop.mortgage_val
+                self.rents[counter][:2] = prop.rent_mods
+            elif prop.prop_type == Prop_Type.PAYMENT:
+                self.rents[counter][0] = prop.surcharge
+            self.syncProp(counter, prop)
+
+        #Property types never change, so masks for each type are only made once
+        self.is_normal = self.prop_type == Prop_Type.NORMAL.value
+        self.is_school = self.prop_type == Prop_Type.SCHOOL.value
+        self.is_station = self.prop_type == Prop_Type.STATION.value
+        self.is_payment = self.prop_type == Prop_Type.PAYMENT.value
+        self.all_props = np.arange(no_of_props)
+
+    #Copy the attributes of a property that can change during a game into the arrays
+    def syncProp(self, b_pos, prop):
+        if prop.prop_type == Prop_Type.NORMAL or prop.prop_type == Prop_Type.SCHOOL or prop.prop_type == Prop_Type.STATION:
+            self.owner[b_pos] = prop.prop_owner
+            self.mortgaged[b_pos] = int(prop.mortgage_status)
+            if prop.prop_type == Prop_Type.NORMAL:
+                self.C_Houses[b_pos] = prop.C_Houses
+                self.T_Blocks[b_pos] = prop.T_Blocks
+
+    #Sum a value over the properties owned by each player, giving one total per player
+    def sumByOwner(self, values, no_of_players):
+        owned = self.owner >= 0
+        return np.bincount(self.owner[owned], weights=values[owned], minlength=no_of_players)[:no_of_players].astype(int)
+
+    #Number of properties of each type owned by each player; element [type value][player]
+    def countTypesOwned(self, no_of_players):
+        counts = np.zeros((len(Prop_Type) + 1, no_of_players), int)
+        owned = self.owner >= 0
+        np.add.at(counts, (self.prop_type[owned], self.owner[owned]), 1)
+        return counts
+
+    #Rent that would be charged for landing on every property, given its current owner, upgrades etc. and a dice roll (for stations)
+    #Same rules as Game.determineRent, except that it ignores who is landing on the property
+    def getRents(self, dice_roll, no_of_players=6):
+        owned = self.owner >= 0
+        ret_rents = np.zeros(len(self.owner), int)
+
+        #NORMAL: column 0-4 for the number of Council Houses, 5 if there is a Tower Block. Rent doubles if the whole group is owned and unimproved
+        normal = owned & self.is_normal
+        level = np.where(self.T_Blocks > 0, 5, self.C_Houses)
+        group_key = self.group_id[normal] * no_of_players + self.owner[normal] #One number for each (group, owner) pairing, so they can be counted with bincount
+        group_counts = np.bincount(group_key, minlength=len(self.group_sizes) * no_of_players)
+        whole_group = group_counts[group_key] == self.group_sizes[self.group_id[normal]]
+        ret_rents[normal] = self.rents[self.all_props[normal], level[normal]] * np.where(whole_group & (self.C_Houses[normal] == 0), 2, 1)
+
+        #SCHOOL and STATION: depends on how many of that type the owner has
+        school = owned & self.is_school
+        school_counts = np.bincount(self.owner[school], minlength=no_of_players)
+        ret_rents[school] = self.rents[self.all_props[school], school_counts[self.owner[school]] - 1]
+        station = owned & self.is_station
+        station_counts = np.bincount(self.owner[station], minlength=no_of_players)
+        ret_rents[station] = self.rents[self.all_props[station], station_counts[self.owner[station]] - 1] * dice_roll
+
+        ret_rents[owned & (self.mortgaged == 1)] = 0 #Mortgaged properties do not collect rent
+        ret_rents[self.is_payment] = self.rents[self.is_payment, 0]
+        return ret_rents
+
+    #What each player has spent on their properties and upgrades (see leaderboard.getAssetsVal)
+    def getAssetsVals(self, no_of_players):
+        return self.sumByOwner(self.cost + self.CH_cost * self.C_Houses + self.TB_cost * self.T_Blocks, no_of_players)
+
+    #What each player could get from selling all upgrades and mortgaging all unmortgaged properties (see lib.getObtainMon)
+    def getObtainMons(self, no_of_players):
+        upgrade_vals = (self.CH_cost * self.C_Houses) // 2 + (self.TB_cost * self.T_Blocks) // 2
+        return self.sumByOwner(upgrade_vals + self.mortgage_val * (1 - self.mortgaged), no_of_players)
+
+    #Total number of Council Houses and Tower Blocks owned by each player, as charged for by the upgrade-tax cards
+    def getUpgradeCounts(self, no_of_players):
+        return self.sumByOwner(self.C_Houses, no_of_players), self.sumByOwner(self.T_Blocks, no_of_players)
+
+    #Each player's money plus what they have spent on their properties and upgrades
+    def getNetWorths(self, players):
+        money = np.array([player.player_money for player in players])
+        return money + self.getAssetsVals(len(players))
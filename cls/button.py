@@ -1,4 +1,5 @@
 import pygame
+from imgcache import text_cache
 
 class Button:
     def __init__(self, x, y, w, h, cap, font, but_col = (100, 100, 100), txt_col = (0,0,0)):
@@ -13,11 +14,11 @@ class Button:
         
         self.but_rect = pygame.Rect(x, y, w, h)
 
-        f_width, f_height = self.but_font.size(self.but_caption)
+        f_width, f_height = text_cache.size(self.but_font, self.but_caption)
         self.txt_x = (self.but_w - f_width)/2 + self.but_x
         self.txt_y = (self.but_h - f_height)/2 + self.but_y
 
-        self.cap_text = self.but_font.render(self.but_caption, True, self.txt_col)
+        self.cap_text = text_cache.render(self.but_font, self.but_caption, True, self.txt_col)
 
     def render(self, screen):
         pygame.draw.rect(screen, self.but_col, self.but_rect)
@@ -39,8 +40,8 @@ class Button:
     def updateCap(self, new_cap):
         self.but_caption = new_cap
 
-        f_width, f_height = self.but_font.size(self.but_caption)
+        f_width, f_height = text_cache.size(self.but_font, self.but_caption)
         self.txt_x = (self.but_w - f_width)/2 + self.but_x
         self.txt_y = (self.but_h - f_height)/2 + self.but_y
 
-        self.cap_text = self.but_font.render(self.but_caption, True, self.txt_col)
\ No newline at end of file
+        self.cap_text = text_cache.render(self.but_font, self.but_caption, True, self.txt_col)
\ No newline at end of file
@@ -4,9 +4,12 @@ import random
 #------------------------------Card Deck Class------------------------------
 #Used for storing a deck of Pot Luck or Council Chest Cards; each card is of the Card class
 class Card_Deck:
-    def __init__(self, new_cards): #Simple constructor
+    def __init__(self, new_cards, new_rng=None): #Simple constructor
         self.card_arr = np.array(new_cards) #Array of Card objects
         self.deck_pointer = 0 #Stores which element of the array contains the card that should be presented to a player next
+        self.rng = new_rng #Game_RNG that the deck is shuffled with
+        if self.rng == None:
+            self.rng = random #Module has the same methods as Game_RNG
 
     def getCard(self, arr_index):
         return self.card_arr[arr_index]
@@ -20,5 +23,5 @@ class Card_Deck:
 
     def shuffleCards(self): #Makes used of the Knuth Shuffle alrogithm (aka Fisher-Yates shuffle)
         for outer in range(len(self.card_arr)-1, 0, -1):
-            rand = random.randrange(outer + 1) #Random index to swap with current element
+            rand = self.rng.randrange(outer + 1) #Random index to swap with current element
             self.card_arr[outer], self.card_arr[rand] = self.card_arr[rand], self.card_arr[outer] #Python-specific way of swapping two items without the use of a temp variable
@@ -1,16 +1,23 @@
 import numpy as np
 import random
+from imgcache import scaled_cache
 
 #------------------------------Dice Class------------------------------
 #Images and current state data for a single die. Two instances will be used in the game
 class Die:
-    def __init__(self, imgArr): #Simple constructor
+    def __init__(self, imgArr, new_rng=None): #Simple constructor
         self.cur_score = 0
         self.images = np.array(imgArr) #Array of loaded pygame images
+        self.rng = new_rng #Game_RNG that the die is rolled with
+        if self.rng == None:
+            self.rng = random #Module has the same methods as Game_RNG
 
-    def getImg(self):
+    #Image for the current score. If a size is given, the image is scaled to it through the shared cache, so each face is only ever resampled once
+    def getImg(self, size=None):
+        if size != None:
+            return scaled_cache.scale(self.images[self.cur_score - 1], size)
         return self.images[self.cur_score - 1] #-1 as indexing starts at 0; scores start at 1
 
     def roll(self):
-        self.cur_score = random.randint(1,6) #Random no between 1 and 6 as those are the available scores on a standard die
+        self.cur_score = self.rng.randint(1,6) #Random no between 1 and 6 as those are the available scores on a standard die
         
\ No newline at end of file
@@ -0,0 +1,158 @@
+from .property import Prop_Type
+
+#------------------------------Sim Policy Class------------------------------
+#Makes the decisions that a human player would make through the GUI when a game is played by a Turn_Engine
+#Decisions are kept simple on purpose so that results mainly reflect the economy in the data files rather than clever play
+#There is no trading between players, so if every player buys whatever they land on, colour groups end up split between players, nothing can be built,
+#and the game goes on until the turn limit. By default players therefore leave a colour group to whoever started it, so that whole groups (and so upgrades) come about
+class Sim_Policy:
+    def __init__(self, new_reserve=100, new_join_groups=False):
+        self.reserve = new_reserve #Money the player always tries to keep back after buying something
+        self.join_groups = new_join_groups #Whether to buy into colour groups that another player already owns part of (and none of which this player owns)
+
+    #Whether the current player should buy the (unowned) property that they are on
+    def shouldBuy(self, gameObj, prop):
+        if gameObj.getCurPlayer().player_money - prop.cost < self.reserve:
+            return False
+        if prop.prop_type == Prop_Type.NORMAL and self.join_groups == False:
+            b_pos = gameObj.getCurPlayer().player_pos
+            group_owned = 0 #Properties in the group owned by anyone
+            for g_pos in gameObj.board.getGroup(b_pos):
+                if gameObj.board.getProp(g_pos).prop_owner != -1:
+                    group_owned += 1
+            if group_owned > 0 and gameObj.board.countGroupSize(gameObj.cur_player, b_pos) == 0: #Someone else has started this group
+                return False
+        return True
+
+    #Whether the current player should buy the next upgrade for the group containing the property at b_pos
+    def shouldUpgrade(self, gameObj, b_pos):
+        u_prop = gameObj.board.getProp(b_pos)
+        if u_prop.C_Houses < 4:
+            up_cost = u_prop.CH_cost
+        else:
+            up_cost = u_prop.TB_cost
+        return gameObj.getCurPlayer().player_money - up_cost * gameObj.board.countGroupSize(gameObj.cur_player, b_pos) >= self.reserve
+
+    #Whether the current player should use their map, or pay £50, to get out of Bogside instead of trying to roll doubles
+    def shouldLeaveBogside(self, gameObj):
+        return gameObj.getCurPlayer().player_hasBogMap or gameObj.getCurPlayer().player_money - 50 >= self.reserve
+
+
+#------------------------------Turn Engine Class------------------------------
+#Plays a game from start to finish without any display, fonts or images, using the same Game methods as the main game screen
+#Used for running large numbers of games quickly, e.g. when balancing the values in 'data/Property Values.txt'
+#A game ends in one of three ways (see getEndReason): a player wins, a stalemate (nothing bought, built, mortgaged or lost for stalemate_turns turns), or the turn limit
+class Turn_Engine:
+    def __init__(self, new_game, new_policy=None, new_max_turns=2000, new_stalemate_turns=500):
+        self.game = new_game #Game object, normally created with new.createHeadlessGame
+        self.policy = new_policy #Sim_Policy object making the players' decisions
+        if self.policy == None:
+            self.policy = Sim_Policy()
+        self.max_turns = new_max_turns #Games are stopped after this many turns, as a game is not guaranteed to ever finish
+        self.stalemate_turns = new_stalemate_turns #Turns without any change to the properties after which the game is stopped as a stalemate (None to never stop)
+        self.turns_played = 0
+        self.last_change = 0 #Turn on which a property was last bought, upgraded or mortgaged, or a player last went bankrupt
+        self.bankrupt_order = [] #Indexes of players in the order that they went bankrupt
+        self.game.rent_collected = [0] * (self.game.board.max_pos + 1) #Game keeps a total of the rent paid on each square while it is being played by the engine
+
+    def isStalemate(self):
+        return self.stalemate_turns != None and self.turns_played - self.last_change >= self.stalemate_turns
+
+    #Game is over when only one player is left, it has reached a stalemate, or the turn limit has been reached
+    def isDone(self):
+        return self.game.countActivePlayers() < 2 or self.isStalemate() or self.turns_played >= self.max_turns
+
+    #How the game ended: 'won', 'stalemate' or 'turn_limit' ('playing' if it has not ended yet)
+    def getEndReason(self):
+        if self.game.countActivePlayers() < 2:
+            return 'won'
+        if self.isStalemate():
+            return 'stalemate'
+        if self.turns_played >= self.max_turns:
+            return 'turn_limit'
+        return 'playing'
+
+    #Index of the winning player, or -1 if the game has not (yet) been won
+    def getWinner(self):
+        if self.game.countActivePlayers() != 1:
+            return -1
+        for counter in range(len(self.game.players)):
+            if self.game.getPlayer(counter).player_active:
+                return counter
+
+    #Play the current player's whole turn, then move on to the next player. Returns whether the game can continue
+    def step(self):
+        if self.isDone():
+            return False
+        game = self.game
+
+        if game.getCurPlayer().player_inJail and self.policy.shouldLeaveBogside(game):
+            game.leaveBogside()
+
+        while game.controller.player_rolled == False: #Player keeps rolling for as long as they roll doubles
+            game.rollDice()
+            game.useCard() #Cards must be used before the turn can end, so are used straight away
+
+            cur_prop = game.getCurProp()
+            if cur_prop.prop_type == Prop_Type.NORMAL or cur_prop.prop_type == Prop_Type.SCHOOL or cur_prop.prop_type == Prop_Type.STATION:
+                if cur_prop.prop_owner == -1 and self.policy.shouldBuy(game, cur_prop):
+                    if game.buyCurProp():
+                        self.last_change = self.turns_played
+
+        self.buyUpgrades()
+        self.endTurn()
+        self.turns_played += 1
+        return not self.isDone()
+
+    #Play turns until the game is over. Returns the index of the winner (-1 if there was a stalemate or the turn limit was reached first)
+    def playUntilDone(self):
+        while self.step():
+            pass
+        return self.getWinner()
+
+    #Buy upgrades for any whole colour groups the current player owns, as long as the policy allows it
+    #Only the player's own properties are looked at (in board order, from their Portfolio), rather than every square on the board
+    def buyUpgrades(self):
+        game = self.game
+        portfolio = game.board.getPortfolio(game.cur_player)
+        ups_before = portfolio.C_Houses + portfolio.T_Blocks
+        for counter in portfolio.owned: #Buying upgrades never changes who owns what, so the list can be looped over directly
+            u_prop = game.board.getProp(counter)
+            if u_prop.prop_type == Prop_Type.NORMAL and u_prop.T_Blocks == 0:
+                if game.board.wholeGroupOwned(game.cur_player, counter) and self.policy.shouldUpgrade(game, counter):
+                    game.buyUpgrade(counter)
+        if portfolio.C_Houses + portfolio.T_Blocks != ups_before:
+            self.last_change = self.turns_played
+
+    #Sell upgrades, then mortgage properties, until the current player is out of debt or has nothing left to sell
+    def raiseFunds(self):
+        game = self.game
+        for counter in range(game.board.max_pos + 1):
+            s_prop = game.board.getProp(counter)
+            if s_prop.prop_type == Prop_Type.NORMAL and s_prop.prop_owner == game.cur_player:
+                while game.getCurPlayer().player_money < 0 and s_prop.C_Houses + s_prop.T_Blocks > 0:
+                    ups_before = s_prop.C_Houses + s_prop.T_Blocks
+                    game.sellUpgrade(counter)
+                    if s_prop.C_Houses + s_prop.T_Blocks == ups_before: #Upgrades could not be sold
+                        break
+
+        for counter in range(game.board.max_pos + 1):
+            if game.getCurPlayer().player_money >= 0:
+                return
+            m_prop = game.board.getProp(counter)
+            if m_prop.prop_type == Prop_Type.NORMAL or m_prop.prop_type == Prop_Type.SCHOOL or m_prop.prop_type == Prop_Type.STATION:
+                if m_prop.prop_owner == game.cur_player and m_prop.mortgage_status == False:
+                    game.toggleMortgage(counter)
+
+    #Equivalent of clicking End Turn: the player must get out of debt or go bankrupt, then play passes to the next player
+    def endTurn(self):
+        game = self.game
+        if game.getCurPlayer().player_money < 0:
+            self.last_change = self.turns_played #Upgrades will be sold or properties mortgaged, or the player will go bankrupt
+            self.raiseFunds()
+            if game.getCurPlayer().player_money < 0: #Impossible for the player to not end up in debt, so they go bankrupt
+                game.bankruptCurPlayer()
+                self.bankrupt_order.append(game.cur_player)
+
+        if game.countActivePlayers() >= 2:
+            game.advancePlayer()
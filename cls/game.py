@@ -1,11 +1,13 @@
 import numpy as np
-import pygame
+import hashlib
+import time
 from .property import Prop_Type
+from savefile import writeSave, formatText, save_writer, TurnJournal, clearJournal
 
 #------------------------------Game Class------------------------------
 #Brings all the game data together into one cohesive object that can be controlled more easily than all other data/objects independently
 class Game:
-    def __init__(self, new_players, new_dice, new_board, new_save, new_auto=True):
+    def __init__(self, new_players, new_dice, new_board, new_save, new_auto=True, new_rng=None):
         self.players = np.array(new_players) #The 2-6 players of the game
         self.dice = np.array(new_dice) #Game's two dice
         self.cur_player = 0 #Index of current player in he players array
@@ -15,6 +17,11 @@ class Game:
         self.controller = Game_Controller()
         self.autosave = new_auto
         self.pause = False #Whether the background music is paused of not
+        self.rng = new_rng #Game_RNG that the dice and decks draw from, so the game can be replayed from its seed
+        self.actions = None #Every action taken in the game as [method name, arguments...], if the game is being recorded (see replay.py)
+        self.journal = None #TurnJournal of events since the last save, made when the first event happens with autosave on
+        self.rent_collected = None #Total rent/charges paid on each board position. Only kept if this is set to a list (e.g. by Turn_Engine for simulation statistics)
+        self.state_version = 0 #Goes up by one with every change to the game (see logEvent), so screens can keep what they have worked out until it changes
 
     def getCurPlayer(self):
         return self.players[self.cur_player]
@@ -23,16 +30,23 @@ class Game:
         return self.board.getProp(self.getCurPlayer().player_pos)
 
     def advancePlayer(self): #Next player's turn
+        self.recordAction('advancePlayer')
+        self.nextPlayer()
+
+    #Moves play on to the next player who can take a turn; calls itself for players who are missing turns, so is not recorded as an action itself
+    def nextPlayer(self):
         self.cur_player += 1
         self.controller.reset()
         if self.cur_player > len(self.players)-1:
             self.cur_player = 0 #Restart from first player
             if self.autosave: #If game is set to autosave, it does so every time the player loop back to the first player
-                self.saveGame()
+                self.autosaveGame()
+        self.logEvent('turn', [self.cur_player])
         if self.players[self.cur_player].player_turnsToMiss > 0 or self.players[self.cur_player].player_active == False:
             if self.players[self.cur_player].player_turnsToMiss > 0:
                 self.players[self.cur_player].setMissTurns(self.players[self.cur_player].player_turnsToMiss - 1) #Player is skipped; the number of turns still to be missed decrements
-            self.advancePlayer() #Recursively call function to try and advance to the player after the one missing a turn
+                self.logEvent('miss_turn', [self.cur_player], [self.cur_player])
+            self.nextPlayer() #Recursively call function to try and advance to the player after the one missing a turn
 
     def getPlayer(self, p_num): #Return a specific player
         return self.players[p_num]
@@ -51,30 +65,79 @@ class Game:
         return self.dice[0].cur_score + self.dice[1].cur_score
 
     #Save all data required to restart the game at a later date to the game's save file
-    def saveGame(self):
-        #',' is used to separate data within lines
-        #'\n' is used to identify the end of a line, so that the next lot of data written to the file will be on a new line
-        #Booleans are saved as a 0 or 1, where 0 is false and 1 true. This is because bool('False') returns True, meaning that saving them as strings does not allow for them to be read in with any real amount of ease.
-        fh = open(self.save_path, 'w')
-        fh.write(str(self.cur_player) + ',' + str(len(self.players)) + ',' + str(int(self.autosave)) + '\n') #Save the game class data
+    #Rows of data that are saved for this game; the layout of each row is described in savefile/savefile.py
+    def getSaveRows(self):
+        rows = [[self.cur_player, len(self.players), int(self.autosave)]] #Game class data
 
         for counter in range(len(self.players)):
-            cur_player = self.players[counter]
-            #Write all volatile data for the current player to a new line in the file
-            fh.write(cur_player.player_name + ',' + str(cur_player.player_money) + ',' + str(cur_player.player_pos) + ',' + str(cur_player.player_piece.piece_num) + ',' + str(int(cur_player.player_hasBogMap)) + ',' + str(cur_player.player_nextRollMod) + ',' + str(cur_player.player_turnsToMiss) + ',' + str(int(cur_player.player_active)) + ',' + str(int(cur_player.player_inJail)) + '\n')
+            rows.append(self.getPlayerRow(counter))
 
         for counter in range(self.board.max_pos+1):
-            if self.board.getProp(counter).prop_type == Prop_Type.NORMAL: #NORMAL properties have different attributes that change in-game
-                if self.board.getProp(counter).prop_owner != -1: #Nothing will have changed of the property is not owned
-                    #Write all important/changing data for a NORMAL property on a new line
-                    fh.write(str(counter) + ',' + str(self.board.getProp(counter).prop_owner) + ',' + str(self.board.getProp(counter).C_Houses) + ',' + str(self.board.getProp(counter).T_Blocks) + ',' + str(int(self.board.getProp(counter).mortgage_status)) + '\n')
-                    
-            if self.board.getProp(counter).prop_type == Prop_Type.SCHOOL or self.board.getProp(counter).prop_type == Prop_Type.STATION: #SCHOOL and STATION properties have slightly different changing attributes than NORMAL ones
+            if self.board.getProp(counter).prop_type == Prop_Type.NORMAL or self.board.getProp(counter).prop_type == Prop_Type.SCHOOL or self.board.getProp(counter).prop_type == Prop_Type.STATION:
                 if self.board.getProp(counter).prop_owner != -1: #Nothing will have changed of the property is not owned
-                    #Write all important/changing data for a SCHOOL or STATION property on a new line
-                    fh.write(str(counter) + ',' + str(self.board.getProp(counter).prop_owner) + ',' + str(int(self.board.getProp(counter).mortgage_status)) + '\n')
-                    
-        fh.close() #Close file
+                    rows.append(self.getPropRow(counter))
+        return rows
+
+    #Save row holding all volatile data for a player
+    def getPlayerRow(self, p_num):
+        s_player = self.players[p_num]
+        return [s_player.player_name, int(s_player.player_money), int(s_player.player_pos), s_player.player_piece.piece_num, int(s_player.player_hasBogMap), int(s_player.player_nextRollMod), int(s_player.player_turnsToMiss), int(s_player.player_active), int(s_player.player_inJail)] #Card effects can leave NumPy ints behind, hence int()
+
+    #Save row holding all important/changing data for a property
+    def getPropRow(self, b_pos):
+        s_prop = self.board.getProp(b_pos)
+        if s_prop.prop_type == Prop_Type.NORMAL: #NORMAL properties have different attributes that change in-game
+            return [b_pos, int(s_prop.prop_owner), s_prop.C_Houses, s_prop.T_Blocks, int(s_prop.mortgage_status)]
+        return [b_pos, int(s_prop.prop_owner), int(s_prop.mortgage_status)] #SCHOOL and STATION properties have slightly different changing attributes than NORMAL ones
+
+    #Save the game to its save file, as text for a .dfo file or binary for a .dfb file
+    def saveGame(self):
+        save_writer.flush() #Any autosave still being written must finish first, or it could replace this newer save
+        writeSave(self.save_path, self.getSaveRows())
+        if self.journal != None and self.journal.save_path == self.save_path: #Everything in the journal is now in the save file
+            self.journal.compact(self.journal.markSnapshot())
+        else: #Any journal left at this path (e.g. by an earlier game saved to the same file) must not be played back on top of this save
+            clearJournal(self.save_path)
+
+    #Save the game in the background: a snapshot of the save rows is taken now and written to the file by the shared SaveWriter thread
+    def autosaveGame(self):
+        start = time.perf_counter()
+        rows = tuple(tuple(row) for row in self.getSaveRows()) #Tuples, so the snapshot cannot change while it is being written
+        on_written = None
+        if self.journal != None and self.journal.save_path == self.save_path:
+            journal = self.journal
+            upto_seq = journal.markSnapshot()
+            on_written = lambda: journal.compact(upto_seq) #Events up to now are in the snapshot, so can be removed from the journal once it is written
+        save_writer.submit(self.save_path, rows, time.perf_counter() - start, on_written)
+
+    #Start keeping a list of every action taken from now on. Together with the seed of the game's Game_RNG, this is enough to play the game again exactly
+    def startRecording(self):
+        self.actions = []
+
+    #Add an action to the recording, if there is one. Called by every method that a player's decision leads to, so those are all that a replay needs
+    def recordAction(self, name, *args):
+        if self.actions != None:
+            self.actions.append([name] + [int(arg) for arg in args])
+
+    #Hash of everything that is saved about the game, plus the dice and the positions in the decks, for checking that a replay ended up in the same state
+    def getStateHash(self):
+        state_text = formatText(self.getSaveRows()) + str([self.getDie(0).cur_score, self.getDie(1).cur_score, self.board.PL_Deck.deck_pointer, self.board.CC_Deck.deck_pointer])
+        return hashlib.sha256(state_text.encode('utf-8')).hexdigest()
+
+    #Add an event to the game's TurnJournal (see savefile/journal.py), with the rows of the players and properties that it changed
+    #Only kept while autosave is on, as it is played back on top of the save file when the game is loaded
+    #Every method that changes the game (money, purchases, upgrades, mortgages, bankruptcy, moves) logs an event, so this is also where state_version goes up
+    def logEvent(self, kind, args, player_nums=[], prop_nums=[]):
+        self.state_version += 1
+        if not self.autosave or self.save_path == None:
+            return
+        if self.journal == None or self.journal.save_path != self.save_path: #First event, or the game is now being saved somewhere else
+            if self.journal != None:
+                self.journal.close()
+            self.journal = TurnJournal(self.save_path)
+        self.journal.append(kind, args, [[p_num] + self.getPlayerRow(p_num) for p_num in player_nums], [self.getPropRow(b_pos) for b_pos in prop_nums], self.cur_player)
+        if self.journal.needsCompacting():
+            self.autosaveGame()
 
     def determineRent(self):
         ret_rent = 0
@@ -92,11 +155,162 @@ class Game:
             ret_rent = self.board.getProp(self.getCurPlayer().player_pos).surcharge
         return ret_rent
 
+    #Charge the current player the rent for the property they are on (if any), and credit the owner of the property that amount
+    def chargeRent(self):
+        self.controller.turn_rent = self.determineRent()
+
+        if self.controller.turn_rent != 0:
+            if self.rent_collected != None:
+                self.rent_collected[self.getCurPlayer().player_pos] += int(self.controller.turn_rent)
+            self.getCurPlayer().spendMoney(self.controller.turn_rent) #Decrease the player's money
+            if self.getCurProp().prop_type != Prop_Type.PAYMENT: #PAYMENT properties have no owner to credit
+                self.getPlayer(self.getCurProp().prop_owner).addMoney(self.controller.turn_rent)
+                self.logEvent('rent', [self.getCurPlayer().player_pos, int(self.controller.turn_rent)], [self.cur_player, self.getCurProp().prop_owner])
+            else:
+                self.logEvent('rent', [self.getCurPlayer().player_pos, int(self.controller.turn_rent)], [self.cur_player])
+
+    #Roll the dice and carry out everything that follows from it: moving the piece, paying rent, drawing a card and being sent to Bogside
+    #Contains no drawing code so the same turn logic is used by both the main game screen and the headless Turn_Engine
+    def rollDice(self):
+        self.recordAction('rollDice')
+        self.getDie(0).roll()
+        self.getDie(1).roll()
+        dice_total = self.getDiceTotal()
+        doubles = self.getDie(0).cur_score == self.getDie(1).cur_score
+        self.logEvent('roll', [self.getDie(0).cur_score, self.getDie(1).cur_score])
+
+        if self.getCurPlayer().player_inJail == False:
+            self.getCurPlayer().movePlayer(dice_total, self.board)
+            self.logEvent('move', [self.getCurPlayer().player_pos], [self.cur_player])
+        elif doubles: #Doubles rolled, so player gets out of bogside
+            self.getCurPlayer().leaveJail()
+            self.getCurPlayer().movePlayer(dice_total, self.board)
+            self.logEvent('move', [self.getCurPlayer().player_pos], [self.cur_player])
+        #Player does not move otherwise, as they must be lost in bogside
+
+        if not doubles: #If a double has not been rolled (rolling a double gives the player another turn)
+            self.controller.player_rolled = True
+        else:
+            self.controller.cur_doubles += 1
+        self.controller.may_buy = True
+
+        if self.controller.cur_doubles >= 3: #If player rolls 3 consecutive doubles, they go to Bogside
+            self.sendCurPlayerToBog()
+            self.controller.player_rolled = True #Will not get to roll again
+
+        self.chargeRent() #Determine rent if applicable
+
+        #If the current space returns a card
+        if self.getCurProp().prop_type == Prop_Type.POT_LUCK:
+            self.controller.cur_card = self.board.PL_Deck.getNextCard()
+        elif self.getCurProp().prop_type == Prop_Type.COUNCIL_CHEST:
+            self.controller.cur_card = self.board.CC_Deck.getNextCard()
+
+        if self.getCurProp().prop_type == Prop_Type.POT_LUCK or self.getCurProp().prop_type == Prop_Type.COUNCIL_CHEST: #Card will have been returned, and must be used before the turn can end
+            self.controller.card_effs = self.controller.cur_card.card_nums
+            self.controller.card_used = False
+
+        #If the player lands on the 'Go To Bogside' space
+        if self.getCurProp().prop_type == Prop_Type.GO_TO_BOGSIDE:
+            self.sendCurPlayerToBog()
+
+    #Apply the effects of the card drawn this turn, if there is one that has not yet been used
+    def useCard(self):
+        self.recordAction('useCard')
+        if self.controller.cur_card != None and self.controller.card_used == False:
+            self.controller.card_used = True
+            self.applyCardEffects()
+
+    #Current player buys the property they are on. Returns whether the purchase actually went through
+    def buyCurProp(self):
+        self.recordAction('buyCurProp')
+        cur_prop = self.getCurProp()
+        if cur_prop.prop_type != Prop_Type.NORMAL and cur_prop.prop_type != Prop_Type.SCHOOL and cur_prop.prop_type != Prop_Type.STATION: #Final check that the property can actually be owned
+            return False
+        if cur_prop.prop_owner != -1 or self.getCurPlayer().player_money < cur_prop.cost: #Must be unowned and the player must have enough money
+            return False
+        self.getCurPlayer().spendMoney(cur_prop.cost) #Decrease the player's bank balance accordingly
+        self.board.buyProperty(self.getCurPlayer().player_pos, self.cur_player) #Change the property's status to track the new ownership
+        self.logEvent('buy', [self.getCurPlayer().player_pos, int(cur_prop.cost)], [self.cur_player], [self.getCurPlayer().player_pos])
+        return True
+
+    #Mortgage a property owned by the current player, or buy it back (for 120% of the mortgage value) if it is already mortgaged
+    def toggleMortgage(self, b_pos):
+        self.recordAction('toggleMortgage', b_pos)
+        m_prop = self.board.getProp(b_pos)
+        if m_prop.prop_type != Prop_Type.NORMAL and m_prop.prop_type != Prop_Type.SCHOOL and m_prop.prop_type != Prop_Type.STATION: #Final check that the property is one that may be mortgaged
+            return
+        if m_prop.prop_owner != self.cur_player: #Property must be owned by the current player
+            return
+        if m_prop.mortgage_status == False: #Unmortgaged
+            self.board.setMortgage(b_pos, True) #Mortgage property
+            self.getCurPlayer().addMoney(int(m_prop.mortgage_val)) #Increase the player's money by the mortgage value of the property
+        elif self.getCurPlayer().player_money >= m_prop.mortgage_val * 1.2: #Player has sufficient money to buy back the property
+            self.board.setMortgage(b_pos, False) #Unmortgage the property
+            self.getCurPlayer().spendMoney(int(m_prop.mortgage_val * 1.2)) #Debit the player's money by 120% of the mortgage value
+        self.logEvent('mortgage', [b_pos, int(m_prop.mortgage_status)], [self.cur_player], [b_pos])
+
+    #Buy the next upgrade (Council House, or Tower Block once 4 CH are owned) for every property in the group of the property at b_pos
+    def buyUpgrade(self, b_pos):
+        self.recordAction('buyUpgrade', b_pos)
+        u_prop = self.board.getProp(b_pos)
+        if u_prop.prop_type != Prop_Type.NORMAL or u_prop.prop_owner != self.cur_player or self.board.wholeGroupOwned(self.cur_player, b_pos) == False: #Upgrades may only be bought if the entire colour group is owned
+            return
+        group_size = self.board.countGroupSize(self.cur_player, b_pos)
+        if u_prop.C_Houses < 4: #Fewer than 4 Council Houses, so these are the next upgrade to be bought
+            if self.getCurPlayer().player_money >= u_prop.CH_cost * group_size: #Player actually has enough money to buy the Council House upgrade
+                self.board.buyCHGroup(self.cur_player, b_pos) #Buy the Council Houses for the whole group
+                self.getCurPlayer().spendMoney(u_prop.CH_cost * group_size) #Decrease the player's money by the cost of a Council House for however many properties are in the group
+        elif u_prop.T_Blocks == 0: #4 Council Houses and no Tower Blocks, so Tower Block can be bought
+            if self.getCurPlayer().player_money >= u_prop.TB_cost * group_size: #Player actually has enough money to buy the Tower Block upgrade
+                self.board.buyTBGroup(self.cur_player, b_pos) #Buy the Tower Blocks for the whole group
+                self.getCurPlayer().spendMoney(u_prop.TB_cost * group_size)
+        self.logEvent('upgrade', [b_pos, u_prop.C_Houses, u_prop.T_Blocks], [self.cur_player], self.board.getGroup(b_pos))
+
+    #Sell one upgrade (Tower Block first, then Council Houses) from every property in the group of the property at b_pos, for half of what it was bought for
+    def sellUpgrade(self, b_pos):
+        self.recordAction('sellUpgrade', b_pos)
+        u_prop = self.board.getProp(b_pos)
+        if u_prop.prop_type != Prop_Type.NORMAL or u_prop.prop_owner != self.cur_player or self.board.wholeGroupOwned(self.cur_player, b_pos) == False:
+            return
+        group_size = self.board.countGroupSize(self.cur_player, b_pos)
+        if u_prop.T_Blocks > 0: #Property has a Tower Block that can be sold
+            self.board.sellTBGroup(self.cur_player, b_pos) #Sell the Tower Blocks for the whole group
+            self.getCurPlayer().addMoney(int(u_prop.TB_cost/2 * group_size)) #Increase the player's money by half of what the upgrades were bought for
+        elif u_prop.C_Houses > 0: #No Tower Blocks, but some Council Houses which can instead be sold
+            self.board.sellCHGroup(self.cur_player, b_pos) #Sell the Council Houses for the whole group
+            self.getCurPlayer().addMoney(int(u_prop.CH_cost/2 * group_size))
+        self.logEvent('upgrade', [b_pos, u_prop.C_Houses, u_prop.T_Blocks], [self.cur_player], self.board.getGroup(b_pos))
+
+    #Current player leaves Bogside, either by using their Map out of Bogside or paying £50 for one
+    def leaveBogside(self):
+        self.recordAction('leaveBogside')
+        if self.getCurPlayer().player_inJail and (self.getCurPlayer().player_money >= 50 or self.getCurPlayer().player_hasBogMap):
+            self.getCurPlayer().leaveJail()
+            if self.getCurPlayer().player_hasBogMap == False:
+                self.getCurPlayer().spendMoney(50)
+            else:
+                self.getCurPlayer().useBogMap()
+            self.logEvent('leave_bogside', [], [self.cur_player])
+
+    #Remove the current player from the game, returning all of their properties to the bank unmortgaged and without upgrades
+    def bankruptCurPlayer(self):
+        self.recordAction('bankruptCurPlayer')
+        self.getCurPlayer().deactivate()
+        released = []
+        for counter in range(self.board.max_pos + 1):
+            if self.board.getProp(counter).prop_type == Prop_Type.NORMAL or self.board.getProp(counter).prop_type == Prop_Type.SCHOOL or self.board.getProp(counter).prop_type == Prop_Type.STATION:
+                if self.board.getProp(counter).prop_owner == self.cur_player:
+                    self.board.releaseProperty(counter)
+                    released.append(counter)
+        self.logEvent('bankrupt', [], [self.cur_player], released)
+
     def sendCurPlayerToBog(self):
         self.getCurPlayer().player_pos = self.board.bogside_pos #Move the player
         self.getCurPlayer().player_piece.piece_x = self.players[0].calcPieceX(self.board.bogside_pos, self.board.board_sf)
         self.getCurPlayer().player_piece.piece_y = self.players[0].calcPieceY(self.board.bogside_pos, self.board.board_sf)
         self.getCurPlayer().enterJail()
+        self.logEvent('bogside', [], [self.cur_player])
 
     #Apply the effects of a certain card
     def applyCardEffects(self):
@@ -123,13 +337,7 @@ class Game:
             self.getCurPlayer().player_piece.piece_x = self.getCurPlayer().calcPieceX(self.getCurPlayer().player_pos, self.board.board_sf)
             self.getCurPlayer().player_piece.piece_y = self.getCurPlayer().calcPieceY(self.getCurPlayer().player_pos, self.board.board_sf)
 
-            #Determine rent if applicable
-            self.controller.turn_rent = self.determineRent()
-
-            if self.controller.turn_rent != 0:
-                self.getCurPlayer().spendMoney(self.controller.turn_rent) #Decrease the player's money and credit the owner of the property that amount
-                if self.board.getProp(self.getCurPlayer().player_pos).prop_type != Prop_Type.PAYMENT:
-                    self.getPlayer(self.board.getProp(self.getCurPlayer().player_pos).prop_owner).addMoney(self.controller.turn_rent)
+            self.chargeRent() #Determine rent if applicable
         if card_effects[5] != -1: #Move to a certain spot (and collect money if passing Job Centre)
             orig_pos = self.getCurPlayer().player_pos
             self.getCurPlayer().player_pos = card_effects[5]
@@ -138,52 +346,27 @@ class Game:
             if self.getCurPlayer().player_pos < orig_pos: #Means player must have 'passed' the Job Centre
                 self.getCurPlayer().addMoney(self.board.JC_Money)
 
-            #Determine rent if applicable
-            self.controller.turn_rent = self.determineRent()
-
-            if self.controller.turn_rent != 0:
-                self.getCurPlayer().spendMoney(self.controller.turn_rent) #Decrease the player's money and credit the owner of the property that amount
-                if self.board.getProp(self.getCurPlayer().player_pos).prop_type != Prop_Type.PAYMENT:
-                    self.getPlayer(self.board.getProp(self.getCurPlayer().player_pos).prop_owner).addMoney(self.controller.turn_rent)
+            self.chargeRent() #Determine rent if applicable
         if card_effects[6] != -1: #Move to a certain spot (but do not collect money if passing Job Centre)
             self.getCurPlayer().player_pos = card_effects[6]
             self.getCurPlayer().player_piece.piece_x = self.getCurPlayer().calcPieceX(self.getCurPlayer().player_pos, self.board.board_sf)
             self.getCurPlayer().player_piece.piece_y = self.getCurPlayer().calcPieceY(self.getCurPlayer().player_pos, self.board.board_sf)
 
-            #Determine rent if applicable
-            self.controller.turn_rent = self.determineRent()
-
-            if self.controller.turn_rent != 0:
-                self.getCurPlayer().spendMoney(self.controller.turn_rent) #Decrease the player's money and credit the owner of the property that amount
-                if self.board.getProp(self.getCurPlayer().player_pos).prop_type != Prop_Type.PAYMENT:
-                    self.getPlayer(self.board.getProp(self.getCurPlayer().player_pos).prop_owner).addMoney(self.controller.turn_rent)
+            self.chargeRent() #Determine rent if applicable
         if card_effects[7] != -1: #Go to Bogside
             self.sendCurPlayerToBog()
         if card_effects[8] != -1: #Collect a Map out of Bogside
             self.getCurPlayer().giveBogMap()
         if card_effects[9] != -1: #Pay a certain amount of money for each Council House and Tower Block
-            to_pay = 0
-            for counter in range(self.board.max_pos+1):
-                if self.board.getProp(counter).prop_type == Prop_Type.NORMAL: #Only NORMAL properties acutually possess these upgrades
-                    if self.board.getProp(counter).prop_owner == self.cur_player: #The current property is owned by this player
-                        to_pay += card_effects[9] * (self.board.getProp(counter).C_Houses + self.board.getProp(counter).T_Blocks) #Sum the number of CH and TB
-            self.getCurPlayer().spendMoney(to_pay)
+            cur_portfolio = self.board.getPortfolio(self.cur_player) #Holds the total number of each upgrade owned by this player
+            self.getCurPlayer().spendMoney(card_effects[9] * (cur_portfolio.C_Houses + cur_portfolio.T_Blocks))
         if card_effects[10] != -1: #Next dice roll's value is decreased
             self.getCurPlayer().setRollMod(card_effects[10])
         if card_effects[11] != -1: #Pay a certain amount of money for each Council House only
-            to_pay = 0
-            for counter in range(self.board.max_pos+1):
-                if self.board.getProp(counter).prop_type == Prop_Type.NORMAL: #Only NORMAL properties acutually possess these upgrades
-                    if self.board.getProp(counter).prop_owner == self.cur_player: #The current property is owned by this player
-                        to_pay += card_effects[11] * self.board.getProp(counter).C_Houses #Sum the number of CH
-            self.getCurPlayer().spendMoney(to_pay)
+            self.getCurPlayer().spendMoney(card_effects[11] * self.board.getPortfolio(self.cur_player).C_Houses)
         if card_effects[12] != -1: #Pay a certain amount of money for each Tower Block only
-            to_pay = 0
-            for counter in range(self.board.max_pos+1):
-                if self.board.getProp(counter).prop_type == Prop_Type.NORMAL: #Only NORMAL properties acutually possess these upgrades
-                    if self.board.getProp(counter).prop_owner == self.cur_player: #The current property is owned by this player
-                        to_pay += card_effects[12] * self.board.getProp(counter).T_Blocks #Sum the number of TB
-            self.getCurPlayer().spendMoney(to_pay)
+            self.getCurPlayer().spendMoney(card_effects[12] * self.board.getPortfolio(self.cur_player).T_Blocks)
+        self.logEvent('card', [[int(value) for value in card_effects]], range(len(self.players))) #Card may have changed the money of every player
 
 
 #------------------------------Game_Controller Class------------------------------
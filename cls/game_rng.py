@@ -0,0 +1,21 @@
+import hashlib
+import random
+
+#------------------------------Game RNG Class------------------------------
+#Stream of random numbers belonging to one game, so that a game can be played again exactly from its seed (see replay.py)
+#The dice and each deck are given their own substream, so that e.g. a change to how decks are shuffled does not change any dice rolls
+#Has the same randint and randrange methods as the random module, which is still used for anything outside of a game
+class Game_RNG:
+    def __init__(self, new_seed=None):
+        if new_seed == None:
+            new_seed = random.getrandbits(63) #Taken from the random module, so seeding that still fixes a whole game
+        self.seed = new_seed
+        self.generator = random.Random(new_seed)
+        self.randint = self.generator.randint #Bound directly, as dice are rolled thousands of times a second in simulations
+        self.randrange = self.generator.randrange
+
+    #Independent stream worked out from this stream's seed and a name or number, e.g. one per deck, or one per game played by a simulation worker
+    #The same seed and name always give the same substream, and drawing from one stream never changes what any other produces
+    def getSubstream(self, name):
+        digest = hashlib.sha256((str(self.seed) + '/' + str(name)).encode('utf-8')).digest()
+        return Game_RNG(int.from_bytes(digest[:8], 'little') >> 1)
@@ -0,0 +1,135 @@
+import numpy as np
+from .property import Prop_Type
+from .board_arrays import Board_Arrays
+
+#------------------------------Landing Chain Class------------------------------
+#Works out exactly how often each square is landed on, by treating a player's position as a Markov chain rather than simulating games
+#Follows the same rules as Game.rollDice and Game.applyCardEffects:
+#   - Two dice are rolled; doubles give another roll, and a third double in a row sends the player to Bogside without landing anywhere
+#   - Landing on Go To Bogside sends the player to Bogside
+#   - In Bogside, a player either leaves at the start of their turn (Map out of Bogside or £50) or stays until they roll doubles, which they then move by
+#   - Pot Luck and Council Chest cards that move the player (effects 4-7 in the Master files) are drawn with equal chance from the board's decks.
+#     As in applyCardEffects, a card that moves the player charges rent where they end up but never draws another card or sends them to Bogside from Go To Bogside
+#   - Rolling doubles still gives another roll after being sent to Bogside by a card or Go To Bogside, just as in rollDice
+#Cards that change the next roll or make the player miss turns are not modelled, as they do not move the player
+#A chain state is a board position plus whether the player is in Bogside, giving 2*(max_pos+1) states; state (max_pos+1)+pos means in Bogside at pos
+class Landing_Chain:
+    def __init__(self, board, new_leave_prob=0.0):
+        self.board = board
+        self.no_of_squares = board.max_pos + 1
+        self.leave_prob = new_leave_prob #Chance that a player in Bogside pays (or uses a map) to leave at the start of their turn, rather than trying to roll doubles
+
+        self.roll_outcomes = [] #(probability, total, doubles) for every distinct result of rolling two dice
+        for die1 in range(1, 7):
+            for die2 in range(1, 7):
+                self.roll_outcomes.append((1/36, die1 + die2, die1 == die2))
+
+        self.turn_matrix, self.turn_landings, self.turn_dice_landings = self.buildTurnMatrices()
+        self.state_probs = self.solveStationary() #Long-run chance of a turn starting in each state
+        self.end_probs = self.state_probs[:self.no_of_squares] + self.state_probs[self.no_of_squares:] #Long-run chance of a player being on each square between turns
+        self.landing_rates = self.state_probs @ self.turn_landings #Expected number of times each square is landed on (and so charges rent) per turn
+        self.dice_landing_rates = self.state_probs @ self.turn_dice_landings #As above, but each landing weighted by the dice total of the roll that caused it (for station rents)
+        self.rents = Board_Arrays(self.board).rents #Rent table for every square; columns have the same meaning as in Board_Arrays
+
+    #Every way that arriving on a square can play out: a list of (probability, squares landed on, final position, sent to Bogside)
+    def resolveLanding(self, b_pos):
+        prop_type = self.board.getProp(b_pos).prop_type
+        if prop_type == Prop_Type.GO_TO_BOGSIDE:
+            return [(1, [b_pos], self.board.bogside_pos, True)]
+        if prop_type != Prop_Type.POT_LUCK and prop_type != Prop_Type.COUNCIL_CHEST:
+            return [(1, [b_pos], b_pos, False)]
+
+        if prop_type == Prop_Type.POT_LUCK:
+            deck = self.board.PL_Deck
+        else:
+            deck = self.board.CC_Deck
+        ret_outcomes = []
+        for counter in range(len(deck.card_arr)):
+            card_effects = deck.getCard(counter).card_nums
+            landed = [b_pos]
+            new_pos = b_pos
+            jailed = False
+            if card_effects[4] != -1: #Move a number of spaces
+                new_pos = (new_pos + card_effects[4]) % self.no_of_squares
+                landed.append(new_pos)
+            if card_effects[5] != -1: #Move to a certain spot (collecting money when passing the Job Centre, which does not affect movement)
+                new_pos = card_effects[5]
+                landed.append(new_pos)
+            if card_effects[6] != -1: #Move to a certain spot without passing the Job Centre
+                new_pos = card_effects[6]
+                landed.append(new_pos)
+            if card_effects[7] != -1: #Go to Bogside
+                new_pos = self.board.bogside_pos
+                jailed = True
+            ret_outcomes.append((1 / len(deck.card_arr), landed, new_pos, jailed))
+        return ret_outcomes
+
+    #Build the matrices for one whole turn: the chance of moving from each start state to each end state,
+    #and the expected landings on each square (plain and weighted by dice total) during the turn
+    def buildTurnMatrices(self):
+        squares = self.no_of_squares
+        no_of_states = 2 * squares
+        #Within a turn, a roll state also records how many doubles have been rolled so far (0-2): index is doubles*no_of_states + state
+        roll_next = np.zeros((3 * no_of_states, 3 * no_of_states)) #Chance of rolling again from each roll state
+        roll_end = np.zeros((3 * no_of_states, no_of_states)) #Chance of the turn ending in each state
+        roll_landings = np.zeros((3 * no_of_states, squares))
+        roll_dice_landings = np.zeros((3 * no_of_states, squares))
+        landing_outcomes = [self.resolveLanding(counter) for counter in range(squares)]
+
+        for doubles in range(3):
+            for state in range(no_of_states):
+                row = doubles * no_of_states + state
+                pos = state % squares
+                jailed = state >= squares
+                for roll_prob, roll_total, roll_doubles in self.roll_outcomes:
+                    if jailed and not roll_doubles: #Stays in Bogside and the turn ends
+                        roll_end[row][state] += roll_prob
+                        continue
+                    new_doubles = doubles + int(roll_doubles)
+                    if new_doubles >= 3: #Third double in a row, so straight to Bogside
+                        roll_end[row][squares + self.board.bogside_pos] += roll_prob
+                        continue
+                    for card_prob, landed, new_pos, new_jailed in landing_outcomes[(pos + roll_total) % squares]:
+                        prob = roll_prob * card_prob
+                        for l_pos in landed:
+                            roll_landings[row][l_pos] += prob
+                            roll_dice_landings[row][l_pos] += prob * roll_total
+                        new_state = new_pos + squares * int(new_jailed)
+                        if roll_doubles:
+                            roll_next[row][new_doubles * no_of_states + new_state] += prob
+                        else:
+                            roll_end[row][new_state] += prob
+
+        #Start of the turn: a player in Bogside may leave it before rolling
+        turn_start = np.zeros((no_of_states, 3 * no_of_states))
+        for pos in range(squares):
+            turn_start[pos][pos] = 1
+            turn_start[squares + pos][pos] = self.leave_prob
+            turn_start[squares + pos][squares + pos] = 1 - self.leave_prob
+
+        #At most 3 rolls are made in a turn, so the expected number of visits to each roll state is I + R + R^2
+        roll_visits = turn_start @ (np.identity(3 * no_of_states) + roll_next + roll_next @ roll_next)
+        return roll_visits @ roll_end, roll_visits @ roll_landings, roll_visits @ roll_dice_landings
+
+    #Stationary distribution of the turn matrix, i.e. the solution of p = pT where the elements of p sum to 1
+    def solveStationary(self):
+        no_of_states = len(self.turn_matrix)
+        equations = self.turn_matrix.T - np.identity(no_of_states)
+        equations[-1] = 1 #Replace one (redundant) equation with the probabilities summing to 1
+        targets = np.zeros(no_of_states)
+        targets[-1] = 1
+        return np.linalg.lstsq(equations, targets, rcond=None)[0]
+
+    #Expected rent paid per turn on every square at every rent level, for one player moving around the board
+    #Columns are as in Board_Arrays.rents: NORMAL properties with 0-4 Council Houses then a Tower Block (double column 0 for an unimproved whole group),
+    #SCHOOL properties with 1-4 schools owned, STATION properties with 1-2 stations owned, and the charge of PAYMENT squares in column 0
+    #Multiply by the number of opponents for the rent an owner collects per round
+    def getExpectedRents(self):
+        ret_rents = self.rents * self.landing_rates[:, None]
+        is_station = np.array([self.board.getProp(counter).prop_type == Prop_Type.STATION for counter in range(self.no_of_squares)])
+        ret_rents[is_station] = self.rents[is_station] * self.dice_landing_rates[is_station, None] #Station rent is a multiple of the dice roll
+        return ret_rents
+
+    #Expected rent per turn for a single square and rent level
+    def getExpectedRent(self, b_pos, level):
+        return self.getExpectedRents()[b_pos][level]
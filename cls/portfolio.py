@@ -0,0 +1,40 @@
+import bisect
+from .property import Prop_Type
+
+#------------------------------Portfolio Class------------------------------
+#Running totals for everything one player owns, so that they never need to be worked out by scanning the whole board
+#One is kept for each player by the Board, which adds a property's values before a change and removes them after it (see Board.buyProperty etc.)
+class Portfolio:
+    def __init__(self):
+        self.owned = [] #Board positions of all properties owned, kept in ascending order
+        self.C_Houses = 0 #Total number of Council Houses across all owned properties
+        self.T_Blocks = 0 #Total number of Tower Blocks across all owned properties
+        self.obtain_mon = 0 #Money that could be obtained by selling all upgrades and mortgaging all unmortgaged properties
+        self.assets_val = 0 #Money that was paid for all owned properties and upgrades
+
+    #Add a property's values to the totals
+    def addProp(self, b_pos, prop):
+        bisect.insort(self.owned, b_pos)
+        self.changeTotals(prop, 1)
+
+    #Take a property's values away from the totals
+    def removeProp(self, b_pos, prop):
+        self.owned.remove(b_pos)
+        self.changeTotals(prop, -1)
+
+    def changeTotals(self, prop, sign):
+        self.assets_val += sign * prop.cost
+        if prop.mortgage_status == False:
+            self.obtain_mon += sign * prop.mortgage_val
+        if prop.prop_type == Prop_Type.NORMAL: #Only NORMAL properties can have upgrades
+            self.C_Houses += sign * prop.C_Houses
+            self.T_Blocks += sign * prop.T_Blocks
+            self.assets_val += sign * (prop.CH_cost * prop.C_Houses + prop.TB_cost * prop.T_Blocks)
+            self.obtain_mon += sign * (int(prop.CH_cost * prop.C_Houses / 2) + int(prop.TB_cost * prop.T_Blocks / 2)) #Upgrades sell for half of what they cost
+
+    def countOwned(self):
+        return len(self.owned)
+
+    #Whether two portfolios have exactly the same contents
+    def matches(self, other):
+        return self.owned == other.owned and self.C_Houses == other.C_Houses and self.T_Blocks == other.T_Blocks and self.obtain_mon == other.obtain_mon and self.assets_val == other.assets_val
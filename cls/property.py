@@ -118,16 +118,11 @@ class School_Property(Property):
         else:
             return self.title_deed
 
-    def getRent(self, board, playerNo): #propArr is an array of Property classes (including subclasses of it)
-        #Counting occurrences algorithm, to count how many schools (including this one) are owned by a specific player
+    def getRent(self, board, playerNo): #board is the Board object, which keeps count of how many schools each player owns
         if self.mortgage_status: #Mortgaged properties do not collect rent
             return 0
         
-        rent_count = 0
-        for counter in range(board.max_pos + 1):
-            if board.getProp(counter).prop_type == Prop_Type.SCHOOL:
-                if board.getProp(counter).prop_owner == playerNo:            
-                    rent_count = rent_count + 1
+        rent_count = board.countTypeOwned(Prop_Type.SCHOOL, playerNo) #How many schools (including this one) are owned by a specific player
         return self.rent_vals[rent_count-1] #-1 as array is zero-indexed
 
     def buyProperty(self, newOwner):
@@ -158,16 +153,11 @@ class Station_Property(Property):
         else:
             return self.title_deed
 
-    def getRent(self, board, playerNo, diceRoll): #propArr is an array of Property classes (including subclasses of it)
-        #Counting occurrences algorithm, to count how many schools (including this one) are owned by a specific player
+    def getRent(self, board, playerNo, diceRoll): #board is the Board object, which keeps count of how many stations each player owns
         if self.mortgage_status: #Mortgaged properties do not collect rent
             return 0
         
-        rent_count = 0
-        for counter in range(board.max_pos + 1):
-            if board.getProp(counter).prop_type == Prop_Type.STATION:
-                if board.getProp(counter).prop_owner == playerNo:            
-                    rent_count = rent_count + 1
+        rent_count = board.countTypeOwned(Prop_Type.STATION, playerNo) #How many stations (including this one) are owned by a specific player
         #Rent for a station property is dependent on the dice roll, as well as how many of the two are owned
         return self.rent_mods[rent_count-1] * diceRoll #-1 as array is zero-indexed
 
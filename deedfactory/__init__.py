@@ -0,0 +1 @@
+from .deedfactory import DeedFactory, deed_factory, DEED_CACHE_VERSION, CreateTitleDeed, CreateMortDeed, getTitleDeedKey, getMortDeedKey
\ No newline at end of file
@@ -0,0 +1,235 @@
+import hashlib
+import os
+import threading
+import pygame
+from imgcache import text_cache
+from assetbundle import AssetBundle, asset_bundle, getGeneratedKey, getImageKey, loadImage, writeBundle
+
+DEED_CACHE_VERSION = 1 #Part of the disk cache's file names; must go up whenever the way deeds are drawn changes, so older cached deeds are not used
+
+#------------------------------Deed Drawing Functions------------------------------
+#Render a title deed for a property (that can be mortgaged) for when it is actually mortgaged
+#Only shows the name, buy-back cost and a mnessage explaining that the property needs to be rebought for it to collect rent again
+def CreateMortDeed(deed_name, deed_cost):
+    deed_screen = pygame.Surface((250,400))
+    deed_screen.fill((255,255,255)) #Filled white
+
+    deed_font_name = text_cache.getFont('Arial', 24, True) #Font for property name (bold)
+    deed_font_desc = text_cache.getFont('Arial', 18) #Font for descriptive text that tells the user that the property will not collect rent while still mortgaged
+    deed_font_back = text_cache.getFont('Arial', 28) #Font for displaying the cost to unmortgage/buy-back the property
+
+    pygame.draw.rect(deed_screen, (0,0,0), pygame.Rect(0,0,250,400), 2) #Title deed outline
+
+    prop_text = deed_font_name.render(deed_name, True, (0,0,0)) #Name of property (in bold) at the top of the deed
+    f_width, f_height = deed_font_name.size(deed_name) #Used repeatedly so that text can be centred, using the equation (xpos = (deed_width-text_width)/2)
+    deed_screen.blit(prop_text, [(250-f_width)/2, 80])
+
+    desc_text_1 = deed_font_desc.render('This property is currently mortgaged.', True, (0,0,0)) #First line of the deed description
+    f_width, f_height = deed_font_desc.size('This property is currently mortgaged.')
+    deed_screen.blit(desc_text_1, [(250-f_width)/2, 140])
+
+    desc_text_2 = deed_font_desc.render('It will not collect rent until bought back.', True, (0,0,0)) #Second line of the deed description
+    f_width, f_height = deed_font_desc.size('It will not collect rent until bought back.')
+    deed_screen.blit(desc_text_2, [(250-f_width)/2, 158])
+
+    buy_back_text = deed_font_back.render('Buy-Back Cost £' + str(int(deed_cost)), True, (0,0,0)) #Text displaying how much it costs to unmortgage the property
+    f_width, f_height = deed_font_back.size('Buy-Back Cost £' + str(int(deed_cost)))
+    deed_screen.blit(buy_back_text, [(250-f_width)/2, 275])
+    
+    return deed_screen
+
+#Render a title deed for a typical property based on its rents, cost,
+#etc Returns a pygame Surface containing shapes and text resembling a
+#title deed
+def CreateTitleDeed(deed_vals):
+    deed_screen = pygame.Surface((225,400))
+    deed_screen.fill((255,255,255)) #Filled white
+
+    deed_col = pygame.Color(int(deed_vals[11]), int(deed_vals[12]), int(deed_vals[13]), 0) #Create colour to be used in header from the 3 separate RGB values
+    #Fonts for title deed, only created the first time a deed is drawn (see TextCache.getFont)
+    deed_font_main = text_cache.getFont('Arial', 18) #Font for most text
+    deed_font_name = text_cache.getFont('Arial', 20, True) #Bold font holding the name of the property
+    deed_font_bottom = text_cache.getFont('Arial', 14) #Font for displaying the info at the bottom of the property about rent doubling if all properties in the gropup are owned
+
+    pygame.draw.rect(deed_screen, (0,0,0), pygame.Rect(0,0,225,400), 2) #Title deed outline
+    pygame.draw.rect(deed_screen, deed_col, pygame.Rect(5, 5, 215, 100)) #Coloured rectangle containing the words 'Title Deed' and property name
+    
+    prop_text = deed_font_name.render(deed_vals[0], True, (255,255,255)) #Name of property (in bold) at bottom of above coloured rectangle
+    f_width, f_height = deed_font_name.size(deed_vals[0]) #Used repeatedly so that text can be centred, using the equation (xpos = (deed_width-text_width)/2)
+    deed_screen.blit(prop_text, [(225-f_width)/2, 95 - f_height])
+
+    title_text = deed_font_main.render('Title Deed', True, (255,255,255)) #Words 'Title Deed' at the top of the aforementioned coloured rectangle
+    f_width, f_height = deed_font_main.size('Title Deed')
+    deed_screen.blit(title_text, [(225-f_width)/2, 5])
+
+    cost_text = deed_font_main.render('Cost £' + str(deed_vals[1]), True, (0,0,0)) #The cost to buy the property from the bank
+    f_width, f_height = deed_font_main.size('Cost £' + str(deed_vals[1]))
+    deed_screen.blit(cost_text, [(225-f_width)/2, 105])
+    
+    rent_text = deed_font_main.render('Rent £' + str(deed_vals[2]), True, (0,0,0)) #Rent on the unimproved property
+    f_width, f_height = deed_font_main.size('Rent £' + str(deed_vals[2]))
+    deed_screen.blit(rent_text, [(225-f_width)/2, 123])
+
+    ch_text1 = deed_font_main.render('With 1 Council House', True, (0,0,0)) #Basic text providing a textual explanation for the 4 rent values with Council Houses
+    deed_screen.blit(ch_text1, [15, 153])
+    ch_text2 = deed_font_main.render('With 2 Council Houses', True, (0,0,0))
+    deed_screen.blit(ch_text2, [15, 173])
+    ch_text3 = deed_font_main.render('With 3 Council Houses', True, (0,0,0))
+    deed_screen.blit(ch_text3, [15, 193])
+    ch_text4 = deed_font_main.render('With 4 Council Houses', True, (0,0,0))
+    deed_screen.blit(ch_text4, [15, 213])
+
+    ch_rent1 = deed_font_main.render('£' + str(deed_vals[3]), True, (0,0,0)) #Rent values for 1, 2, 3 and 4 council houses
+    f_width, f_height = deed_font_main.size('£' + str(deed_vals[3]))
+    deed_screen.blit(ch_rent1, [210-f_width, 153])
+    ch_rent2 = deed_font_main.render('£' + str(deed_vals[4]), True, (0,0,0))
+    f_width, f_height = deed_font_main.size('£' + str(deed_vals[4]))
+    deed_screen.blit(ch_rent2, [210-f_width, 173])
+    ch_rent3 = deed_font_main.render('£' + str(deed_vals[5]), True, (0,0,0))
+    f_width, f_height = deed_font_main.size('£' + str(deed_vals[5]))
+    deed_screen.blit(ch_rent3, [210-f_width, 193])
+    ch_rent4 = deed_font_main.render('£' + str(deed_vals[6]), True, (0,0,0))
+    f_width, f_height = deed_font_main.size('£' + str(deed_vals[6]))
+    deed_screen.blit(ch_rent4, [210-f_width, 213])
+
+    tb_rent = deed_font_main.render('With Tower Block £' + str(deed_vals[7]), True, (0,0,0)) #Rent with a tower block on the property
+    f_width, f_height = deed_font_main.size('With Tower Block £' + str(deed_vals[7]))
+    deed_screen.blit(tb_rent, [(225-f_width)/2, 233])
+
+    mortgage_val = deed_font_main.render('Mortgage Value £' + str(deed_vals[10]), True, (0,0,0)) #Mortgage value on property
+    f_width, f_height = deed_font_main.size('Mortgage Value £' + str(deed_vals[10]))
+    deed_screen.blit(mortgage_val, [(225-f_width)/2, 260])
+
+    ch_cost = deed_font_main.render('Council Houses cost £' + str(deed_vals[8]) + ' each', True, (0,0,0)) #Cost of a council house for this property
+    f_width, f_height = deed_font_main.size('Council Houses cost £' + str(deed_vals[8]) + ' each')
+    deed_screen.blit(ch_cost, [(225-f_width)/2, 280])
+
+    tb_cost = deed_font_main.render('Tower Block costs £' + str(deed_vals[9]) + ',', True, (0,0,0)) #Cost of a tower block for this property
+    f_width, f_height = deed_font_main.size('Tower Block costs £' + str(deed_vals[9]) + ',')
+    deed_screen.blit(tb_cost, [(225-f_width)/2, 300])
+    tb_info = deed_font_main.render('plus 4 Council Houses', True, (0,0,0))
+    f_width, f_height = deed_font_main.size('plus 4 Council Houses')
+    deed_screen.blit(tb_info, [(225-f_width)/2, 318])
+
+    bottom_note1 = deed_font_bottom.render('If a player owns all properties in this', True, (0,0,0)) #Note at bottom of the title deed about rent doubling 
+    f_width, f_height = deed_font_bottom.size('If a player owns all properties in this') #if all properties in a group are owned and unimproved
+    deed_screen.blit(bottom_note1, [(225-f_width)/2, 350])
+    bottom_note2 = deed_font_bottom.render('group, rent is doubled on properties with', True, (0,0,0))
+    f_width, f_height = deed_font_bottom.size('group, rent is doubled on properties with')
+    deed_screen.blit(bottom_note2, [(225-f_width)/2, 364])
+    bottom_note3 = deed_font_bottom.render('no Council Houses or Tower Blocks', True, (0,0,0))
+    f_width, f_height = deed_font_bottom.size('no Council Houses or Tower Blocks')
+    deed_screen.blit(bottom_note3, [(225-f_width)/2, 378])
+
+    return deed_screen
+
+#Keys of generated deeds, made from every value that is drawn on them, so a deed is only reused if it would be drawn exactly the same
+#The same keys are used by the asset bundle (see bundle.py) and the disk cache
+def getTitleDeedKey(deed_vals):
+    return getGeneratedKey('Title Deed', *deed_vals[:14])
+
+def getMortDeedKey(deed_name, deed_cost):
+    return getGeneratedKey('Mortgage Deed', deed_name, int(deed_cost))
+
+
+#------------------------------DeedFactory Class------------------------------
+#Makes the title deeds for LoadProperties, drawing each one only once: finished deeds are kept by the values drawn on them and shared by every game
+#(deeds are never drawn on, so sharing them is safe). A deed not made yet is taken from the asset bundle if it is in there, then the disk cache, and is only drawn if it is in neither
+#The disk cache holds the deeds for one version of the property values file, in the asset bundle format, named after a hash of the file.
+#So starting the game again with the same property values draws no deeds at all, and changing the file just means a new cache is made
+class DeedFactory:
+    def __init__(self, cache_dir='cache'):
+        self.cache_dir = cache_dir #Directory of the disk cache; None to not keep one
+        self.lock = threading.Lock() #Properties are loaded on the background loader as well as by NewGame
+        self.deeds = {} #Key -> Surface of every deed made so far
+        self.cache = None #AssetBundle of the disk cache for the property values file being loaded, if there is one
+        self.cache_path = None
+        self.file_keys = [] #Keys of the deeds asked for since the property values file was opened, which make up its cache
+        self.file_sources = [] #Image files of the deeds asked for since then
+        self.unsaved = 0 #Deeds drawn since the cache was last written
+
+        #Counters used for reporting
+        self.drawn = 0
+        self.from_bundle = 0
+        self.from_cache = 0
+        self.reused = 0
+
+    #Called by LoadProperties before it asks for any deeds, to open the disk cache for the property values file
+    def openFile(self, props_path):
+        with self.lock:
+            self.file_keys = []
+            self.file_sources = []
+            if self.cache_dir == None:
+                return
+            with open(props_path, 'rb') as fh:
+                digest = hashlib.sha256(fh.read()).hexdigest()[:16]
+            cache_path = os.path.join(self.cache_dir, 'Deeds-' + str(DEED_CACHE_VERSION) + '-' + digest + '.dfa')
+            if cache_path != self.cache_path:
+                self.cache_path = cache_path
+                self.cache = AssetBundle()
+                if not self.cache.open(cache_path):
+                    self.cache = None
+
+    #Called by LoadProperties once it has every deed. Writes the disk cache if any deeds had to be drawn, and removes caches made for older property values
+    #The cache is only there to save time, so it not being written (e.g. the directory is read-only) is not an error
+    def closeFile(self):
+        with self.lock:
+            if self.cache_dir == None or self.unsaved == 0:
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                writeBundle(self.cache_path, {key: self.deeds[key] for key in self.file_keys}, self.file_sources)
+            except OSError:
+                return
+            self.unsaved = 0
+            for file_name in os.listdir(self.cache_dir):
+                if file_name.startswith('Deeds-') and os.path.join(self.cache_dir, file_name) != self.cache_path:
+                    try:
+                        os.remove(os.path.join(self.cache_dir, file_name))
+                    except OSError: #Still in use, e.g. mapped by deeds from it that are still being shown; it goes next time
+                        pass
+
+    #Deed for a key: one already made, or from the bundle, or from the disk cache, or drawn with draw_func(*args)
+    def getDeed(self, key, draw_func, *args):
+        with self.lock:
+            self.file_keys.append(key)
+            deed_screen = self.deeds.get(key)
+            if deed_screen != None:
+                self.reused += 1
+                return deed_screen
+            deed_screen = asset_bundle.get(key)
+            if deed_screen != None:
+                self.from_bundle += 1
+            elif self.cache != None and self.cache.get(key) != None:
+                deed_screen = self.cache.get(key)
+                self.from_cache += 1
+            else:
+                deed_screen = draw_func(*args)
+                self.drawn += 1
+                self.unsaved += 1
+            self.deeds[key] = deed_screen
+            return deed_screen
+
+    #Title deed for a typical property
+    def getTitleDeed(self, deed_vals):
+        return self.getDeed(getTitleDeedKey(deed_vals), CreateTitleDeed, deed_vals)
+
+    #Title deed shown when a property is mortgaged
+    def getMortDeed(self, deed_name, deed_cost):
+        return self.getDeed(getMortDeedKey(deed_name, deed_cost), CreateMortDeed, deed_name, deed_cost)
+
+    #Title deed of a school or station, which is an image (a crest or logo) rather than being drawn. Kept and cached in the same way, so the image is only decoded once
+    #The image file is a source of the disk cache, so the cache is not used if the image changes
+    def getImageDeed(self, deed_name):
+        deed_path = "img/Deeds/" + str(deed_name) + ".png"
+        with self.lock:
+            if deed_path not in self.file_sources:
+                self.file_sources.append(deed_path)
+        return self.getDeed(getImageKey(deed_path), loadImage, deed_path)
+
+    #One line summary of where the deeds made so far came from
+    def getReport(self):
+        return 'Title deeds: %d drawn, %d from the asset bundle, %d from the disk cache, %d reused' % (self.drawn, self.from_bundle, self.from_cache, self.reused)
+
+
+deed_factory = DeedFactory() #Shared by every game
@@ -4,54 +4,143 @@ import numpy as np
 
 from cls import *
 from lib import displayButtonRect
+from imgcache import scaled_cache, text_cache
+from framesched import frame_scheduler
+from frameprof import frame_profiler
 
 #------------------------------Property Details Functions------------------------------
 #Return an integer representing the number of ownable properties on the board that are actually owned by the current player
 def countPropsOwned(board, player_num):
-    prop_count = 0
-    for counter in range(board.max_pos + 1): #Loop through entire board
-        if board.getProp(counter).prop_type == Prop_Type.NORMAL or board.getProp(counter).prop_type == Prop_Type.SCHOOL or board.getProp(counter).prop_type == Prop_Type.STATION:
-            if board.getProp(counter).prop_owner == player_num: #If ownable and owner then increment counter
-                prop_count += 1
-    return prop_count
+    return board.getPortfolio(player_num).countOwned()
 
 #Create an array containing the board positions of the properties owned by the current player
+#Only the player's own properties (from their Portfolio) are looked at, rather than the entire board
 def setupBoardPoses(board, player_num, num_owned):
     ret_arr = np.array([0] * num_owned) #Initialise integer array
     pos_counter = 0
-    for counter in range(board.max_pos + 1): #Loop through entire board
-        if board.getProp(counter).prop_type == Prop_Type.NORMAL:
-            if board.getProp(counter).prop_owner == player_num:
-                ret_arr[pos_counter] = counter #Set next empty array element to this property's position on the board
-                pos_counter += 1
+    for b_pos in board.getPortfolio(player_num).owned: #Positions are already in ascending order
+        if board.getProp(b_pos).prop_type == Prop_Type.NORMAL:
+            ret_arr[pos_counter] = b_pos #Set next empty array element to this property's position on the board
+            pos_counter += 1
 
     #SCHOOL and STATION properties are displayed after all NORMAL ones, as it gives the screen a better aesthetic as a whole
-    for counter in range(board.max_pos + 1): #Loop through entire board
-        if board.getProp(counter).prop_type == Prop_Type.SCHOOL or board.getProp(counter).prop_type == Prop_Type.STATION:
-            if board.getProp(counter).prop_owner == player_num:
-                ret_arr[pos_counter] = counter
-                pos_counter += 1
+    for b_pos in board.getPortfolio(player_num).owned:
+        if board.getProp(b_pos).prop_type == Prop_Type.SCHOOL or board.getProp(b_pos).prop_type == Prop_Type.STATION:
+            ret_arr[pos_counter] = b_pos
+            pos_counter += 1
     return ret_arr
 
+TABLE_X = 20 #Left edge of the table of properties, just inside the black border
+TABLE_Y = 90 #First y co-ordinate for a row of details
+ROW_HEIGHT = 30 #Co-ordinate spacing between rows
+TABLE_WIDTH = 750
+
+#Everything that is shown in a row of the table for the property at b_pos, so a row only needs drawing again if this has changed
+def getRowState(board, player_num, b_pos):
+    prop = board.getProp(b_pos)
+    group_owned = board.wholeGroupOwned(player_num, b_pos)
+    if prop.prop_type == Prop_Type.NORMAL: #SCHOOL and STATION properties have no 'Group Colour', Council Houses or Tower Blocks
+        show_rent = prop.getRent()
+        if group_owned and prop.C_Houses == 0:
+            show_rent = show_rent * 2
+        return (b_pos, show_rent, prop.C_Houses, prop.T_Blocks, prop.mortgage_status, group_owned)
+    return (b_pos, None, 0, 0, prop.mortgage_status, group_owned)
+
+
+#------------------------------Details_Table Class------------------------------
+#The table of the current player's properties, drawn onto one surface that the screen blits every frame
+#It is only looked at again when the game changes (Game.state_version), and then only the rows whose contents have changed are drawn again,
+#e.g. mortgaging a property redraws just its row, and buying an upgrade redraws the rows of its group
+class Details_Table:
+    def __init__(self):
+        self.game = None #Game the table is for
+        self.player_num = -1 #Player whose properties are shown
+        self.state_version = -1 #Game.state_version when the rows were last checked
+        self.board_poses = [] #Board positions of the properties in each row
+        self.row_states = [] #What each row currently shows (see getRowState)
+        self.table_surface = None
+        self.builds = 0 #Times the whole table has been made from scratch
+        self.row_renders = 0 #Rows drawn, including those drawn when the table is made
+
+    #Make sure the table shows the current state of gameObj for its current player, drawing again only the rows that have changed
+    def update(self, gameObj, font_20, font_16):
+        if gameObj is self.game and gameObj.cur_player == self.player_num and gameObj.state_version == self.state_version:
+            return
+        board_poses = list(setupBoardPoses(gameObj.board, gameObj.cur_player, countPropsOwned(gameObj.board, gameObj.cur_player)))
+        if gameObj is not self.game or gameObj.cur_player != self.player_num or board_poses != self.board_poses: #Different rows, so the whole table is made again
+            self.game = gameObj
+            self.player_num = gameObj.cur_player
+            self.board_poses = board_poses
+            self.row_states = [None] * len(board_poses)
+            self.table_surface = pygame.Surface((TABLE_WIDTH, max(1, len(board_poses) * ROW_HEIGHT)))
+            self.builds += 1
+        self.state_version = gameObj.state_version
+
+        for row_num in range(len(self.board_poses)):
+            row_state = getRowState(gameObj.board, self.player_num, self.board_poses[row_num])
+            if row_state != self.row_states[row_num]:
+                self.row_states[row_num] = row_state
+                self.drawRow(row_num, font_20, font_16)
+
+    #Draw one row of the table: the property's details and the buttons for it
+    def drawRow(self, row_num, font_20, font_16):
+        b_pos, show_rent, C_Houses, T_Blocks, mortgaged, group_owned = self.row_states[row_num]
+        prop = self.game.board.getProp(b_pos)
+        surface = self.table_surface
+        y_pos = row_num * ROW_HEIGHT
+        pygame.draw.rect(surface, (255,255,255), pygame.Rect(0, y_pos, TABLE_WIDTH, ROW_HEIGHT))
+
+        surface.blit(text_cache.render(font_20, prop.prop_title, True, (0,0,0)), [30-TABLE_X, y_pos]) #Property name/title
+        if prop.prop_type == Prop_Type.NORMAL:
+            pygame.draw.rect(surface, prop.group_col, pygame.Rect(200-TABLE_X, y_pos, 30, 20))
+            surface.blit(text_cache.render(font_20, str(show_rent), True, (0,0,0)), [260-TABLE_X, y_pos])
+            surface.blit(text_cache.render(font_20, str(C_Houses) + '/' + str(T_Blocks), True, (0,0,0)), [440-TABLE_X, y_pos])
+        surface.blit(text_cache.render(font_20, str(prop.mortgage_val), True, (0,0,0)), [330-TABLE_X, y_pos]) #Mortgage value of the property
+
+        if group_owned:
+            if C_Houses < 4: #Council Houses are still available to buy
+                displayButtonRect(surface, pygame.Rect(500-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Buy CH', (0, 0, 0))
+            elif T_Blocks == 0: #Player may still buy a Tower Block
+                displayButtonRect(surface, pygame.Rect(500-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Buy TB', (0, 0, 0))
+
+            if T_Blocks > 0: #Player has Tower Blocks available to sell
+                displayButtonRect(surface, pygame.Rect(565-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Sell TB', (0, 0, 0))
+            elif C_Houses > 0: #Player has no Tower Blocks, but still has Council Houses which may be sold
+                displayButtonRect(surface, pygame.Rect(565-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Sell CH', (0, 0, 0))
+
+        if mortgaged: #Property is mortgaged, thus it can only be bought back
+            displayButtonRect(surface, pygame.Rect(630-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Buy-Back', (0, 0, 0))
+        else: #Property may be mortgaged as it is not currently mortgaged
+            displayButtonRect(surface, pygame.Rect(630-TABLE_X, y_pos, 60, 25), (100, 100, 100), font_16, 'Mortgage', (0, 0, 0))
+        displayButtonRect(surface, pygame.Rect(695-TABLE_X, y_pos, 75, 25), (100, 100, 100), font_16, 'View Deed', (0, 0, 0))
+        self.row_renders += 1
+
+    def getReport(self):
+        return 'Property details: table made %d times, %d rows drawn' % (self.builds, self.row_renders)
+
+
+details_table = Details_Table() #Shared by every visit to the property details screen
+
 
 #------------------------------Property Details Method------------------------------
 def PropDetails(mainGame, screen, clock):
-    font_40 = pygame.font.SysFont('Arial', 40) #Font for title, money and exit button
-    font_20 = pygame.font.SysFont('Arial', 20) #Font for actual property details
-    font_20b = pygame.font.SysFont('Arial', 20, True) #Font for column headings
-    font_16 = pygame.font.SysFont('Arial', 16) #Font for button captions
-
-    props_owned = countPropsOwned(mainGame.board, mainGame.cur_player)
-    board_poses = setupBoardPoses(mainGame.board, mainGame.cur_player, props_owned) #Array containing the board positions of all of the current player's owned properties
-
-    tit_text = font_40.render('Viewing Property Details:', True, (0,0,0)) #Render title at top left of screen
-
-    headers = [font_20b.render('Property', True, (0,0,0)),
-               font_20b.render('Group', True, (0,0,0)),
-               font_20b.render('Rent (£)', True, (0,0,0)),
-               font_20b.render('Mortgage(£)', True, (0,0,0)),
-               font_20b.render('CH/TB', True, (0,0,0)),
-               font_20b.render('Options', True, (0,0,0))]
+    font_40 = text_cache.getFont('Arial', 40) #Font for title, money and exit button
+    font_20 = text_cache.getFont('Arial', 20) #Font for actual property details
+    font_20b = text_cache.getFont('Arial', 20, True) #Font for column headings
+    font_16 = text_cache.getFont('Arial', 16) #Font for button captions
+
+    details_table.update(mainGame, font_20, font_16)
+    props_owned = len(details_table.board_poses)
+    board_poses = details_table.board_poses #Board positions of all of the current player's owned properties, in the order of the rows
+
+    tit_text = text_cache.render(font_40, 'Viewing Property Details:', True, (0,0,0)) #Render title at top left of screen
+
+    headers = [text_cache.render(font_20b, 'Property', True, (0,0,0)),
+               text_cache.render(font_20b, 'Group', True, (0,0,0)),
+               text_cache.render(font_20b, 'Rent (£)', True, (0,0,0)),
+               text_cache.render(font_20b, 'Mortgage(£)', True, (0,0,0)),
+               text_cache.render(font_20b, 'CH/TB', True, (0,0,0)),
+               text_cache.render(font_20b, 'Options', True, (0,0,0))]
     head_x = [30, 200, 260, 330, 440, 640]
 
     #Initialise button arrays
@@ -61,8 +150,8 @@ def PropDetails(mainGame, screen, clock):
     deed_buts = np.array([None] * props_owned)
     exit_but = pygame.Rect(880,10,120,50)
     
-    y_top = 90 #First y co-ordinate for a row of details
-    y_space = 30 #Co-ordinate spacing between rows
+    y_top = TABLE_Y
+    y_space = ROW_HEIGHT
 
     #Setup buttons (one element of each array for each property)
     for counter in range(props_owned):
@@ -80,9 +169,13 @@ def PropDetails(mainGame, screen, clock):
     mort_but_click = -1 #Not -1 indicates the integer contents of the variable is the row of whatever of the four types of button was clicked (zero-indexed)
     deed_but_click = -1
 
+    frame_profiler.setScreen('PropDetails') #Names the spans recorded from here on
     prop_details_running = True
     while prop_details_running: #Main loop for this part of the program
+        frame_profiler.start('frame')
+        frame_profiler.start('events')
         for event in pygame.event.get():
+            frame_profiler.handleInputEvent(event)
             exit_but.handle_input_event(event)
             if event.type == pygame.QUIT:
                 prop_details_running = False
@@ -103,14 +196,16 @@ def PropDetails(mainGame, screen, clock):
                             mort_but_click = counter
                         if deed_buts[counter].collidepoint(mouse_pos):
                             deed_but_click = counter
+        frame_profiler.stop('events')
 
+        frame_profiler.start('draw')
         screen.fill((255,255,255))
         
         screen.blit(tit_text, [10, 0])
         pygame.draw.rect(screen, (0,0,0), pygame.Rect(10,50,770,700), 10) #Draw black rectangle surrounding the property data
 
-        mon_text = font_40.render('£' + str(mainGame.getCurPlayer().player_money), True, (0,0,0)) #Render player money on screen
-        f_width, f_height = font_40.size('£' + str(mainGame.getCurPlayer().player_money))
+        mon_text = text_cache.render(font_40, '£' + str(mainGame.getCurPlayer().player_money), True, (0,0,0)) #Render player money on screen
+        f_width, f_height = text_cache.size(font_40, '£' + str(mainGame.getCurPlayer().player_money))
         screen.blit(mon_text, [(770-f_width), 0])
 
         #Display each of the column headings
@@ -120,81 +215,30 @@ def PropDetails(mainGame, screen, clock):
         if cur_deed != None: #Can only display a chosen title deed if one has already been chosen
             screen.blit(cur_deed, [790, 200])
 
-        y_pos = y_top #Y co-ordinate of the first row of data
-        for counter in range(props_owned):
-            text_1 = font_20.render(mainGame.board.getProp(board_poses[counter]).prop_title, True, (0,0,0)) #Property name/title
-            screen.blit(text_1, [30, y_pos])
-            
-            if mainGame.board.getProp(board_poses[counter]).prop_type == Prop_Type.NORMAL: #SCHOOL and STATION properties have no 'Group Colour', Council Houses or Tower Blocks
-                pygame.draw.rect(screen, mainGame.board.getProp(board_poses[counter]).group_col, pygame.Rect(200,y_pos,30,20))
-
-                show_rent = mainGame.board.getProp(board_poses[counter]).getRent()
-                if mainGame.board.wholeGroupOwned(mainGame.cur_player, board_poses[counter]) and mainGame.board.getProp(board_poses[counter]).C_Houses == 0:
-                    show_rent = show_rent * 2
-                text_2 = font_20.render(str(show_rent), True, (0,0,0))
-                screen.blit(text_2, [260, y_pos])
-                text_4 = font_20.render(str(mainGame.board.getProp(board_poses[counter]).C_Houses) + '/' + str(mainGame.board.getProp(board_poses[counter]).T_Blocks), True, (0,0,0))
-                screen.blit(text_4, [440, y_pos])
-
-            text_3 = font_20.render(str(mainGame.board.getProp(board_poses[counter]).mortgage_val), True, (0,0,0)) #Mortgage value of the property
-            screen.blit(text_3, [330, y_pos])
-
-            y_pos += y_space #Increment y co-ordinate variable by the difference in co-ordinates between each row, as already defined
-
-            if mainGame.board.wholeGroupOwned(mainGame.cur_player, board_poses[counter]):
-                if mainGame.board.getProp(board_poses[counter]).C_Houses < 4: #Council Houses are still available to buy
-                    displayButtonRect(screen, buy_buts[counter], (100, 100, 100), font_16, 'Buy CH', (0, 0, 0))
-                elif mainGame.board.getProp(board_poses[counter]).T_Blocks == 0: #Player may still buy a Tower Block
-                    displayButtonRect(screen, buy_buts[counter], (100, 100, 100), font_16, 'Buy TB', (0, 0, 0))
-
-                if mainGame.board.getProp(board_poses[counter]).T_Blocks > 0: #Player has Tower Blocks available to sell
-                    displayButtonRect(screen, sell_buts[counter], (100, 100, 100), font_16, 'Sell TB', (0, 0, 0))
-                elif mainGame.board.getProp(board_poses[counter]).C_Houses > 0: #Player has no Tower Blocks, but still has Council Houses which may be sold
-                    displayButtonRect(screen, sell_buts[counter], (100, 100, 100), font_16, 'Sell CH', (0, 0, 0))
-
-            if mainGame.board.getProp(board_poses[counter]).mortgage_status: #Properrty is mortgaged, thus it can only be bought back
-                displayButtonRect(screen, mort_buts[counter], (100, 100, 100), font_16, 'Buy-Back', (0, 0, 0))
-            else: #Property may be mortgaged as it is not currently mortgaged
-                displayButtonRect(screen, mort_buts[counter], (100, 100, 100), font_16, 'Mortgage', (0, 0, 0))
-   
-            displayButtonRect(screen, deed_buts[counter], (100, 100, 100), font_16, 'View Deed', (0, 0, 0))
+        details_table.update(mainGame, font_20, font_16) #Only rows changed by a click on the last frame are drawn again
+        screen.blit(details_table.table_surface, [TABLE_X, TABLE_Y])
+        frame_profiler.stop('draw')
 
+        frame_profiler.start('update')
         if mort_but_click != -1: #One of the mortgaging buttons has been clicked
-            if mainGame.board.getProp(board_poses[mort_but_click]).mortgage_status == False: #Unmortgaged
-                mainGame.board.getProp(board_poses[mort_but_click]).mortgage_status = True #Mortgage property
-                mainGame.getCurPlayer().addMoney(mainGame.board.getProp(board_poses[mort_but_click]).mortgage_val) #Increase the player's money by the mortgage value of the property
-            else: #Mortgaged already
-                if mainGame.getCurPlayer().player_money >= mainGame.board.getProp(board_poses[mort_but_click]).mortgage_val * 1.2: #If the player has 120% of the mortgage value of the property (this is the buy-back cost)
-                    mainGame.board.getProp(board_poses[mort_but_click]).mortgage_status = False #Unmortgage the property
-                    mainGame.getCurPlayer().spendMoney(int(mainGame.board.getProp(board_poses[mort_but_click]).mortgage_val * 1.2)) #Debit the player's money by 120% of the mortgage value
+            mainGame.toggleMortgage(board_poses[mort_but_click]) #Mortgage the property, or buy it back if it is already mortgaged
             if deed_prop == board_poses[mort_but_click]: #If title deed has changed 
-                cur_deed = pygame.transform.smoothscale(mainGame.board.getProp(board_poses[mort_but_click]).getTitleDeed(), [225,400])
+                cur_deed = scaled_cache.scale(mainGame.board.getProp(board_poses[mort_but_click]).getTitleDeed(), [225,400])
 
         if deed_but_click != -1: #One of the buttons for viewing a title deed has been clicked
-            cur_deed = pygame.transform.smoothscale(mainGame.board.getProp(board_poses[deed_but_click]).getTitleDeed(), [225,400]) #Scale title deed so it fits in the narrow sidebar
+            cur_deed = scaled_cache.scale(mainGame.board.getProp(board_poses[deed_but_click]).getTitleDeed(), [225,400]) #Scale title deed so it fits in the narrow sidebar
             deed_prop = board_poses[deed_but_click]
 
         if buy_but_click != -1: #One of the buttons for buying CH or TB has been clicked
-            if mainGame.board.getProp(board_poses[buy_but_click]).C_Houses < 4: #Fewer than 4  Council Houses, so these are the next upgrade to be bought 
-                if mainGame.getCurPlayer().player_money >= (mainGame.board.getProp(board_poses[buy_but_click]).CH_cost * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[buy_but_click])): #Player actually has enough money to buy the Council House upgrade
-                    mainGame.board.buyCHGroup(mainGame.cur_player, board_poses[buy_but_click]) #Buy the Council Houses for the whole group
-                    mainGame.getCurPlayer().spendMoney(mainGame.board.getProp(board_poses[buy_but_click]).CH_cost * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[buy_but_click])) #Decrease the player's money by the cost of a Council House for however many properties are in the group
-            elif mainGame.board.getProp(board_poses[buy_but_click]).C_Houses == 4 and mainGame.board.getProp(board_poses[buy_but_click]).T_Blocks == 0: #4 Council Houses and no Tower Blocks, so Tower Block can be bought 
-                if mainGame.getCurPlayer().player_money >= (mainGame.board.getProp(board_poses[buy_but_click]).TB_cost * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[buy_but_click])): #Player actually has enough money to buy the Tower Block upgrade
-                    mainGame.board.buyTBGroup(mainGame.cur_player, board_poses[buy_but_click]) #Buy the Council Houses for the whole group
-                    mainGame.getCurPlayer().spendMoney(mainGame.board.getProp(board_poses[buy_but_click]).TB_cost * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[buy_but_click])) #Decrease the player's money by the cost of a Tower Block for however many properties are in the group
+            mainGame.buyUpgrade(board_poses[buy_but_click]) #Buy the next upgrade for the whole group
 
         if sell_but_click != -1: #One of the buttons for selling CH or TB has been clicked
-            if mainGame.board.getProp(board_poses[sell_but_click]).T_Blocks > 0: #Property has a Tower Block that can be sold
-                mainGame.board.sellTBGroup(mainGame.cur_player, board_poses[sell_but_click]) #Sell the Tower Blocks for the whole group
-                mainGame.getCurPlayer().addMoney(int(mainGame.board.getProp(board_poses[sell_but_click]).TB_cost/2 * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[sell_but_click]))) #Increase the player's money by half of what the upgrades were bought for
-            elif mainGame.board.getProp(board_poses[sell_but_click]).C_Houses > 0: #No Tower Blocks, buy some Council Houses which can instead be sold 
-                mainGame.board.sellCHGroup(mainGame.cur_player, board_poses[sell_but_click]) #Sell the Council Houses for the whole group
-                mainGame.getCurPlayer().addMoney(int(mainGame.board.getProp(board_poses[sell_but_click]).CH_cost/2 * mainGame.board.countGroupSize(mainGame.cur_player, board_poses[sell_but_click]))) #Increase the player's money by half of what the upgrades were bought for
+            mainGame.sellUpgrade(board_poses[sell_but_click]) #Sell an upgrade from the whole group
         
         if exit_but.clicked():
             prop_details_running = False
             gotoScreen = 1
+        frame_profiler.stop('update')
         exit_but.render(screen)
 
         #Reset all button variables so the actions of buttons only happen once
@@ -202,6 +246,10 @@ def PropDetails(mainGame, screen, clock):
         sell_but_click = -1
         mort_but_click = -1
         deed_but_click = -1
-        clock.tick(fps) #10 fps currently, but could easily be changed to update more or less often
-        pygame.display.flip() #Refresh display from a pygame perspective, to reflect the screen.blit()s
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
+        frame_profiler.drawOverlay(screen)
+        with frame_profiler.span('flip'):
+            pygame.display.flip() #Refresh display from a pygame perspective, to reflect the screen.blit()s
+        frame_profiler.stop('frame') #Everything but the wait for the next frame
+        frame_scheduler.waitForFrame(clock, fps) #At most 10 fps, and sleeps until there is input when nothing is happening
     return mainGame, gotoScreen #Pass the Game object and the integer storing where the game will go to next back out to the main game loop
@@ -0,0 +1 @@
+from .dirtyrects import DirtyRegions, PixelCounter, pixel_counter
\ No newline at end of file
@@ -0,0 +1,75 @@
+import time
+import pygame
+from frameprof import frame_profiler
+
+#------------------------------DirtyRegions Class------------------------------
+#Retained-mode drawing for a screen split into fixed regions: only regions whose contents have changed are redrawn and sent to the display
+#Each frame, the screen gives every region a 'state' (any value that can be compared, e.g. a tuple of what is drawn there).
+#Regions whose state differs from the previous frame are redrawn by restoring the static background under them and calling the screen's draw function once,
+#with drawing clipped to the smallest rectangle containing all of them, so the draw function itself does not need to know which regions are being redrawn
+class DirtyRegions:
+    def __init__(self, screen, background, regions):
+        self.screen = screen
+        self.background = background #Surface the same size as the screen containing everything that never changes
+        self.regions = regions #Dictionary of region name -> pygame.Rect. Together they should cover the whole screen
+        self.states = {}
+        self.dirty = set(regions) #Everything must be drawn on the first frame
+        self.extra_rects = [] #Any other rectangles that must be redrawn this frame
+
+    #Give a region its state for this frame, marking it to be redrawn if the state has changed
+    def setState(self, name, state):
+        if self.states.get(name, None) != state:
+            self.states[name] = state
+            self.dirty.add(name)
+
+    #Redraw every region on the next redraw, e.g. when something is drawn over several regions
+    def markAll(self):
+        self.dirty.update(self.regions)
+
+    #Redraw an area that is not one of the regions (or only part of one)
+    def markRect(self, rect):
+        self.extra_rects.append(pygame.Rect(rect))
+
+    #Redraw all dirty regions using draw_func (which draws the whole screen's contents) and send only those to the display
+    #draw_func is called once however many regions are dirty. Any clean regions inside the clipping rectangle have their background restored
+    #and are drawn again as they were, so that nothing is drawn twice over itself
+    #Returns the list of rectangles that were updated
+    def redraw(self, draw_func):
+        rects = [self.regions[name] for name in self.regions if name in self.dirty] + self.extra_rects
+        if len(rects) > 0:
+            clip_rect = rects[0].unionall(rects[1:])
+            self.screen.set_clip(clip_rect)
+            self.screen.blit(self.background, clip_rect, clip_rect)
+            draw_func()
+            self.screen.set_clip(None)
+            with frame_profiler.span('flip'):
+                pygame.display.update(rects)
+
+        self.dirty.clear()
+        self.extra_rects = []
+        pixel_counter.addFrame(sum(rect.width * rect.height for rect in rects))
+        return rects
+
+
+#------------------------------PixelCounter Class------------------------------
+#Keeps count of how many pixels are sent to the display, to compare against updating the whole screen every frame
+class PixelCounter:
+    def __init__(self):
+        self.frames = 0
+        self.pixels_pushed = 0 #Total over all frames
+        self.pixels_per_sec = 0 #Over the last full second
+        self.rate_start = time.perf_counter()
+        self.rate_pixels = 0
+
+    def addFrame(self, pixels):
+        self.frames += 1
+        self.pixels_pushed += pixels
+        self.rate_pixels += pixels
+        now = time.perf_counter()
+        if now - self.rate_start >= 1:
+            self.pixels_per_sec = self.rate_pixels / (now - self.rate_start)
+            self.rate_start = now
+            self.rate_pixels = 0
+
+
+pixel_counter = PixelCounter() #Shared by every DirtyRegions object
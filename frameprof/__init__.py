@@ -0,0 +1 @@
+from .frameprof import FrameProfiler, frame_profiler, getPercentile
\ No newline at end of file
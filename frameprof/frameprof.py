@@ -0,0 +1,207 @@
+import csv
+import json
+import time
+from functools import wraps
+import pygame
+
+#------------------------------Null_Span Class------------------------------
+#Stands in for a span while profiling is off, so the time helpers and the with statements around them cost next to nothing
+class Null_Span:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NULL_SPAN = Null_Span()
+
+
+#------------------------------Span Class------------------------------
+#Times one named span with a with statement, e.g. with frame_profiler.span('draw'):
+#One Span object is made per name and reused every frame, so timing a span does not allocate anything
+class Span:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start_time = 0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(self.name, time.perf_counter() - self.start_time)
+        return False
+
+
+#------------------------------FrameProfiler Class------------------------------
+#Records how long named parts of each frame take (event handling, game logic, each display helper, sending the frame to the display)
+#The last history times of each span are kept in a ring buffer, from which the 50th, 95th and 99th percentiles are worked out when asked for
+#Span names are prefixed with the screen they were recorded on (e.g. MainScreen.events), so the same code can be told apart on different screens
+#Nothing is recorded while enabled is False; every method then returns straight away
+class FrameProfiler:
+    def __init__(self, history=600):
+        self.history = history #Number of times kept for each span; 600 is a minute of frames at 10 fps
+        self.enabled = False #Set while the overlay is shown or a dump path has been given
+        self.overlay_shown = False
+        self.overlay_rect = None #Part of the screen the overlay was last drawn over, so screens that only redraw what changes can restore it
+        self.overlay_key = pygame.K_F3 #Key that shows and hides the overlay
+        self.dump_path = None #.json or .csv file written by dump when the game closes, if given
+        self.screen_name = '' #Prefix for span names, set by each screen when it is opened
+        self.times = {} #Full span name -> ring buffer (list) of times in seconds
+        self.next_index = {} #Full span name -> position in its ring buffer for the next time
+        self.counts = {} #Full span name -> times recorded in total (may be more than the ring buffer holds)
+        self.spans = {} #Span name -> reusable Span object
+        self.start_times = {} #Span name -> time started by start, for spans that cannot be put in a with statement
+        self.font = None
+
+    #Record to path when dump is called, or stop doing so if path is None or empty
+    def setDumpPath(self, path):
+        if path == '':
+            path = None
+        self.dump_path = path
+        self.enabled = self.overlay_shown or self.dump_path != None
+
+    def setScreen(self, screen_name):
+        self.screen_name = screen_name
+
+    def toggleOverlay(self):
+        self.overlay_shown = not self.overlay_shown
+        self.enabled = self.overlay_shown or self.dump_path != None
+
+    #Called from each screen's event loop, so the overlay key works on every screen
+    def handleInputEvent(self, event):
+        if event.type == pygame.KEYDOWN and event.key == self.overlay_key:
+            self.toggleOverlay()
+
+    #Context manager timing the code inside it as the span called name
+    def span(self, name):
+        if not self.enabled:
+            return NULL_SPAN
+        ret_span = self.spans.get(name)
+        if ret_span == None:
+            ret_span = Span(self, name)
+            self.spans[name] = ret_span
+        return ret_span
+
+    #Same as span, for code that starts and finishes in different places, such as a screen's whole frame
+    def start(self, name):
+        if self.enabled:
+            self.start_times[name] = time.perf_counter()
+
+    def stop(self, name):
+        if self.enabled and name in self.start_times:
+            self.record(name, time.perf_counter() - self.start_times.pop(name))
+
+    #Decorator timing every call to a function as the span called name (the function's own name if not given)
+    def timed(self, name=None):
+        def decorate(func):
+            span_name = name or func.__name__
+            @wraps(func)
+            def timedFunc(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start_time = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(span_name, time.perf_counter() - start_time)
+            return timedFunc
+        return decorate
+
+    #Add a time (in seconds) to a span's ring buffer, overwriting the oldest once it is full
+    def record(self, name, seconds):
+        if self.screen_name != '':
+            name = self.screen_name + '.' + name
+        buffer = self.times.get(name)
+        if buffer == None:
+            buffer = []
+            self.times[name] = buffer
+            self.next_index[name] = 0
+            self.counts[name] = 0
+        if len(buffer) < self.history:
+            buffer.append(seconds)
+        else:
+            buffer[self.next_index[name]] = seconds
+            self.next_index[name] = (self.next_index[name] + 1) % self.history
+        self.counts[name] += 1
+
+    def clear(self):
+        self.times.clear()
+        self.next_index.clear()
+        self.counts.clear()
+        self.start_times.clear()
+
+    #Dictionary of span name -> summary of the times in its ring buffer, in milliseconds
+    def getStats(self):
+        ret_stats = {}
+        for name in sorted(self.times):
+            ordered = sorted(self.times[name])
+            ret_stats[name] = {'count': self.counts[name],
+                               'p50_ms': getPercentile(ordered, 50) * 1000,
+                               'p95_ms': getPercentile(ordered, 95) * 1000,
+                               'p99_ms': getPercentile(ordered, 99) * 1000,
+                               'mean_ms': sum(ordered) / len(ordered) * 1000,
+                               'max_ms': ordered[-1] * 1000}
+        return ret_stats
+
+    #Draw the percentiles of every span over the top left of the screen, if the overlay is shown
+    #Returns whether anything was drawn; the area covered is in overlay_rect
+    def drawOverlay(self, screen):
+        if not self.overlay_shown:
+            self.overlay_rect = None
+            return False
+        if self.font == None:
+            self.font = pygame.font.SysFont('Arial', 14)
+
+        #Not rendered with text_cache, as the numbers change almost every frame and would only push useful texts out of it
+        rows = [('Span', 'p50 ms', 'p95 ms', 'p99 ms')]
+        for name, stats in self.getStats().items():
+            rows.append((name, '%.2f' % stats['p50_ms'], '%.2f' % stats['p95_ms'], '%.2f' % stats['p99_ms']))
+        line_height = self.font.get_linesize()
+        self.overlay_rect = pygame.Rect(0, 0, 460, line_height * len(rows) + 8)
+
+        overlay = pygame.Surface(self.overlay_rect.size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 196))
+        for counter in range(len(rows)):
+            overlay.blit(self.font.render(rows[counter][0], True, (255, 255, 255)), [4, 4 + counter*line_height])
+            for col in range(1, 4): #Numbers are right-aligned in their own columns
+                num_text = self.font.render(rows[counter][col], True, (255, 255, 255))
+                overlay.blit(num_text, [260 + col*65 - num_text.get_width(), 4 + counter*line_height])
+        screen.blit(overlay, self.overlay_rect)
+        return True
+
+    #Write the summary of every span to dump_path (or path): a JSON object if it ends in .json, otherwise a CSV table
+    def dump(self, path=None):
+        if path == None:
+            path = self.dump_path
+        stats = self.getStats()
+        if path.lower().endswith('.json'):
+            for name in stats:
+                stats[name]['samples_ms'] = [seconds * 1000 for seconds in self.times[name]] #Every time still in the ring buffer, not in the order they were recorded
+            with open(path, 'w') as fh:
+                json.dump({'history': self.history, 'spans': stats}, fh, indent=1)
+        else:
+            with open(path, 'w', newline='') as fh:
+                writer = csv.writer(fh)
+                writer.writerow(['span', 'count', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'max_ms'])
+                for name, span_stats in stats.items():
+                    writer.writerow([name, span_stats['count']] + ['%.4f' % span_stats[key] for key in ['p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'max_ms']])
+
+    #One line summary of the slowest spans
+    def getReport(self):
+        if len(self.times) == 0:
+            return 'Frame profiler: nothing recorded (press F3 in game, or set DFO_PROFILE to a .json or .csv file)'
+        stats = self.getStats()
+        slowest = sorted(stats, key=lambda name: stats[name]['p95_ms'], reverse=True)[:3]
+        return 'Frame profiler: %d spans, slowest at p95: %s' % (len(stats), ', '.join('%s %.2f ms' % (name, stats[name]['p95_ms']) for name in slowest))
+
+
+#Value below which percent of the (already sorted) times fall, by the nearest-rank method
+def getPercentile(ordered, percent):
+    rank = max(1, -(-len(ordered) * percent // 100)) #Ceiling division
+    return ordered[int(rank) - 1]
+
+
+frame_profiler = FrameProfiler() #Shared by every screen
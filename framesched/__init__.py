@@ -0,0 +1 @@
+from .framesched import FrameScheduler, frame_scheduler, IDLE_CPU_TARGET
\ No newline at end of file
@@ -0,0 +1,90 @@
+import time
+import pygame
+
+IDLE_CPU_TARGET = 2.0 #Percentage of one CPU core that a screen with nothing happening on it should stay below
+
+#------------------------------FrameScheduler Class------------------------------
+#Lets screens sleep until there is something to do, instead of redrawing at a fixed rate while the user is doing nothing
+#Each screen calls waitForFrame once the frame has been shown. If nothing is animating, this blocks on pygame.event.wait until
+#there is input, the music ends, or one of the screen's timers (e.g. the next frame of an AnimatedGif) goes off
+#Timers are made with pygame.time.set_timer, so they arrive as ordinary events that the screen's event loop can check for with isTimer
+class FrameScheduler:
+    def __init__(self, new_idle_timeout=1000):
+        self.idle_timeout = new_idle_timeout #Longest time (ms) to sleep for with nothing happening, as a safety net
+        self.timer_types = {} #Timer name -> pygame event type
+        self.timer_intervals = {} #Timer name -> interval in ms, for timers that are running
+        self.music_end = pygame.USEREVENT #Event posted when the background music ends (see main.py)
+        #Event types that wake a sleeping screen; timer types are added as timers are made
+        #pygame.event.peek() with no types turns the next event into an Event object, which loses the attributes of events made with pygame.event.post,
+        #so only these types are peeked at
+        self.wake_types = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                           pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWFOCUSGAINED, self.music_end]
+
+        #Counters used for reporting
+        self.frames = 0
+        self.waits = 0 #Frames after which the screen slept until the next event
+        self.cpu_percent = 0 #Percentage of one core used over the last full second
+        self.rate_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    #Start (or restart) a timer that posts an event every interval milliseconds
+    def setTimer(self, name, interval):
+        if name not in self.timer_types:
+            self.timer_types[name] = pygame.event.custom_type()
+            self.wake_types.append(self.timer_types[name])
+        self.timer_intervals[name] = interval
+        pygame.time.set_timer(self.timer_types[name], interval)
+
+    #Whether an event was posted by a certain timer
+    def isTimer(self, event, name):
+        return name in self.timer_intervals and event.type == self.timer_types[name]
+
+    #Stop all timers; called by a screen when it is left, so its timers do not wake other screens
+    def clearTimers(self):
+        for name in self.timer_intervals:
+            pygame.time.set_timer(self.timer_types[name], 0)
+        self.timer_intervals.clear()
+
+    #Called at the end of each frame, after it has been sent to the display, in place of clock.tick(fps)
+    #clock.tick still limits the frame rate while events are arriving; if animating is True the screen is redrawn at that rate regardless
+    def waitForFrame(self, clock, fps, animating=False):
+        clock.tick(fps)
+        self.frames += 1
+        #Nothing is slept through if events are already waiting
+        if not animating and not self.isEventWaiting():
+            if pygame.display.get_driver() in ('dummy', 'offscreen'):
+                self.sleepUntilEvent()
+            else:
+                event = pygame.event.wait(self.idle_timeout)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event) #Put the event back so that the screen's own event loop handles it
+            self.waits += 1
+        self.updateCpu()
+
+    def isEventWaiting(self):
+        return pygame.event.peek(self.wake_types)
+
+    #Video drivers with no window (used for tests and benchmarks) cannot block waiting for events, and pygame.event.wait spins on them,
+    #so sleep in short slices instead, checking for events in between
+    def sleepUntilEvent(self):
+        end_time = pygame.time.get_ticks() + self.idle_timeout
+        while pygame.time.get_ticks() < end_time and not self.isEventWaiting():
+            pygame.time.wait(50) #Still quicker to respond to input than the 100ms between frames at 10 fps
+
+    def updateCpu(self):
+        now = time.perf_counter()
+        if now - self.rate_start >= 1:
+            self.cpu_percent = 100 * (time.process_time() - self.cpu_start) / (now - self.rate_start)
+            self.rate_start = now
+            self.cpu_start = time.process_time()
+
+    #One line summary of how busy the screens have been
+    def getReport(self):
+        if self.cpu_percent <= IDLE_CPU_TARGET:
+            target_str = 'within'
+        else:
+            target_str = 'above'
+        return 'CPU %.1f%% (%s the %.1f%% idle target), %d frames, %d spent sleeping until an event' % (self.cpu_percent, target_str, IDLE_CPU_TARGET, self.frames, self.waits)
+
+
+frame_scheduler = FrameScheduler() #Shared by every screen
@@ -0,0 +1,2 @@
+from .imgcache import SurfaceCache, scaled_cache
+from .textcache import TextCache, text_cache
\ No newline at end of file
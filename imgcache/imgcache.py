@@ -0,0 +1,70 @@
+from collections import OrderedDict
+import pygame
+from assetbundle import asset_bundle, getImageKey, loadImage
+from spriteatlas import sprite_atlas
+
+#------------------------------SurfaceCache Class------------------------------
+#Stores resized copies of images so that the same image is never resampled twice at the same size, e.g. the title deed shown every frame
+#Scaled copies are kept in least-recently-used order, and the oldest ones are thrown away once there are more than max_entries
+class SurfaceCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.scaled = OrderedDict() #(source surface, size, smooth) -> scaled surface, most recently used last
+        self.loaded = {} #File path -> loaded surface. Never evicted, as only a fixed set of image files is ever loaded
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    #Return a copy of source scaled to size ([width, height]), resampling it only if this has not been done recently
+    #smooth chooses between pygame.transform.smoothscale (default) and the faster, lower quality pygame.transform.scale
+    #Asking for the size the source already is returns the source itself (resampling would only copy it), so e.g. a die face in the sprite atlas is drawn straight from the atlas
+    def scale(self, source, size, smooth=True):
+        if source.get_width() == int(size[0]) and source.get_height() == int(size[1]):
+            return source
+        key = (source, int(size[0]), int(size[1]), smooth)
+        ret_surface = self.scaled.get(key)
+        if ret_surface != None:
+            self.hits += 1
+            self.scaled.move_to_end(key) #Now the most recently used
+            return ret_surface
+
+        self.misses += 1
+        if smooth:
+            ret_surface = pygame.transform.smoothscale(source, [key[1], key[2]])
+        else:
+            ret_surface = pygame.transform.scale(source, [key[1], key[2]])
+        self.scaled[key] = ret_surface
+        if len(self.scaled) > self.max_entries:
+            self.scaled.popitem(last=False) #Remove the least recently used
+            self.evictions += 1
+        return ret_surface
+
+    #Load an image file (converted to the display's format, see loadImage), only reading it from disk the first time it is asked for
+    def load(self, path):
+        if path not in self.loaded:
+            self.loaded[path] = loadImage(path)
+        return self.loaded[path]
+
+    #Load an image file and scale it, both through the cache
+    #If the image is in the sprite atlas, or has been baked into the asset bundle, at this size, that is used instead and the file is never read
+    def loadScaled(self, path, size, smooth=True):
+        baked = sprite_atlas.get(getImageKey(path, size, smooth))
+        if baked != None:
+            return baked
+        baked = asset_bundle.get(getImageKey(path, size, smooth))
+        if baked != None:
+            return baked
+        return self.scale(self.load(path), size, smooth)
+
+    #Fraction of scale requests that did not need any resampling
+    def getHitRate(self):
+        if self.hits + self.misses == 0:
+            return 0
+        return self.hits / (self.hits + self.misses)
+
+    def clear(self):
+        self.scaled.clear()
+        self.loaded.clear()
+
+
+scaled_cache = SurfaceCache() #Cache shared by every screen, so images used in more than one place are only scaled once
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+import pygame
+
+#------------------------------TextCache Class------------------------------
+#Stores rendered text so that strings drawn every frame (player names, money, button captions etc.) are only rendered when they change
+#Works like SurfaceCache: least-recently-used entries are thrown away once there are more than max_entries
+class TextCache:
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.rendered = OrderedDict() #(font, text, antialias, colour) -> rendered surface, most recently used last
+        self.sizes = OrderedDict() #(font, text) -> (width, height) of the text
+        self.fonts = {} #(name, size, bold, italic) -> pygame font, so that every screen shares the same font objects (and so the same cached texts)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.frame_renders = 0 #Texts actually rendered since the start of the current frame
+        self.last_frame_renders = 0 #Texts rendered during the previous frame. Should be 0 on a screen where nothing is changing
+
+    #Same as pygame.font.SysFont, but each font is only created once. Screens create their fonts every time they are opened,
+    #and texts rendered in a new font object would never match the ones already cached
+    def getFont(self, name, size, bold=False, italic=False):
+        key = (name, size, bold, italic)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.SysFont(name, size, bold, italic)
+        return self.fonts[key]
+
+    #Same as font.render(text, antialias, colour), but only renders text that is not already cached
+    def render(self, font, text, antialias, colour):
+        key = (font, text, antialias, tuple(colour)) #Colour made into a tuple, as pygame.Color objects and lists cannot be used as keys
+        ret_surface = self.rendered.get(key)
+        if ret_surface != None:
+            self.hits += 1
+            self.rendered.move_to_end(key)
+            return ret_surface
+
+        self.misses += 1
+        self.frame_renders += 1
+        ret_surface = font.render(text, antialias, colour)
+        self.rendered[key] = ret_surface
+        if len(self.rendered) > self.max_entries:
+            self.rendered.popitem(last=False)
+            self.evictions += 1
+        return ret_surface
+
+    #Same as font.size(text), but cached in the same way as render
+    def size(self, font, text):
+        key = (font, text)
+        ret_size = self.sizes.get(key)
+        if ret_size != None:
+            self.sizes.move_to_end(key)
+            return ret_size
+
+        ret_size = font.size(text)
+        self.sizes[key] = ret_size
+        if len(self.sizes) > self.max_entries:
+            self.sizes.popitem(last=False)
+        return ret_size
+
+    #Called once per frame by each screen's loop, to keep count of how many texts were rendered during the frame
+    def endFrame(self):
+        self.last_frame_renders = self.frame_renders
+        self.frame_renders = 0
+
+    def clear(self):
+        self.rendered.clear()
+        self.sizes.clear()
+        self.fonts.clear()
+
+
+text_cache = TextCache() #Cache shared by every screen
@@ -1,28 +1,19 @@
 import pygame
 from pygame.locals import *
-from copy import copy #Used when swapping and copy objects in arrays (e.g. the 2D array quicksort algorithm)
 import numpy as np
 
 from cls import *
 from lib import getObtainMon, displayButtonRect
 from msgbox import MessageBox
+from imgcache import text_cache, scaled_cache
+from framesched import frame_scheduler
+from frameprof import frame_profiler
 
 #------------------------------Leaderboards Functions------------------------------
 #Determine how much a certain player has spent on all of their properties, upgrades etc.
+#This is kept as a running total in the player's Portfolio, so no board scan is needed
 def getAssetsVal(board, player_num):
-    ret_val = 0
-
-    for counter in range(board.max_pos + 1):
-        if board.getProp(counter).prop_type == Prop_Type.NORMAL:
-            if board.getProp(counter).prop_owner == player_num:
-                ret_val += board.getProp(counter).cost
-                ret_val += (board.getProp(counter).CH_cost * board.getProp(counter).C_Houses)
-                ret_val += (board.getProp(counter).TB_cost * board.getProp(counter).T_Blocks)
-
-        if board.getProp(counter).prop_type == Prop_Type.SCHOOL or board.getProp(counter).prop_type == Prop_Type.STATION:
-            if board.getProp(counter).prop_owner == player_num:
-                ret_val += board.getProp(counter).cost
-    return ret_val
+    return board.getPortfolio(player_num).assets_val
 
 #Create a 2D array to store the leaderboards data
 #One column for player numbers, one for total money, one for assets value (includes money) and one for obtainable money (also includes the player's money)
@@ -39,53 +30,86 @@ def setup2DArray(gameObj):
             arr_count += 1
     return ret_2D
 
-#Used for sorting the player data on a certain column in the 2D array (one column for each comparable attribute)
-#asc is a boolean storing whether the array is being sorted ascending or descending (True for ascending, False for descending)
-def quickSort(sort_arr, first, last, sort_col, asc):
-    low = first
-    high = last
-    midValue = sort_arr[int((first+last)/2)][sort_col] #Middle item in the array
-
-    while low <= high:
-        if asc:
-            while sort_arr[low][sort_col] < midValue:
-                low += 1
-            while sort_arr[high][sort_col] > midValue:
-                high -= 1
-        else:
-            while sort_arr[low][sort_col] > midValue:
-                low += 1
-            while sort_arr[high][sort_col] < midValue:
-                high -= 1
-
-        if low <= high:
-            sort_arr[low], sort_arr[high] = copy(sort_arr[high]), copy(sort_arr[low]) #Swap the two rows
-            #copy is used here as otherwise, python does not actually copy the data, rather just pointers which mean the array ends up unsorted and with duplicated rows, despite a perfectly working algorithm
-            low += 1
-            high -= 1
-
-    if first < high:
-        sort_arr = quickSort(sort_arr, first, high, sort_col, asc) #Recursively call function, with differing partitions on the array
-
-    if low < last:
-        sort_arr = quickSort(sort_arr, low, last, sort_col, asc) #Recursively call function, with differing partitions on the array
-
-    return sort_arr #Pass the array back out to where it was called, ending this level of recursion
+#Order in which to show the rows of the 2D array when sorting on a certain column (one column for each comparable attribute)
+#asc is a boolean storing whether the column is sorted ascending or descending (True for ascending, False for descending)
+#Ties are broken by each of tie_cols in turn (largest first), then by player number; by default tie_cols is the other two money columns
+#Returns an array of row indexes (a permutation) rather than sorting the array itself, so the rows are never copied and one array can be shown in several orders
+def getSortOrder(lead_arr, sort_col, asc, tie_cols=None):
+    if tie_cols == None:
+        tie_cols = [col for col in (1, 2, 3) if col != sort_col]
+    primary = lead_arr[:, sort_col]
+    if not asc:
+        primary = -primary
+    #np.lexsort sorts on the last key first, so the keys are given from least to most important
+    keys = [lead_arr[:, 0]] + [-lead_arr[:, col] for col in reversed(tie_cols)] + [primary]
+    return np.lexsort(keys)
+
+
+#------------------------------Leaderboard_Cache Class------------------------------
+#Keeps the leaderboards table, its sort orders and its rendered rows until the game changes, which Game.state_version tells it
+#So the table is not worked out again (setup2DArray) each time the screen is opened, and an open leaderboards screen only has to blit one surface for all of its rows
+class Leaderboard_Cache:
+    def __init__(self):
+        self.game = None #Game the table is for
+        self.state_version = -1 #Game.state_version when the table was made
+        self.lead_arr = None
+        self.sort_orders = {} #(column, ascending) -> order of the rows
+        self.row_surfaces = {} #(column, ascending) -> surface with every row of the table drawn on it in that order
+        self.builds = 0 #Times the table has been worked out
+        self.row_renders = 0 #Times a surface of rows has been drawn
+
+    #Make sure the table is for the current state of gameObj, working it out again (and throwing away everything made from it) if not
+    def update(self, gameObj):
+        if gameObj is not self.game or gameObj.state_version != self.state_version:
+            self.game = gameObj
+            self.state_version = gameObj.state_version
+            self.lead_arr = setup2DArray(gameObj)
+            self.sort_orders.clear()
+            self.row_surfaces.clear()
+            self.builds += 1
+
+    def getSortOrder(self, sort_col, asc):
+        key = (sort_col, asc)
+        if key not in self.sort_orders: #Each order is only worked out the first time it is asked for
+            self.sort_orders[key] = getSortOrder(self.lead_arr, sort_col, asc)
+        return self.sort_orders[key]
+
+    #Surface showing the rows of the table sorted on a column, one every y_space pixels. col_x are the x co-ordinates of the columns on the surface
+    def getRowsSurface(self, font, sort_col, asc, width, y_space, col_x):
+        key = (sort_col, asc)
+        if key not in self.row_surfaces:
+            rows_surface = pygame.Surface((width, max(1, self.lead_arr.shape[0] * y_space)))
+            rows_surface.fill((255,255,255))
+            y_pos = 0
+            for row_num in self.getSortOrder(sort_col, asc):
+                row_texts = [self.game.getPlayer(self.lead_arr[row_num][0]).player_name, str(self.lead_arr[row_num][1]), str(self.lead_arr[row_num][2]), str(self.lead_arr[row_num][3])]
+                for counter in range(4):
+                    rows_surface.blit(text_cache.render(font, row_texts[counter], True, (0,0,0)), [col_x[counter], y_pos])
+                y_pos += y_space
+            self.row_surfaces[key] = rows_surface
+            self.row_renders += 1
+        return self.row_surfaces[key]
+
+    def getReport(self):
+        return 'Leaderboards: table worked out %d times, rows drawn %d times' % (self.builds, self.row_renders)
+
+
+leaderboard_cache = Leaderboard_Cache() #Shared by every visit to the leaderboards screen
 
 
 #------------------------------Leaderboards Method------------------------------
 def Leaderboards(mainGame, screen, clock):
-    font_48 = pygame.font.SysFont('Arial', 48) #Font for title and name
-    font_40 = pygame.font.SysFont('Arial', 40) #Font for the "?" and Exit buttons
-    font_28 = pygame.font.SysFont('Arial', 28) #Font for actual leaderboards and attributes
-    font_32b = pygame.font.SysFont('Arial', 32, True) #Font for column headings
+    font_48 = text_cache.getFont('Arial', 48) #Font for title and name
+    font_40 = text_cache.getFont('Arial', 40) #Font for the "?" and Exit buttons
+    font_28 = text_cache.getFont('Arial', 28) #Font for actual leaderboards and attributes
+    font_32b = text_cache.getFont('Arial', 32, True) #Font for column headings
 
-    lead_arr = setup2DArray(mainGame)
+    leaderboard_cache.update(mainGame) #Nothing on this screen changes the game, so this only has to be checked when it is opened
 
     #Arrow images to be displayed on the buttons that are used by the player for choosing which column to sort on and whether to sort ascending or descending
-    arrow_both = pygame.image.load("img/Arrows/both.png")
-    arrow_up = pygame.image.load("img/Arrows/up.png")
-    arrow_down = pygame.image.load("img/Arrows/down.png")
+    arrow_both = scaled_cache.load("img/Arrows/both.png") #Only read from disk the first time the leaderboards are shown
+    arrow_up = scaled_cache.load("img/Arrows/up.png")
+    arrow_down = scaled_cache.load("img/Arrows/down.png")
     
     #Initialise button array
     sort_buts = [pygame.Rect(360,80,40,40), pygame.Rect(610,80,40,40), pygame.Rect(940,80,40,40)]
@@ -96,13 +120,13 @@ def Leaderboards(mainGame, screen, clock):
     msgBox = MessageBox(screen, 'Total Money measures simply how much money each player has in the Bank. \n Total Assets counts the values of all owned properties, upgrades, etc. based on how much was paid for them initially. \n Obtainable Money is how much money each player could get if they were to sell off all of their properties and the like.', 'Leaderboards: Explained')
     msgBox.should_exit = True
     
-    tit_text = font_48.render('Viewing Leaderboards:', True, (0,0,0)) #Render title at top left of screen
-    head_1 = font_32b.render('Player', True, (0,0,0))
-    head_2 = font_32b.render('Total Money', True, (0,0,0))
-    head_3 = font_32b.render('Total Assets', True, (0,0,0))
-    head_4 = font_32b.render('Obtainable Money', True, (0,0,0))
-    mon_text = font_48.render(mainGame.getCurPlayer().player_name, True, (0,0,0)) #Render player money on screen
-    f_width, f_height = font_48.size(mainGame.getCurPlayer().player_name)
+    tit_text = text_cache.render(font_48, 'Viewing Leaderboards:', True, (0,0,0)) #Render title at top left of screen
+    head_1 = text_cache.render(font_32b, 'Player', True, (0,0,0))
+    head_2 = text_cache.render(font_32b, 'Total Money', True, (0,0,0))
+    head_3 = text_cache.render(font_32b, 'Total Assets', True, (0,0,0))
+    head_4 = text_cache.render(font_32b, 'Obtainable Money', True, (0,0,0))
+    mon_text = text_cache.render(font_48, mainGame.getCurPlayer().player_name, True, (0,0,0)) #Render player money on screen
+    f_width, f_height = text_cache.size(font_48, mainGame.getCurPlayer().player_name)
 
     y_top = 120 #First y co-ordinate for a row of details
     y_space = 40 #Co-ordinate spacing between rows
@@ -111,10 +135,14 @@ def Leaderboards(mainGame, screen, clock):
     sort_column = 1
     sort_asc = False
     sort_but_click = -1
-    lead_arr = quickSort(lead_arr, 0, lead_arr.shape[0]-1, sort_column, sort_asc)
+    rows_x = 20 #Left edge of the surface the rows are drawn on, just inside the black border
+    frame_profiler.setScreen('Leaderboards') #Names the spans recorded from here on
     leaderboards_running = True
     while leaderboards_running: #Main loop for this part of the program
+        frame_profiler.start('frame')
+        frame_profiler.start('events')
         for event in pygame.event.get():
+            frame_profiler.handleInputEvent(event)
             for but in leader_buts:
                 but.handle_input_event(event)
 
@@ -134,7 +162,9 @@ def Leaderboards(mainGame, screen, clock):
                     for counter in range(3): #Cycle through all the arrays of buttons to see if any have been clicked
                         if sort_buts[counter].collidepoint(mouse_pos):
                             sort_but_click = counter
+        frame_profiler.stop('events')
 
+        frame_profiler.start('draw')
         screen.fill((255,255,255))
         screen.blit(tit_text, [10, 10])
         screen.blit(mon_text, [(770-f_width), 10])
@@ -157,19 +187,11 @@ def Leaderboards(mainGame, screen, clock):
             else:
                 screen.blit(arrow_both, [sort_buts[counter].x, sort_buts[counter].y])
 
-        y_pos = y_top #Y co-ordinate of the first row of data
-        for counter in range(lead_arr.shape[0]):
-            text_1 = font_28.render(mainGame.getPlayer(lead_arr[counter][0]).player_name, True, (0,0,0)) #Property name/title
-            screen.blit(text_1, [30, y_pos])
-            text_2 = font_28.render(str(lead_arr[counter][1]), True, (0,0,0)) 
-            screen.blit(text_2, [200, y_pos])
-            text_3 = font_28.render(str(lead_arr[counter][2]), True, (0,0,0)) 
-            screen.blit(text_3, [450, y_pos])
-            text_4 = font_28.render(str(lead_arr[counter][3]), True, (0,0,0))
-            screen.blit(text_4, [700, y_pos])
-
-            y_pos += y_space #Increment y co-ordinate variable by the difference in co-ordinates between each row, as already defined
+        #All of the rows, drawn when the game or the sort order last changed
+        screen.blit(leaderboard_cache.getRowsSurface(font_28, sort_column, sort_asc, 980, y_space, [30-rows_x, 200-rows_x, 450-rows_x, 700-rows_x]), [rows_x, y_top])
+        frame_profiler.stop('draw')
 
+        frame_profiler.start('update')
         if sort_but_click != -1:
             if sort_column == sort_but_click+1:
                 sort_asc = not sort_asc
@@ -177,8 +199,6 @@ def Leaderboards(mainGame, screen, clock):
                 sort_column = sort_but_click + 1
                 sort_asc = False
 
-            lead_arr = quickSort(lead_arr, 0, lead_arr.shape[0]-1, sort_column, sort_asc)
-
         if leader_buts[0].clicked():
             leaderboards_running = False
             gotoScreen = 1
@@ -187,6 +207,7 @@ def Leaderboards(mainGame, screen, clock):
             msgBox.should_exit = False
 
         msgBox.update()
+        frame_profiler.stop('update')
         if msgBox.should_exit == False:
             msgBox.draw(screen)
 
@@ -194,6 +215,10 @@ def Leaderboards(mainGame, screen, clock):
             but.render(screen)
 
         sort_but_click = -1
-        clock.tick(fps) #10 fps currently, but could easily be changed to update more or less often
-        pygame.display.flip() #Refresh display from a pygame perspective, to reflect the screen.blit()s
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
+        frame_profiler.drawOverlay(screen)
+        with frame_profiler.span('flip'):
+            pygame.display.flip() #Refresh display from a pygame perspective, to reflect the screen.blit()s
+        frame_profiler.stop('frame') #Everything but the wait for the next frame
+        frame_scheduler.waitForFrame(clock, fps) #At most 10 fps, and sleeps until there is input when nothing is happening
     return mainGame, gotoScreen #Pass the Game object and the integer storing where the game will go to next back out to the main game loop
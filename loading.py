@@ -6,6 +6,12 @@ import os
 import ctypes #For getting screen dimensions
 
 from anigif import AnimatedGif
+from imgcache import text_cache
+from assetbundle import loadImage, setDisplayFormat
+from framesched import frame_scheduler
+from bgload import background_loader
+from spriteatlas import sprite_atlas
+from new import preloadGame
 from cls import Button
 from lib import getFileLines
 
@@ -38,13 +44,13 @@ def LoadScreen(clock):
     tipsArr = getTipsFromFile("data/Tips.txt", tips_num)
     tip_use = getNewTip("", tipsArr) #Choose a tip to display first
 
-    tip_font = pygame.font.SysFont('Arial', 24) #Font used to display a tip
-    tip_text = tip_font.render(tip_use, True, (255,255,255)) #Actually render the tip text in the recently-created font
-    t_width, t_height = tip_font.size(tip_use) #Get width and height for centring the text
+    tip_font = text_cache.getFont('Arial', 24) #Font used to display a tip
+    tip_text = text_cache.render(tip_font, tip_use, True, (255,255,255)) #Actually render the tip text in the recently-created font
+    t_width, t_height = text_cache.size(tip_font, tip_use) #Get width and height for centring the text
 
     #Displays the text "Top Tip:", essentially showing what the tips are
-    tip_text2 = tip_font.render("Top Tip:", True, (255,255,255))
-    t_width2, t_height2 = tip_font.size("Top Tip:")
+    tip_text2 = text_cache.render(tip_font, "Top Tip:", True, (255,255,255))
+    t_width2, t_height2 = text_cache.size(tip_font, "Top Tip:")
 
     #Create array of 12 strings, containing the paths of each of the frames of the coin animation
     imagesCA = np.array([" "*32] * 12)
@@ -55,10 +61,7 @@ def LoadScreen(clock):
     height = 360
     width = 936
 
-    main = pygame.transform.smoothscale(pygame.image.load("img/Title.png"), [width, int(height/2)]) #Dunfermline-opoly title
-    coin1 = AnimatedGif(int(50*width/468),int(210*height/360),int(64*width/468),int(64*width/468),imagesCA) #Two coin animations at the bottom-left and bottom-right corners of the screen
-    coin2 = AnimatedGif(int(354*width/468),int(210*height/360),int(64*width/468),int(64*width/468),imagesCA)#Coin animations are animated GIFS created using the AnimatedGif class
-    play_but = Button((width-200)/2, (850-height)/2, 200, 80, "Play", pygame.font.SysFont('Arial', 48))
+    play_but = Button((width-200)/2, (850-height)/2, 200, 80, "Play", text_cache.getFont('Arial', 48))
 
     user32 = ctypes.windll.user32
     screen_w = user32.GetSystemMetrics(0)
@@ -68,11 +71,31 @@ def LoadScreen(clock):
     screen = pygame.display.set_mode([width,height], pygame.NOFRAME)
     screen.fill((0,0,0))
 
+    setDisplayFormat() #Images are converted to the display's pixel format as they are loaded, which is only known now the display has been created
+    main = loadImage("img/Title.png", [width, int(height/2)]) #Dunfermline-opoly title
+
+    #The coin frames go in the sprite atlas
+    coin_w = int(64*width/468)
+    sprite_atlas.build([[frame_path, [coin_w, coin_w], False] for frame_path in imagesCA]) #Scaled as AnimatedGif scales them
+    coin1 = AnimatedGif(int(50*width/468),int(210*height/360),coin_w,coin_w,imagesCA) #Two coin animations at the bottom-left and bottom-right corners of the screen
+    coin2 = AnimatedGif(int(354*width/468),int(210*height/360),coin_w,coin_w,imagesCA)#Coin animations are animated GIFS created using the AnimatedGif class
+
+    preloadGame(background_loader) #Load the board, decks, title deeds and the rest of the sprite atlas on worker threads while the loading screen is shown, so the game can be created straight away later
+
+    #The screen is only redrawn when the coins move on a frame, the tip changes, or there is input
+    frame_scheduler.setTimer('gif', coin1.frameTime)
+    frame_scheduler.setTimer('tip', 5000) #New tip every 5 seconds
+
     running = True
-    tip_counter = 0 #Counts how many frames the current tip has been displayed for
+    new_tip = False
     while running:
         for event in pygame.event.get():
             play_but.handle_input_event(event)
+            if frame_scheduler.isTimer(event, 'gif'):
+                coin1.nextFrame()
+                coin2.nextFrame()
+            if frame_scheduler.isTimer(event, 'tip'):
+                new_tip = True
             if event.type == pygame.QUIT:
                 running = False
                 pygame.quit()
@@ -84,15 +107,15 @@ def LoadScreen(clock):
         #Clear screen and display title, and the current frame of each GIF                
         screen.fill((0,0,0))
         screen.blit(main, [0,0])
-        screen.blit(coin1.getCurFrame(), [coin1.gif_x,coin1.gif_y])
-        screen.blit(coin2.getCurFrame(), [coin2.gif_x,coin2.gif_y])
+        screen.blit(coin1.getFrame(), [coin1.gif_x,coin1.gif_y])
+        screen.blit(coin2.getFrame(), [coin2.gif_x,coin2.gif_y])
 
-        if tip_counter > 50: #50 frames = 5 seconds
-            #Reset tip counter, randomly choose a new, different tip and render that in the appropriate font
-            tip_counter = 0
+        if new_tip:
+            #Randomly choose a new, different tip and render that in the appropriate font
+            new_tip = False
             tip_use = getNewTip(tip_use, tipsArr)
-            tip_text = tip_font.render(tip_use, True, (255,255,255)) #Recreate the string in pygame text so that it can be displayed on screen
-            t_width, t_height = tip_font.size(tip_use) #Used for centring the text
+            tip_text = text_cache.render(tip_font, tip_use, True, (255,255,255)) #Recreate the string in pygame text so that it can be displayed on screen
+            t_width, t_height = text_cache.size(tip_font, tip_use) #Used for centring the text
 
         #Display the tip title and the actual tip itself
         screen.blit(tip_text2, [(width-t_width2)/2, (330-t_height2)/2])
@@ -100,10 +123,17 @@ def LoadScreen(clock):
 
         #Display the Play button
         play_but.render(screen)
+
+        #Progress bar along the bottom of the screen, filled as the background loader's tasks are done (moves on when the coins do). Hidden once everything is loaded
+        if not background_loader.isDone():
+            pygame.draw.rect(screen, (80,80,80), pygame.Rect(20, height-10, width-40, 4))
+            pygame.draw.rect(screen, (255,255,255), pygame.Rect(20, height-10, int((width-40)*background_loader.getProgress()), 4))
         
         if play_but.clicked():
             running = False
 
-        tip_counter = tip_counter + 1
-        clock.tick(10)
-        pygame.display.flip() #Update display
\ No newline at end of file
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
+        pygame.display.flip() #Update display
+        if running:
+            frame_scheduler.waitForFrame(clock, 10) #Sleep until the next coin frame, tip or input
+    frame_scheduler.clearTimers()
\ No newline at end of file
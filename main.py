@@ -4,16 +4,26 @@ import ctypes #For getting screen dimensions
 
 from cls import * #All game classes
 
-from details import PropDetails
-from leaderboard import Leaderboards
+from details import PropDetails, details_table
+from leaderboard import Leaderboards, leaderboard_cache
 from loading import LoadScreen
 from maingame import MainScreen
 from new import NewGame
 from pause import PauseMenu
+from framesched import frame_scheduler
+from savefile import save_writer
+from assetbundle import asset_bundle, setDisplayFormat
+from bgload import background_loader
+from deedfactory import deed_factory
+from spriteatlas import sprite_atlas
+from frameprof import frame_profiler
 
 
 #------------------------------Main Game Loop------------------------------
 clock = pygame.time.Clock()
+frame_profiler.setDumpPath(os.environ.get('DFO_PROFILE')) #If set to a .json or .csv file, frame times are recorded all game and written there on exit
+if not asset_bundle.open() and asset_bundle.changed_source != None: #Pre-scaled images and title deeds built by bundle.py, if there is an up to date bundle; otherwise everything is loaded from the image files as before
+    print('Asset bundle is out of date (' + asset_bundle.changed_source + ' has changed), so is not being used. Run bundle.py to rebuild it')
 LoadScreen(clock)
 
 user32 = ctypes.windll.user32
@@ -24,9 +34,11 @@ os.environ['SDL_VIDEO_WINDOW_POS'] = "%d,%d" % ((screen_w - 1024)/2,(screen_h -
 screen = pygame.display.set_mode([1024,768]) #Create screen in fullscreen mode and fill white
 pygame.display.set_caption('Dunfermline-opoly')
 screen.fill((255,255,255))
+setDisplayFormat() #The new window's pixel format, which images loaded from now on are converted to
 
 pygame.mixer.music.load('music.mp3') #Load in and set background music to play endlessly
 pygame.mixer.music.play(-1)
+pygame.mixer.music.set_endevent(frame_scheduler.music_end) #Wakes the screens if the music ever stops
 
 nextScreen = 0
 mGame = None #Create blank object that will store the Game object
@@ -42,4 +54,18 @@ while nextScreen != -1: #Main Game Loop
     elif nextScreen == 4: #Pause Menu
         mGame, nextScreen = PauseMenu(mGame, screen, clock)
     
+save_writer.flush(10) #Let the last autosave finish writing before closing (but do not hang if the disk has gone away)
+if os.environ.get('DFO_REPORT'): #Set to anything to print what the schedulers, caches and loaders did during the game
+    print(frame_scheduler.getReport()) #How much CPU the screens were using by the end
+    print(save_writer.getReport())
+    print(asset_bundle.getReport())
+    print(background_loader.getReport())
+    print(deed_factory.getReport())
+    print(sprite_atlas.getReport())
+    print(leaderboard_cache.getReport())
+    print(details_table.getReport())
+if frame_profiler.dump_path != None or len(frame_profiler.times) > 0: #Only if frame times were recorded, by showing the overlay or setting DFO_PROFILE
+    print(frame_profiler.getReport())
+if frame_profiler.dump_path != None:
+    frame_profiler.dump()
 pygame.quit() #Quits the pygame module and hence the GUI
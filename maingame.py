@@ -3,6 +3,10 @@ from pygame.locals import *
 import numpy as np
 
 from msgbox import MessageBox
+from imgcache import scaled_cache, text_cache
+from dirtyrects import DirtyRegions
+from framesched import frame_scheduler
+from frameprof import frame_profiler
 from lib import getObtainMon, displayButtonRect
 from cls import *
 
@@ -73,7 +77,7 @@ def CreateThumbImg(img_path, bought):
     outline = pygame.Rect(0,0,45,70)
     pygame.draw.rect(thumb, (0,0,0), outline, 1) #Black border for the deed
 
-    deed_img = pygame.transform.smoothscale(pygame.image.load(img_path), [35, 40]) #Load deed image (school crest or station logo)
+    deed_img = scaled_cache.loadScaled(img_path, [35, 40]) #Load deed image (school crest or station logo). Cached, as the thumbnails are recreated every time the player changes
     thumb.blit(deed_img, [5,3]) #Display so this it is horizontally centred
 
     pygame.draw.line(thumb, (0,0,0), [5, 50], [40, 50], 4) #Create black lines as would appear on the fully sized deed
@@ -85,57 +89,67 @@ def CreateThumbImg(img_path, bought):
         thumb.blit(overlay, (0,0))
     return thumb
 
+@frame_profiler.timed()
 def displayPropThumbs(screen, thumbs, x_pos, y_pos):
     screen.blit(thumbs, [x_pos, y_pos])
 
 #Fill the screen white and show the game board
+@frame_profiler.timed()
 def displayScreenAndBoard(screen, board_img):
     screen.fill((255,255,255))
     screen.blit(board_img, [0,0])
 
 #Show text displaying the number of the current player
+@frame_profiler.timed()
 def displayWhoseTurn(screen, font, player):
-    turn_text = font.render(player.player_name, True, (0,0,0))
+    turn_text = text_cache.render(font, player.player_name, True, (0,0,0))
     screen.blit(turn_text, (650, 10))
 
 #Render text showing how much money the current player has on screen
+@frame_profiler.timed()
 def displayPlayerMoney(screen, font, player_money):
-    turn_text = font.render('£' + str(player_money), True, (0,0,0))
-    f_width, f_height = font.size('£' + str(player_money))
+    turn_text = text_cache.render(font, '£' + str(player_money), True, (0,0,0))
+    f_width, f_height = text_cache.size(font, '£' + str(player_money))
     screen.blit(turn_text, (1000-f_width, 10))
 
 #Display the token (i.e. the thing that moves around the board for the current player)
+@frame_profiler.timed()
 def displayPlayerToken(screen, player):
-    screen.blit(pygame.transform.smoothscale(player.player_piece.piece_img, [50,50]), [600, 0])
+    screen.blit(scaled_cache.scale(player.player_piece.piece_img, [50,50]), [600, 0])
 
 #Display the graphic for, and number owned, of the available Council House and Tower Block upgrades
+@frame_profiler.timed()
 def displayUpgrades(screen, ch_img, tb_img, prop, font):
     screen.blit(ch_img, [400, 615]) #Display Council House graphic on screen
     screen.blit(tb_img, [570, 610]) #Display Tower Block graphic on screen
-    ch_num = font.render(str(prop.C_Houses), True, (0,0,0)) #Generate and display the numbers of each of the upgardes horizontally next to the graphics
-    tb_num = font.render(str(prop.T_Blocks), True, (0,0,0))
+    ch_num = text_cache.render(font, str(prop.C_Houses), True, (0,0,0)) #Generate and display the numbers of each of the upgardes horizontally next to the graphics
+    tb_num = text_cache.render(font, str(prop.T_Blocks), True, (0,0,0))
     screen.blit(ch_num, [360, 630])
     screen.blit(tb_num, [530, 630])
 
 #For an owned property, display the player (Player 1, etc.) that actually is the owner
+@frame_profiler.timed()
 def displayOwner(screen, font, prop_owner):
-    own_text = font.render('Owned By: ' + prop_owner.player_name, True, (0,0,0)) #+1 because first player is indexed zero, and humans don't start counting at zero.
-    f_width, f_height = font.size('Owned By: ' + prop_owner.player_name)
+    own_text = text_cache.render(font, 'Owned By: ' + prop_owner.player_name, True, (0,0,0)) #+1 because first player is indexed zero, and humans don't start counting at zero.
+    f_width, f_height = text_cache.size(font, 'Owned By: ' + prop_owner.player_name)
     screen.blit(own_text, ((400-f_width)/2 + 600, 630))
 
 #Display a properties rent from the point of view of it having been paid
+@frame_profiler.timed()
 def displayPaidRent(screen, font, rent):
-    rent_text = font.render('You Paid £' + str(rent), True, (0,0,0))
-    f_width, f_height = font.size('You Paid £' + str(rent))
+    rent_text = text_cache.render(font, 'You Paid £' + str(rent), True, (0,0,0))
+    f_width, f_height = text_cache.size(font, 'You Paid £' + str(rent))
     screen.blit(rent_text, ((400-f_width)/2 + 600, 660))
     
 #Display a properties rent from its owner's perspecitve
+@frame_profiler.timed()
 def displayRent(screen, font, rent):
-    rent_text = font.render('Current Rent - £' + str(rent), True, (0,0,0))
-    f_width, f_height = font.size('Current Rent - £' + str(rent))
+    rent_text = text_cache.render(font, 'Current Rent - £' + str(rent), True, (0,0,0))
+    f_width, f_height = text_cache.size(font, 'Current Rent - £' + str(rent))
     screen.blit(rent_text, ((400-f_width)/2 + 600, 660))
 
 #Display a Council Chest or Pot Luck card (only called if applicable)
+@frame_profiler.timed()
 def displayCard(screen, display_card):
     screen.blit(display_card.card_img, [635, 270])
 
@@ -152,17 +166,19 @@ def renderCardTexts(font, card):
     t_count = 0
     for counter in range(len(effs)):
         if int(effs[counter]) != -1:
-            ret_texts[t_count] = font.render(texts[counter].replace("*", str(effs[counter])), True, (0,0,0)) #* is used where in the texts where it should be replaced with the number
+            ret_texts[t_count] = text_cache.render(font, texts[counter].replace("*", str(effs[counter])), True, (0,0,0)) #* is used where in the texts where it should be replaced with the number
             t_count += 1
     return effs, ret_texts
 
 #Display the two images representing the scores on the two rolled dice
+@frame_profiler.timed()
 def displayDiceScore(screen, img_1, img_2):
     if img_1 != None and img_2 != None: #If there are actually images to display
         screen.blit(img_1, [185, 690])
         screen.blit(img_2, [255, 690])
 
 #Display the tokens of every player on the relevant property on the board
+@frame_profiler.timed()
 def displayPieces(screen, gameObj):
     for counter in range(6):
         try:
@@ -184,12 +200,12 @@ def MainScreen(mainGame, screen, clock):
     sell_upgrade_button = pygame.Rect(520,700,150,50)
     in_jail_button = pygame.Rect(350,610,150,70)
 
-    TB_img = pygame.transform.smoothscale(pygame.image.load("img/Tower Block.png"), [75, 75])
-    CH_img = pygame.transform.smoothscale(pygame.image.load("img/Council House.png"), [75, 75])
+    TB_img = scaled_cache.loadScaled("img/Tower Block.png", [75, 75])
+    CH_img = scaled_cache.loadScaled("img/Council House.png", [75, 75])
     
-    font_40 = pygame.font.SysFont('Arial', 40) #Font object for button captions
-    font_28 = pygame.font.SysFont('Arial', 28) #font object for displaying whose turn it is (among other things)
-    font_20 = pygame.font.SysFont('Arial', 20) #Font for the upgrade buttons
+    font_40 = text_cache.getFont('Arial', 40) #Font object for button captions
+    font_28 = text_cache.getFont('Arial', 28) #font object for displaying whose turn it is (among other things)
+    font_20 = text_cache.getFont('Arial', 20) #Font for the upgrade buttons
     
     main_buts = [Button(10, 690, 150, 70, "Leaderboards", font_28),
                Button(10, 610, 150, 70, "Pause", font_40),
@@ -209,109 +225,8 @@ def MainScreen(mainGame, screen, clock):
     advanceOnBoxClose = False
     fps = 10 #Used to determine the waiting between updating the game display
 
-    main_screen_running = True
-    while main_screen_running:
-        for event in pygame.event.get():
-            for but in main_buts:
-                but.handle_input_event(event)
-
-            if msgBox != None:
-                msgBox.handle_input_event(event)
-                if exitOnBoxClose and msgBox.should_exit:
-                    main_screen_running = False
-                    gotoScreen = -1
-                if advanceOnBoxClose and msgBox.should_exit:
-                    mainGame.advancePlayer()
-                    mainGame.prop_thumbs = pygame.transform.smoothscale(CreateThumbs(mainGame.board, mainGame.cur_player), [385,170]) #Generate thumbnails for new player (here so it is only done when the player changes, not every frame change)
-                    advanceOnBoxClose = False
-                if msgBox.should_exit == False:
-                    break
-            if event.type == pygame.QUIT:
-                main_screen_running = False
-                gotoScreen = -1
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE: #Escape key exits the game
-                    main_screen_running = False
-                    gotoScreen = -1
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1: #Left mouse button
-                    mouse_pos = event.pos #Position of the cursor when nouse was clicked
-                    if buy_prop_button.collidepoint(mouse_pos):
-                        if mainGame.getCurProp().prop_owner == -1: #Property is unowned
-                            buy_but_click = True
-                        elif mainGame.getCurProp().prop_owner == mainGame.cur_player: #If owned by current player, it may be mortgaged
-                            mort_but_click = True
-                    if roll_dice_button.collidepoint(mouse_pos):
-                        if mainGame.controller.card_used == False:
-                            use_card_but_click = True #Roll dice button was clicked
-                        elif mainGame.controller.player_rolled == False:
-                            dice_but_click = True #End turn button was clicked
-                        else:
-                            turn_but_click = True #Button to apply card effects was clicked
-                    if in_jail_button.collidepoint(mouse_pos): #Button to pay £50 to get out of bogside was clicked
-                        leave_bogside_but_click = True
-                    if buy_upgrade_button.collidepoint(mouse_pos):
-                        buy_upgrade_but_click = True
-                    if sell_upgrade_button.collidepoint(mouse_pos):
-                        sell_upgrade_but_click = True
-                    
-                    
-        #Clear screen and display main board
-        displayScreenAndBoard(screen, mainGame.board.board_img)
-        
-        if dice_but_click: #If Roll Dice button was clicked
-            #Roll dice, move the piece accordingly, and display the dice rolls
-            mainGame.getDie(0).roll()
-            mainGame.getDie(1).roll()
-
-            dice_total = mainGame.getDiceTotal()
-            
-            if mainGame.getCurPlayer().player_inJail == False:
-                mainGame.getCurPlayer().movePlayer(dice_total, mainGame.board)
-            elif mainGame.getDie(0).cur_score == mainGame.getDie(1).cur_score: #Doubles rolled, so player gets out of bogside
-                mainGame.getCurPlayer().leaveJail()
-                mainGame.getCurPlayer().movePlayer(dice_total, mainGame.board)
-            #Player does not move otherwise, as they must be lost in bogside
-
-            #Generate the dice images
-            mainGame.controller.roll_img1 = pygame.transform.smoothscale(mainGame.getDie(0).getImg(), [70, 70])
-            mainGame.controller.roll_img2 = pygame.transform.smoothscale(mainGame.getDie(1).getImg(), [70, 70])
-
-            if mainGame.getDie(0).cur_score != mainGame.getDie(1).cur_score: #If a double has not been rolled (rolling a double gives the player another turn)
-                mainGame.controller.player_rolled = True #So player only gets another turn if they rolled doubles
-            mainGame.controller.may_buy = True
-
-            if mainGame.getDie(0).cur_score == mainGame.getDie(1).cur_score:
-                mainGame.controller.cur_doubles += 1
-                
-            if mainGame.controller.cur_doubles >= 3: #If player rolls 3 consecutive doubles, they go to Bogside
-                mainGame.sendCurPlayerToBog()
-                mainGame.controller.player_rolled = True #Will not get to roll again
-            
-            #Determine rent if applicable
-            mainGame.controller.turn_rent = mainGame.determineRent()
-
-            if mainGame.controller.turn_rent != 0:
-                mainGame.getCurPlayer().spendMoney(mainGame.controller.turn_rent) #Decrease the player's money and credit the owner of the property that amount
-                if mainGame.getCurProp().prop_type != Prop_Type.PAYMENT:
-                    mainGame.getPlayer(mainGame.getCurProp().prop_owner).addMoney(mainGame.controller.turn_rent)
-
-            #If the current space returns a card
-            if mainGame.getCurProp().prop_type == Prop_Type.POT_LUCK:
-                mainGame.controller.cur_card = mainGame.board.PL_Deck.getNextCard()
-            elif mainGame.getCurProp().prop_type == Prop_Type.COUNCIL_CHEST:
-                mainGame.controller.cur_card = mainGame.board.CC_Deck.getNextCard()
-
-            #If card will have just been returned, render the text that will show its effects
-            if mainGame.getCurProp().prop_type == Prop_Type.POT_LUCK or mainGame.getCurProp().prop_type == Prop_Type.COUNCIL_CHEST: #Card will have been returned
-                mainGame.controller.card_effs, mainGame.controller.card_texts = renderCardTexts(font_28, mainGame.controller.cur_card)
-                mainGame.controller.card_used = False
-                                
-            #If the player lands on the 'Go To Bogside' space
-            if mainGame.getCurProp().prop_type == Prop_Type.GO_TO_BOGSIDE:
-                mainGame.sendCurPlayerToBog()
-
-            
+    #Draw everything that is not part of the static background. Only ever called by DirtyRegions.redraw, with drawing clipped to the area being redrawn
+    def drawFrame():
         #Display whose turn it is, how much money this player has, and show their property overview
         displayWhoseTurn(screen, font_28, mainGame.getCurPlayer())
         displayPlayerMoney(screen, font_28, mainGame.getCurPlayer().player_money)
@@ -337,7 +252,7 @@ def MainScreen(mainGame, screen, clock):
 
         #Display title deed for property currently on
         if mainGame.getCurProp().prop_type == Prop_Type.NORMAL or mainGame.getCurProp().prop_type == Prop_Type.SCHOOL or mainGame.getCurProp().prop_type == Prop_Type.STATION: #If property actually will have a title deed to display
-            title_deed = pygame.transform.smoothscale(mainGame.getCurProp().getTitleDeed(), [270,400])
+            title_deed = scaled_cache.scale(mainGame.getCurProp().getTitleDeed(), [270,400]) #Only resampled when the deed shown changes, rather than every frame
             screen.blit(title_deed, [665, 230])
 
             if mainGame.getCurProp().prop_type == Prop_Type.NORMAL:
@@ -379,8 +294,8 @@ def MainScreen(mainGame, screen, clock):
             else:
                 tit_str = "On The Paths" #In the same space but can move freely (i.e. 'not in jail')
                 
-            tit_text = font_40.render(tit_str, True, (0,0,0)) #Render the property name as it does not have a title deed that can do so
-            t_width, t_height = font_40.size(tit_str)
+            tit_text = text_cache.render(font_40, tit_str, True, (0,0,0)) #Render the property name as it does not have a title deed that can do so
+            t_width, t_height = text_cache.size(font_40, tit_str)
             screen.blit(tit_text, [(400-t_width)/2 + 600, 220])
 
         if mainGame.getCurProp().prop_type == Prop_Type.NORMAL or mainGame.getCurProp().prop_type == Prop_Type.SCHOOL or mainGame.getCurProp().prop_type == Prop_Type.STATION or mainGame.getCurProp().prop_type == Prop_Type.PAYMENT: #If incurs a charge
@@ -404,27 +319,101 @@ def MainScreen(mainGame, screen, clock):
                     screen.blit(cur_text, [(400-w)/2 + 600, 480 + t_count*25])
                     t_count += 1
         
+        if msgBox != None and msgBox.should_exit == False:
+            msgBox.draw(screen)
+
+        for but in main_buts:
+            but.render(screen)
+
+    #Background holds everything that never changes while on this screen: the board itself and the fixed buttons
+    background = pygame.Surface(screen.get_size())
+    displayScreenAndBoard(background, mainGame.board.board_img)
+    for but in main_buts:
+        but.render(background)
+    regions = DirtyRegions(screen, background, {'board': pygame.Rect(0, 0, 600, 600), #Board and the players' pieces
+                                                'top': pygame.Rect(600, 0, 424, 50), #Current player's token, name and money
+                                                'thumbs': pygame.Rect(600, 50, 424, 170), #Property thumbnails
+                                                'panel': pygame.Rect(600, 220, 424, 548), #Title deed or card, owner, rent and buy/mortgage button
+                                                'controls': pygame.Rect(0, 600, 600, 168)}) #Dice, turn buttons and upgrades
+    shown_msg = None #Message box currently being shown, if any
+
+    frame_profiler.setScreen('MainScreen') #Names the spans recorded from here on
+    main_screen_running = True
+    while main_screen_running:
+        frame_profiler.start('frame')
+        frame_profiler.start('events')
+        for event in pygame.event.get():
+            frame_profiler.handleInputEvent(event)
+            for but in main_buts:
+                but.handle_input_event(event)
+
+            if msgBox != None:
+                msgBox.handle_input_event(event)
+                if exitOnBoxClose and msgBox.should_exit:
+                    main_screen_running = False
+                    gotoScreen = -1
+                if advanceOnBoxClose and msgBox.should_exit:
+                    mainGame.advancePlayer()
+                    mainGame.prop_thumbs = pygame.transform.smoothscale(CreateThumbs(mainGame.board, mainGame.cur_player), [385,170]) #Generate thumbnails for new player (here so it is only done when the player changes, not every frame change)
+                    advanceOnBoxClose = False
+                if msgBox.should_exit == False:
+                    break
+            if event.type == pygame.QUIT:
+                main_screen_running = False
+                gotoScreen = -1
+            if event.type == pygame.WINDOWEXPOSED: #Window was covered up, so what is on the screen can no longer be relied on
+                regions.markAll()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE: #Escape key exits the game
+                    main_screen_running = False
+                    gotoScreen = -1
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1: #Left mouse button
+                    mouse_pos = event.pos #Position of the cursor when nouse was clicked
+                    if buy_prop_button.collidepoint(mouse_pos):
+                        if mainGame.getCurProp().prop_owner == -1: #Property is unowned
+                            buy_but_click = True
+                        elif mainGame.getCurProp().prop_owner == mainGame.cur_player: #If owned by current player, it may be mortgaged
+                            mort_but_click = True
+                    if roll_dice_button.collidepoint(mouse_pos):
+                        if mainGame.controller.card_used == False:
+                            use_card_but_click = True #Roll dice button was clicked
+                        elif mainGame.controller.player_rolled == False:
+                            dice_but_click = True #End turn button was clicked
+                        else:
+                            turn_but_click = True #Button to apply card effects was clicked
+                    if in_jail_button.collidepoint(mouse_pos): #Button to pay £50 to get out of bogside was clicked
+                        leave_bogside_but_click = True
+                    if buy_upgrade_button.collidepoint(mouse_pos):
+                        buy_upgrade_but_click = True
+                    if sell_upgrade_button.collidepoint(mouse_pos):
+                        sell_upgrade_but_click = True
+        frame_profiler.stop('events')
+                    
+        frame_profiler.start('update')
+        if dice_but_click: #If Roll Dice button was clicked
+            #Roll dice, move the piece accordingly, and display the dice rolls
+            mainGame.rollDice()
+
+            #Generate the dice images (each face is only scaled the first time it is rolled)
+            mainGame.controller.roll_img1 = mainGame.getDie(0).getImg([70, 70])
+            mainGame.controller.roll_img2 = mainGame.getDie(1).getImg([70, 70])
+
+            #If card will have just been returned, render the text that will show its effects
+            if mainGame.getCurProp().prop_type == Prop_Type.POT_LUCK or mainGame.getCurProp().prop_type == Prop_Type.COUNCIL_CHEST: #Card will have been returned
+                mainGame.controller.card_effs, mainGame.controller.card_texts = renderCardTexts(font_28, mainGame.controller.cur_card)
+
+            
         if turn_but_click: #End Turn button
             #If player could sell some things to avoid going bankrupt
             cont = True
-            if mainGame.getCurPlayer().player_money < 0 and (getObtainMon(mainGame.board, mainGame.cur_player) + mainGame.getCurPlayer().player_money) >= 0:
+            obtain_mon = getObtainMon(mainGame.board, mainGame.cur_player)
+            if mainGame.getCurPlayer().player_money < 0 and (obtain_mon + mainGame.getCurPlayer().player_money) >= 0:
                 msgBox = MessageBox(screen, 'You need to ensure your money is 0 or above before you can finish your turn. Please sell or mortgage some assets to continue.', 'Not Enough Money')
                 cont = False
-            elif (getObtainMon(mainGame.board, mainGame.cur_player) + mainGame.getCurPlayer().player_money) < 0: #If it is impossible for a player to not end up in debt, they go bankrupt
-                mainGame.getCurPlayer().deactivate() #Remove player from the game
+            elif (obtain_mon + mainGame.getCurPlayer().player_money) < 0: #If it is impossible for a player to not end up in debt, they go bankrupt
+                mainGame.bankruptCurPlayer() #Remove player from the game, returning their properties to the bank
                 cont = False
-                for counter in range(mainGame.board.max_pos):
-                    if mainGame.board.getProp(counter).prop_type == Prop_Type.NORMAL:
-                        if mainGame.board.getProp(counter).prop_owner == mainGame.cur_player:
-                            mainGame.board.getProp(counter).p_owner = -1
-                            mainGame.board.getProp(counter).mortgage_status = False
-                            mainGame.board.getProp(counter).C_Houses = 0
-                            mainGame.board.getProp(counter).T_Blocks = 0
-                    if mainGame.board.getProp(counter).prop_type == Prop_Type.SCHOOL or mainGame.board.getProp(counter).prop_type == Prop_Type.STATION:
-                        if mainGame.board.getProp(counter).prop_owner == mainGame.cur_player:
-                            mainGame.board.getProp(counter).p_owner = -1
-                            mainGame.board.getProp(counter).mortgage_status = False
-                        
                 msgBox = MessageBox(screen, 'Unfortunately, this utopian capitalist world has ceased to be utopian for you: you have gone bankrupt and are no longer in the game.', 'Game Over')
                 advanceOnBoxClose = True
                 
@@ -439,66 +428,34 @@ def MainScreen(mainGame, screen, clock):
                 exitOnBoxClose = True
             
         #Button for buying a property has been clicked
-        if buy_but_click and (mainGame.getCurProp().prop_type == Prop_Type.NORMAL or mainGame.getCurProp().prop_type == Prop_Type.SCHOOL or mainGame.getCurProp().prop_type == Prop_Type.STATION): #Final check that the property can actually be owned
-            #Player wished to buy property
-            if mainGame.getCurProp().prop_owner == -1: #Property is unowned, hence can actually be bought
-                if mainGame.getCurPlayer().player_money >=  mainGame.getCurProp().cost:
-                    #Player has enough money
-                    mainGame.getCurPlayer().spendMoney(mainGame.getCurProp().cost) #Decrease the player's bank balance accordingly
-                    mainGame.getCurProp().buyProperty(mainGame.cur_player) #Change the property's status to track the new ownership
-                    mainGame.prop_thumbs = pygame.transform.smoothscale(CreateThumbs(mainGame.board, mainGame.cur_player), [385,170]) #Update title deed thumbnails to reflect newly purchased properties
+        if buy_but_click:
+            if mainGame.buyCurProp(): #Player wished to buy property, and had the money to do so
+                mainGame.prop_thumbs = pygame.transform.smoothscale(CreateThumbs(mainGame.board, mainGame.cur_player), [385,170]) #Update title deed thumbnails to reflect newly purchased properties
         
         #Button to apply the effects of a Pot Luck or Council Chest card
-        if use_card_but_click and mainGame.controller.cur_card != None: #Check there is a card to work with
-            mainGame.controller.card_used = True
-            mainGame.applyCardEffects() #Apply card effects
+        if use_card_but_click:
+            mainGame.useCard() #Apply card effects
 
         #All of the following may only be done if the current player owns the property
         #Button for mortgaging or unmortgaging a property
-        if mort_but_click and (mainGame.getCurProp().prop_type == Prop_Type.NORMAL or mainGame.getCurProp().prop_type == Prop_Type.SCHOOL or mainGame.getCurProp().prop_type == Prop_Type.STATION): #Final check that the property is one that may be mortgaged
-            if mainGame.getCurProp().prop_owner == mainGame.cur_player and mainGame.getCurProp().mortgage_status == False: #Property must be owned by the current player and not already mortgaged
-                mainGame.getCurProp().mortgage_status = True #Property is now mortgaged
-                mainGame.getCurPlayer().addMoney(int(mainGame.getCurProp().mortgage_val))
-            elif mainGame.getCurProp().prop_owner == mainGame.cur_player and mainGame.getCurProp().mortgage_status: #Property must be owned by the current player and is mortgaged
-                if mainGame.getCurPlayer().player_money >= mainGame.getCurProp().mortgage_val * 1.2: #Player has sufficient money to unmortgage the property (twice the money gotten by mortgaging it)
-                    mainGame.getCurProp().mortgage_status = False #Property is no longer in a state of being mortgaged
-                    mainGame.getCurPlayer().spendMoney(int(mainGame.getCurProp().mortgage_val * 1.2)) #Decrease player's money by the cost of unmortgaging the property
+        if mort_but_click:
+            mainGame.toggleMortgage(mainGame.getCurPlayer().player_pos)
         
         #Button for buying a Council House or Tower Block
-        if buy_upgrade_but_click and mainGame.getCurProp().prop_type == Prop_Type.NORMAL and mainGame.board.wholeGroupOwned(mainGame.cur_player, mainGame.getCurPlayer().player_pos): #Player wishes to upgrade the property and said upgrade can actually be purchaed
-            if mainGame.getCurProp().prop_owner == mainGame.cur_player: #May only be bought if the property is owned by the current player     
-                if mainGame.getCurProp().C_Houses < 4: #Fewer than 4  Council Houses, so these are the next upgrade to be bought 
-                    if mainGame.getCurPlayer().player_money >= (mainGame.getCurProp().CH_cost * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos)): #Player actually has enough money to buy the Council House upgrade
-                        mainGame.board.buyCHGroup(mainGame.cur_player, mainGame.getCurPlayer().player_pos) #Buy the Council Houses for the whole group
-                        mainGame.getCurPlayer().spendMoney(mainGame.getCurProp().CH_cost * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos)) #Decrease the player's money by the cost of a Council House for however many properties are in the group
-                elif mainGame.getCurProp().C_Houses == 4 and mainGame.getCurProp().T_Blocks == 0: #4 Council Houses and no Tower Blocks, so Tower Block can be bought 
-                    if mainGame.getCurPlayer().player_money >= (mainGame.getCurProp().TB_cost * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos)): #Player actually has enough money to buy the Tower Block upgrade
-                        mainGame.board.buyTBGroup(mainGame.cur_player, mainGame.getCurPlayer().player_pos) #Buy the Council Houses for the whole group
-                        mainGame.getCurPlayer().spendMoney(mainGame.getCurProp().TB_cost * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos)) #Decrease the player's money by the cost of a Tower Block for however many properties are in the group
+        if buy_upgrade_but_click:
+            mainGame.buyUpgrade(mainGame.getCurPlayer().player_pos)
 
         #Button for selling a Council House or Tower Block
-        if sell_upgrade_but_click and mainGame.getCurProp().prop_type == Prop_Type.NORMAL and mainGame.board.wholeGroupOwned(mainGame.cur_player, mainGame.getCurPlayer().player_pos): #Player wishes to upgrade the property and said upgrade can actually be purchaed
-            if mainGame.getCurProp().prop_owner == mainGame.cur_player: #May only be bought if the property is owned by the current player     
-                if mainGame.getCurProp().T_Blocks > 0: #Property has a Tower Block that can be sold
-                    mainGame.board.sellTBGroup(mainGame.cur_player, mainGame.getCurPlayer().player_pos) #Sell the Tower Blocks for the whole group
-                    mainGame.getCurPlayer().addMoney(int(mainGame.getCurProp().TB_cost/2 * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos))) #Increase the player's money by half of what the upgrades were bought for
-                elif mainGame.getCurProp().C_Houses > 0: #No Tower Blocks, buy some Council Houses which can instead be sold 
-                    mainGame.board.sellCHGroup(mainGame.cur_player, mainGame.getCurPlayer().player_pos) #Sell the Council Houses for the whole group
-                    mainGame.getCurPlayer().addMoney(int(mainGame.getCurProp().CH_cost/2 * mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos))) #Increase the player's money by half of what the upgrades were bought for
+        if sell_upgrade_but_click:
+            mainGame.sellUpgrade(mainGame.getCurPlayer().player_pos)
 
         #Button to buy a map out of Bogside for £50
-        if leave_bogside_but_click and (mainGame.getCurPlayer().player_money >= 50 or mainGame.getCurPlayer().player_hasBogMap) and mainGame.getCurPlayer().player_inJail:
-            mainGame.getCurPlayer().leaveJail()
-            if mainGame.getCurPlayer().player_hasBogMap == False:
-                mainGame.getCurPlayer().spendMoney(50)
-            else:
-                mainGame.getCurPlayer().useBogMap()
+        if leave_bogside_but_click:
+            mainGame.leaveBogside()
 
         if msgBox != None:
             msgBox.update()
-            if msgBox.should_exit == False:
-                msgBox.draw(screen)
-        
+
         if main_buts[2].clicked(): #Details
             main_screen_running = False
             gotoScreen = 2
@@ -508,9 +465,32 @@ def MainScreen(mainGame, screen, clock):
         if main_buts[1].clicked(): #Pause
             main_screen_running = False
             gotoScreen = 4
+        frame_profiler.stop('update')
+
+        #Work out which regions of the screen have changed since the last frame. Only these are redrawn and sent to the display
+        regions.setState('board', (mainGame.cur_player, tuple((player.player_piece.piece_x, player.player_piece.piece_y, player.player_active) for player in mainGame.players)))
+        regions.setState('top', (mainGame.cur_player, mainGame.getCurPlayer().player_money))
+        regions.setState('thumbs', id(mainGame.prop_thumbs)) #A new thumbnails image is created whenever they change
+        cur_prop = mainGame.getCurProp()
+        turn_state = (mainGame.cur_player, mainGame.getCurPlayer().player_pos, mainGame.getCurPlayer().player_inJail, mainGame.getCurPlayer().player_hasBogMap,
+                      getattr(cur_prop, 'prop_owner', -1), getattr(cur_prop, 'mortgage_status', False), getattr(cur_prop, 'C_Houses', 0), getattr(cur_prop, 'T_Blocks', 0),
+                      mainGame.controller.player_rolled, mainGame.controller.card_used, mainGame.controller.may_buy, mainGame.controller.turn_rent, id(mainGame.controller.cur_card),
+                      mainGame.board.countGroupSize(mainGame.cur_player, mainGame.getCurPlayer().player_pos)) #Whether the upgrade buttons and doubled rent are shown depends on how much of the group is owned
+        regions.setState('panel', turn_state)
+        regions.setState('controls', (turn_state, id(mainGame.controller.roll_img1), id(mainGame.controller.roll_img2)))
+        msg_state = None
+        if msgBox != None and msgBox.should_exit == False:
+            msg_state = id(msgBox)
+        if msg_state != shown_msg: #Message box has appeared or been closed, and it covers several regions
+            regions.markAll()
+            shown_msg = msg_state
+        if frame_profiler.overlay_rect != None: #Restore whatever the overlay was last drawn over (it is drawn again below if still shown)
+            regions.markRect(frame_profiler.overlay_rect)
+        with frame_profiler.span('draw'):
+            regions.redraw(drawFrame)
+        if frame_profiler.drawOverlay(screen):
+            pygame.display.update(frame_profiler.overlay_rect)
 
-        for but in main_buts:
-            but.render(screen)
 
         #Reset button booleans so that effects of clicking buttons do not happen more than once
         dice_but_click = False
@@ -521,6 +501,7 @@ def MainScreen(mainGame, screen, clock):
         sell_upgrade_but_click = False
         leave_bogside_but_click = False
         use_card_but_click = False
-        clock.tick(fps) #10 fps currently, but could easily be changed to update more or less often
-        pygame.display.flip() #Refresh display from a pygame perspective, to reflect the screen.blit()s
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
+        frame_profiler.stop('frame') #Everything but the wait for the next frame
+        frame_scheduler.waitForFrame(clock, fps) #At most 10 fps, and sleeps until there is input when nothing is happening
     return mainGame, gotoScreen #Pass the Game object and the integer storing where the game will go to next back out to the main game loop
@@ -7,6 +7,13 @@ from datetime import datetime #Getting the current date and time as understood b
 
 from textbox import TextBox
 from msgbox import MessageBox
+from imgcache import text_cache
+from assetbundle import getImageKey, loadImage, preloadImage
+from deedfactory import deed_factory
+from spriteatlas import sprite_atlas, loadSprite
+from bgload import background_loader
+from framesched import frame_scheduler
+from savefile import Save_Error, isSavePath, loadSave
 from cls import *
 from lib import getFileLines
 
@@ -49,7 +56,7 @@ def namesValid(boxes):
     else:
         return True
 
-def createPlayers(p_icons, boxes, board_dim, data_file_path): #Create Player objects using the names entered into text boxes and the corresponding icons
+def createPlayers(boxes, board_dim, data_file_path): #Create Player objects using the names entered into text boxes and the corresponding icons
     fh = open(data_file_path, "r")
     init_mon = int(fh.readline())
     fh.close()
@@ -59,7 +66,7 @@ def createPlayers(p_icons, boxes, board_dim, data_file_path): #Create Player obj
     p_counter = 0 #Stores which element in the new_players array is next to be instantiated
     for b_counter in range(6):
         if len(boxes[b_counter].getContents()) > 0: #Name must have been entered for a player to come into existence
-            p_piece = Player_Piece(player_temp.calcPieceX(0, board_dim/768), player_temp.calcPieceY(0, board_dim/768), pygame.transform.smoothscale(p_icons[b_counter], [32, 32]), b_counter) #Create piece separately
+            p_piece = Player_Piece(player_temp.calcPieceX(0, board_dim/768), player_temp.calcPieceY(0, board_dim/768), loadSprite("img/Pieces/" + str(b_counter+1) + ".png", [32, 32]), b_counter) #Create piece separately. Same image as a loaded game's pieces (see LoadPlayers)
             new_players[p_counter] = Player(init_mon, p_piece, 0, boxes[b_counter].getContents()) #Now create player. 1500 is the money and 0 is the initial board position
             p_counter += 1
     return new_players
@@ -67,14 +74,16 @@ def createPlayers(p_icons, boxes, board_dim, data_file_path): #Create Player obj
 def getCardEffects(card_texts_path_eff): #Loads text file describing the effects of the Pot Luck and Council Chest cards, e.g. "Pay £*", where the * will be replaced with a number later
     texts_num = getFileLines(card_texts_path_eff)
     card_effects = np.array([None] * texts_num) #None used so length of string is not limited
-    fh = open(card_texts_path_eff, "r")
+    fh = open(card_texts_path_eff, "r", encoding="cp1252") #File contains '£' signs saved in the Windows encoding, so this must be given for it to be read correctly on other systems
     for effects_counter in range(texts_num):
         card_effects[effects_counter] = fh.readline().strip()
     fh.close()
     return card_effects
 
 #Create the decks of Pot Luck and Council Chest cards, based off of data and images loading in from external files
-def createDeck(deck_name, card_base_path, card_texts_path, card_data_path, deck_size):
+#card_base_path may be None, in which case no card images are loaded (used for headless games)
+#deck_rng is the Game_RNG the deck is shuffled with; the random module is used if it is None
+def createDeck(deck_name, card_base_path, card_texts_path, card_data_path, deck_size, deck_rng=None):
     deck_cards = np.array([None] * deck_size) #Array of blank objects; will become array of individual Card objects
     card_effects = getCardEffects(card_texts_path)
     card_img = None #Blank object, later to become loaded-in pygame images
@@ -82,7 +91,8 @@ def createDeck(deck_name, card_base_path, card_texts_path, card_data_path, deck_
 
     fh = open(card_data_path, "r")
     for counter in range(deck_size): #Iterate up to deck_size-1
-        card_img = pygame.transform.smoothscale(pygame.image.load(card_base_path + str(counter + 1) + ".png"), [330, 200]) #Images are named "Pot Luck 1.png", for example. N.B. Numbering starts at one, hence the +1
+        if card_base_path != None:
+            card_img = loadSprite(card_base_path + str(counter + 1) + ".png", [330, 200]) #From the sprite atlas if it has been built, otherwise loaded (already scaled if it is in the asset bundle). Images are named "Pot Luck 1.png", for example. N.B. Numbering starts at one, hence the +1
         text_line = fh.readline()
         data_array = np.array(text_line.split(",")) #Values are comma-separated in the external file
         for d_count in range(len(data_array)): #Convert each of the elements in the array from String (as they will be coming from an external file) to numbers
@@ -91,13 +101,17 @@ def createDeck(deck_name, card_base_path, card_texts_path, card_data_path, deck_
         deck_cards[counter] = Card(deck_name, card_img, card_effects, data_array)
     fh.close()
 
-    ret_deck = Card_Deck(deck_cards)
+    ret_deck = Card_Deck(deck_cards, deck_rng)
     ret_deck.shuffleCards() #Randomly arrange the array of cards such that they will not be the same during every game
     return ret_deck
 
 #Creates an array of properties using data from a data file at the start of the game
-def LoadProperties(file_path):
+#If create_deeds is False, no title deeds are rendered or loaded (deeds stay None), so no fonts or images are needed
+#Title deeds come from the shared DeedFactory, so each one is only drawn once (and not at all if it is in the asset bundle or the disk cache)
+def LoadProperties(file_path, create_deeds=True):
     property_arr = np.array([None]*40) #Partition numpy array with 40 elements
+    if create_deeds:
+        deed_factory.openFile(file_path)
     fh = open(file_path, "r") #Opens the sequential file for reading
     for counter in range(40): #40 properties
         propType = int(fh.read(2)[:1]) #Reads in the first two characters in a line (one number and a separating comma) and then takes the first character. This leaves propType being an integer determining which type of property the line is for
@@ -105,11 +119,20 @@ def LoadProperties(file_path):
         prop_values = np.array(line_text.split(",")) #Transforms the string into an array where each comma-separated item is an indivual element
 
         if propType == 0: #Most common property type
-            property_arr[counter] = Normal_Property(prop_values, CreateTitleDeed(prop_values), CreateMortDeed(prop_values[0], int(prop_values[10])*1.2))
+            if create_deeds:
+                property_arr[counter] = Normal_Property(prop_values, deed_factory.getTitleDeed(prop_values), deed_factory.getMortDeed(prop_values[0], int(prop_values[10])*1.2))
+            else:
+                property_arr[counter] = Normal_Property(prop_values, None, None)
         elif propType == 1: #School (requires crest image for title deed)
-            property_arr[counter] = School_Property(prop_values, pygame.image.load("img/Deeds/" + str(prop_values[0]) + ".png"), CreateMortDeed(prop_values[0], int(prop_values[6])*1.2))
+            if create_deeds:
+                property_arr[counter] = School_Property(prop_values, deed_factory.getImageDeed(prop_values[0]), deed_factory.getMortDeed(prop_values[0], int(prop_values[6])*1.2))
+            else:
+                property_arr[counter] = School_Property(prop_values, None, None)
         elif propType == 2: #Stations (requires crest image for title deed)
-            property_arr[counter] = Station_Property(prop_values, pygame.image.load("img/Deeds/" + str(prop_values[0]) + ".png"), CreateMortDeed(prop_values[0], int(prop_values[4])*1.2))
+            if create_deeds:
+                property_arr[counter] = Station_Property(prop_values, deed_factory.getImageDeed(prop_values[0]), deed_factory.getMortDeed(prop_values[0], int(prop_values[4])*1.2))
+            else:
+                property_arr[counter] = Station_Property(prop_values, None, None)
         elif propType == 3: #Pot Luck card spot
             property_arr[counter] = Property(prop_values[0].strip(), Prop_Type.POT_LUCK)
         elif propType == 4: #Council Chest card spot
@@ -125,6 +148,8 @@ def LoadProperties(file_path):
         elif propType == 9: #Disabled Parking - Does nothing as of yet (and it probably never will)
             property_arr[counter] = Property(prop_values[0].strip(), Prop_Type.DISABLED_PARKING)
     fh.close()
+    if create_deeds:
+        deed_factory.closeFile() #Saves any deeds that had to be drawn to the disk cache
     return property_arr #Array of 40 Property (or subclass) objects
 
 #Create the Board object that will become part of the Game class later
@@ -134,159 +159,134 @@ def createBoard(data_file_path, props_arr, Pot_Luck, Council_Chest, image_path,
     centre_mon = int(fh.readline()) #Money obtained upon passing the Job Centre
     fh.close()
 
-    board_img = pygame.image.load(image_path) #Load and resize board image
-    board_img = pygame.transform.smoothscale(board_img, [image_dim, image_dim])
+    board_img = None #No image is loaded if image_path is None (headless games)
+    if image_path != None:
+        board_img = loadImage(image_path, [image_dim, image_dim]) #Load and resize board image (or take it from the asset bundle, already resized)
     scale_f = image_dim/768 #Used in piece positioning - formulae were created for a 768x768 board
 
     ret_board = Board(props_arr, bog_pos, centre_mon, Pot_Luck, Council_Chest, board_img, scale_f)
     return ret_board
 
+DICE_SIZE = [70, 70] #Dice are only ever shown at this size (see MainScreen), so their images are loaded at it rather than at the much larger size of the files
+
 #Create the final Game object - this is the main point of the New Game screen
-def createGame(game_players, game_board, game_save, dice_imgs_base_paths):
+#game_rng is the game's Game_RNG, which should also have been used to shuffle the decks; a new one with a random seed is made if it is None
+def createGame(game_players, game_board, game_save, dice_imgs_base_paths, game_auto=True, game_rng=None):
     dice_imgs = np.array([None] * 6)
-    for d_count in range(6):
-        dice_imgs[d_count] = pygame.image.load(dice_imgs_base_paths + str(d_count+1) + ".png") #+1 as dice images are stored with numbers 1 to 6 in the file
+    if dice_imgs_base_paths != None: #Dice have no images in headless games
+        for d_count in range(6):
+            dice_imgs[d_count] = loadSprite(dice_imgs_base_paths + str(d_count+1) + ".png", DICE_SIZE) #+1 as dice images are stored with numbers 1 to 6 in the file
+    if game_rng == None:
+        game_rng = Game_RNG()
+    dice_rng = game_rng.getSubstream('Dice') #Both dice are rolled from the same substream, first die first
     dice_arr = np.array([None] * 2)
-    dice_arr[0] = Die(dice_imgs)
-    dice_arr[1] = Die(dice_imgs)
+    dice_arr[0] = Die(dice_imgs, dice_rng)
+    dice_arr[1] = Die(dice_imgs, dice_rng)
 
-    ret_game = Game(game_players, dice_arr, game_board, game_save)
+    ret_game = Game(game_players, dice_arr, game_board, game_save, game_auto, game_rng)
     return ret_game
 
+#Create a Game object that needs no display, fonts or images, for playing games without the GUI (e.g. running simulations with a Turn_Engine)
+#props_path can be changed so that different versions of the property values file can be compared against each other
+#The whole game is decided by seed (together with the players' decisions); a seed is taken from the random module if it is None
+def createHeadlessGame(player_names, props_path="data/Property Values.txt", seed=None):
+    fh = open("data/Player_Data.txt", "r")
+    init_mon = int(fh.readline())
+    fh.close()
+
+    player_temp = Player(0, None, 0, "")
+    players = np.array([None] * len(player_names))
+    for counter in range(len(player_names)):
+        p_piece = Player_Piece(player_temp.calcPieceX(0, 600/768), player_temp.calcPieceY(0, 600/768), None, counter) #Pieces have no image, but their number is still needed for saving
+        players[counter] = Player(init_mon, p_piece, 0, player_names[counter])
+
+    game_rng = Game_RNG(seed)
+    prop_arr = LoadProperties(props_path, False) #Create array of Property objects, without title deeds
+    Pot_Luck_Deck = createDeck("Pot Luck", None, "data/Card_Texts.txt", "data/PL Master.txt", 16, game_rng.getSubstream('Pot Luck'))
+    Council_Chest_Deck = createDeck("Council Chest", None, "data/Card_Texts.txt", "data/CC Master.txt", 16, game_rng.getSubstream('Council Chest'))
+    game_board = createBoard("data/Board_Data.txt", prop_arr, Pot_Luck_Deck, Council_Chest_Deck, None, 600)
+
+    return createGame(players, game_board, None, None, False, game_rng) #No save file, and autosave is disabled
+
 #Create an array of game players based on data loaded in from a file
 def LoadPlayers(load_arr):
     new_players = np.array([None] * int(load_arr[0][1])) #load_arr[0][1] stores the number of players
     player_temp = Player(0, None, 0, "")
     for counter in range(len(new_players)):
-        p_piece = Player_Piece(player_temp.calcPieceX(int(load_arr[counter+1][2]), 600/768), player_temp.calcPieceY(int(load_arr[counter+1][2]), 600/768), pygame.transform.smoothscale(pygame.image.load('img/Pieces/' + str(int(load_arr[counter+1][3])+1) + '.png'), [32, 32]), int(load_arr[counter+1][3])) #Create piece separately. load-arr[counter+1][3] stores a number from 0-5 relating to which of the token images is used (1.png - 6.png)
+        p_piece = Player_Piece(player_temp.calcPieceX(int(load_arr[counter+1][2]), 600/768), player_temp.calcPieceY(int(load_arr[counter+1][2]), 600/768), loadSprite('img/Pieces/' + str(int(load_arr[counter+1][3])+1) + '.png', [32, 32]), int(load_arr[counter+1][3])) #Create piece separately. load-arr[counter+1][3] stores a number from 0-5 relating to which of the token images is used (1.png - 6.png)
         new_players[counter] = Player(int(load_arr[counter+1][1]), p_piece, int(load_arr[counter+1][2]), load_arr[counter+1][0], bool(int(load_arr[counter+1][8])), bool(int(load_arr[counter+1][7]))) #Second element (not [counter+1]) is related to the order in which the data was saved, which can be seen in Game.saveGame method
         new_players[counter].hasBogMap = bool(int(load_arr[counter+1][4])) #Relevant element of this array
         new_players[counter].nextRollMod = int(load_arr[counter+1][5]) #Final player attributes being restored
         new_players[counter].turnsToMiss = int(load_arr[counter+1][6])
     return new_players
 
-#Render a title deed for a property (that can be mortgaged) for when it is actually mortgaged
-#Only shows the name, buy-back cost and a mnessage explaining that the property needs to be rebought for it to collect rent again
-def CreateMortDeed(deed_name, deed_cost):
-    deed_screen = pygame.Surface((250,400))
-    deed_screen.fill((255,255,255)) #Filled white
-
-    deed_font_name = pygame.font.SysFont('Arial', 24, True) #Font for property name (bold)
-    deed_font_desc = pygame.font.SysFont('Arial', 18) #Font for descriptive text that tells the user that the property will not collect rent while still mortgaged
-    deed_font_back = pygame.font.SysFont('Arial', 28) #Font for displaying the cost to unmortgage/buy-back the property
-
-    pygame.draw.rect(deed_screen, (0,0,0), pygame.Rect(0,0,250,400), 2) #Title deed outline
-
-    prop_text = deed_font_name.render(deed_name, True, (0,0,0)) #Name of property (in bold) at the top of the deed
-    f_width, f_height = deed_font_name.size(deed_name) #Used repeatedly so that text can be centred, using the equation (xpos = (deed_width-text_width)/2)
-    deed_screen.blit(prop_text, [(250-f_width)/2, 80])
-
-    desc_text_1 = deed_font_desc.render('This property is currently mortgaged.', True, (0,0,0)) #First line of the deed description
-    f_width, f_height = deed_font_desc.size('This property is currently mortgaged.')
-    deed_screen.blit(desc_text_1, [(250-f_width)/2, 140])
-
-    desc_text_2 = deed_font_desc.render('It will not collect rent until bought back.', True, (0,0,0)) #Second line of the deed description
-    f_width, f_height = deed_font_desc.size('It will not collect rent until bought back.')
-    deed_screen.blit(desc_text_2, [(250-f_width)/2, 158])
 
-    buy_back_text = deed_font_back.render('Buy-Back Cost £' + str(int(deed_cost)), True, (0,0,0)) #Text displaying how much it costs to unmortgage the property
-    f_width, f_height = deed_font_back.size('Buy-Back Cost £' + str(int(deed_cost)))
-    deed_screen.blit(buy_back_text, [(250-f_width)/2, 275])
-    
-    return deed_screen
-
-#Render a title deed for a typical property based on its rents, cost,
-#etc Returns a pygame Surface containing shapes and text resembling a
-#title deed
-def CreateTitleDeed(deed_vals):
-    deed_screen = pygame.Surface((225,400))
-    deed_screen.fill((255,255,255)) #Filled white
-
-    deed_col = pygame.Color(int(deed_vals[11]), int(deed_vals[12]), int(deed_vals[13]), 0) #Create colour to be used in header from the 3 separate RGB values
-    #Create fonts for title deed
-    deed_font_main = pygame.font.SysFont('Arial', 18) #Font for most text
-    deed_font_name = pygame.font.SysFont('Arial', 20, True) #Bold font holding the name of the property
-    deed_font_bottom = pygame.font.SysFont('Arial', 14) #Font for displaying the info at the bottom of the property about rent doubling if all properties in the gropup are owned
-
-    pygame.draw.rect(deed_screen, (0,0,0), pygame.Rect(0,0,225,400), 2) #Title deed outline
-    pygame.draw.rect(deed_screen, deed_col, pygame.Rect(5, 5, 215, 100)) #Coloured rectangle containing the words 'Title Deed' and property name
-    
-    prop_text = deed_font_name.render(deed_vals[0], True, (255,255,255)) #Name of property (in bold) at bottom of above coloured rectangle
-    f_width, f_height = deed_font_name.size(deed_vals[0]) #Used repeatedly so that text can be centred, using the equation (xpos = (deed_width-text_width)/2)
-    deed_screen.blit(prop_text, [(225-f_width)/2, 95 - f_height])
-
-    title_text = deed_font_main.render('Title Deed', True, (255,255,255)) #Words 'Title Deed' at the top of the aforementioned coloured rectangle
-    f_width, f_height = deed_font_main.size('Title Deed')
-    deed_screen.blit(title_text, [(225-f_width)/2, 5])
-
-    cost_text = deed_font_main.render('Cost £' + str(deed_vals[1]), True, (0,0,0)) #The cost to buy the property from the bank
-    f_width, f_height = deed_font_main.size('Cost £' + str(deed_vals[1]))
-    deed_screen.blit(cost_text, [(225-f_width)/2, 105])
-    
-    rent_text = deed_font_main.render('Rent £' + str(deed_vals[2]), True, (0,0,0)) #Rent on the unimproved property
-    f_width, f_height = deed_font_main.size('Rent £' + str(deed_vals[2]))
-    deed_screen.blit(rent_text, [(225-f_width)/2, 123])
-
-    ch_text1 = deed_font_main.render('With 1 Council House', True, (0,0,0)) #Basic text providing a textual explanation for the 4 rent values with Council Houses
-    deed_screen.blit(ch_text1, [15, 153])
-    ch_text2 = deed_font_main.render('With 2 Council Houses', True, (0,0,0))
-    deed_screen.blit(ch_text2, [15, 173])
-    ch_text3 = deed_font_main.render('With 3 Council Houses', True, (0,0,0))
-    deed_screen.blit(ch_text3, [15, 193])
-    ch_text4 = deed_font_main.render('With 4 Council Houses', True, (0,0,0))
-    deed_screen.blit(ch_text4, [15, 213])
-
-    ch_rent1 = deed_font_main.render('£' + str(deed_vals[3]), True, (0,0,0)) #Rent values for 1, 2, 3 and 4 council houses
-    f_width, f_height = deed_font_main.size('£' + str(deed_vals[3]))
-    deed_screen.blit(ch_rent1, [210-f_width, 153])
-    ch_rent2 = deed_font_main.render('£' + str(deed_vals[4]), True, (0,0,0))
-    f_width, f_height = deed_font_main.size('£' + str(deed_vals[4]))
-    deed_screen.blit(ch_rent2, [210-f_width, 173])
-    ch_rent3 = deed_font_main.render('£' + str(deed_vals[5]), True, (0,0,0))
-    f_width, f_height = deed_font_main.size('£' + str(deed_vals[5]))
-    deed_screen.blit(ch_rent3, [210-f_width, 193])
-    ch_rent4 = deed_font_main.render('£' + str(deed_vals[6]), True, (0,0,0))
-    f_width, f_height = deed_font_main.size('£' + str(deed_vals[6]))
-    deed_screen.blit(ch_rent4, [210-f_width, 213])
-
-    tb_rent = deed_font_main.render('With Tower Block £' + str(deed_vals[7]), True, (0,0,0)) #Rent with a tower block on the property
-    f_width, f_height = deed_font_main.size('With Tower Block £' + str(deed_vals[7]))
-    deed_screen.blit(tb_rent, [(225-f_width)/2, 233])
-
-    mortgage_val = deed_font_main.render('Mortgage Value £' + str(deed_vals[10]), True, (0,0,0)) #Mortgage value on property
-    f_width, f_height = deed_font_main.size('Mortgage Value £' + str(deed_vals[10]))
-    deed_screen.blit(mortgage_val, [(225-f_width)/2, 260])
-
-    ch_cost = deed_font_main.render('Council Houses cost £' + str(deed_vals[8]) + ' each', True, (0,0,0)) #Cost of a council house for this property
-    f_width, f_height = deed_font_main.size('Council Houses cost £' + str(deed_vals[8]) + ' each')
-    deed_screen.blit(ch_cost, [(225-f_width)/2, 280])
-
-    tb_cost = deed_font_main.render('Tower Block costs £' + str(deed_vals[9]) + ',', True, (0,0,0)) #Cost of a tower block for this property
-    f_width, f_height = deed_font_main.size('Tower Block costs £' + str(deed_vals[9]) + ',')
-    deed_screen.blit(tb_cost, [(225-f_width)/2, 300])
-    tb_info = deed_font_main.render('plus 4 Council Houses', True, (0,0,0))
-    f_width, f_height = deed_font_main.size('plus 4 Council Houses')
-    deed_screen.blit(tb_info, [(225-f_width)/2, 318])
-
-    bottom_note1 = deed_font_bottom.render('If a player owns all properties in this', True, (0,0,0)) #Note at bottom of the title deed about rent doubling 
-    f_width, f_height = deed_font_bottom.size('If a player owns all properties in this') #if all properties in a group are owned and unimproved
-    deed_screen.blit(bottom_note1, [(225-f_width)/2, 350])
-    bottom_note2 = deed_font_bottom.render('group, rent is doubled on properties with', True, (0,0,0))
-    f_width, f_height = deed_font_bottom.size('group, rent is doubled on properties with')
-    deed_screen.blit(bottom_note2, [(225-f_width)/2, 364])
-    bottom_note3 = deed_font_bottom.render('no Council Houses or Tower Blocks', True, (0,0,0))
-    f_width, f_height = deed_font_bottom.size('no Council Houses or Tower Blocks')
-    deed_screen.blit(bottom_note3, [(225-f_width)/2, 378])
-
-    return deed_screen
+#------------------------------Preloading------------------------------
+#Image files loaded when a game is created or loaded, as [path, size, smooth] (see loadImage)
+def getGameImages():
+    images = []
+    for counter in range(6):
+        images.append(["img/Pieces/" + str(counter+1) + ".png", [50, 50], True]) #New Game screen
+        images.append(["img/Pieces/" + str(counter+1) + ".png", [32, 32], True]) #Pieces on the board when a game is loaded
+        images.append(["img/Dice/" + str(counter+1) + ".png", DICE_SIZE, True])
+    for counter in range(16):
+        images.append(["img/PL/Pot Luck " + str(counter+1) + ".png", [330, 200], True]) #Same paths and size as createDeck
+        images.append(["img/CC/Council Chest " + str(counter+1) + ".png", [330, 200], True])
+    images.append(["img/Board.png", [600, 600], True])
+    return images
+
+#Images put in the sprite atlas: everything in getGameImages apart from the board (which is large, and only one image), and the thumbnails of schools' and stations' title deeds
+def getAtlasImages():
+    images = [image for image in getGameImages() if image[0] != "img/Board.png"]
+    for file_name in sorted(os.listdir("img/Thumbs")):
+        if file_name.endswith(".png"):
+            images.append(["img/Thumbs/" + file_name, [35, 40], True]) #Size used by CreateThumbImg
+    return images
+
+#Decks and board used by every game played with the GUI
+def createPotLuckDeck(game_rng):
+    return createDeck("Pot Luck", "img/PL/Pot Luck ", "data/Card_Texts.txt", "data/PL Master.txt", 16, game_rng.getSubstream('Pot Luck'))
+
+def createCouncilChestDeck(game_rng):
+    return createDeck("Council Chest", "img/CC/Council Chest ", "data/Card_Texts.txt", "data/CC Master.txt", 16, game_rng.getSubstream('Council Chest'))
+
+def createGameBoard(prop_arr, Pot_Luck_Deck, Council_Chest_Deck):
+    return createBoard("data/Board_Data.txt", prop_arr, Pot_Luck_Deck, Council_Chest_Deck, "img/Board.png", 600)
+
+#Start making everything NewGame needs to create or load a game on a BackgroundLoader, so it is ready by the time Create or Load is pressed
+#Every image is its own task, so they are decoded side by side, and they are then packed into the sprite atlas
+#The properties (with their title deeds), decks and board follow once the images they need are loaded
+def preloadGame(loader):
+    game_rng = Game_RNG() #New random seed for the dice and decks
+    image_keys = {}
+    for path, size, smooth in getGameImages():
+        image_keys[path] = getImageKey(path, size, smooth)
+        loader.submit(image_keys[path], preloadImage, path, size, smooth)
+    loader.submit('Sprite Atlas', lambda *imgs: sprite_atlas.build(getAtlasImages()), after=[image_keys[image[0]] for image in getAtlasImages() if image[0] in image_keys]) #Images passed in are not needed, as they are the ones that were preloaded
+    loader.submit('Properties', LoadProperties, "data/Property Values.txt")
+    loader.submit('Pot Luck', lambda atlas_size: createPotLuckDeck(game_rng), after=['Sprite Atlas']) #Card images are taken from the atlas
+    loader.submit('Council Chest', lambda atlas_size: createCouncilChestDeck(game_rng), after=['Sprite Atlas'])
+    loader.submit('Game Board', lambda prop_arr, Pot_Luck_Deck, Council_Chest_Deck, board_img: (createGameBoard(prop_arr, Pot_Luck_Deck, Council_Chest_Deck), game_rng),
+                  after=['Properties', 'Pot Luck', 'Council Chest', image_keys["img/Board.png"]])
+
+#Board (with its properties and decks) for a new game, and the Game_RNG its decks were shuffled with
+#The one made by preloadGame is used if it is there (waiting for it to finish if need be), but only by one game, as the game changes it; otherwise a new one is made
+def getGameBoard():
+    preloaded = background_loader.take('Game Board')
+    if preloaded != None:
+        return preloaded
+    game_rng = Game_RNG() #New random seed for the dice and decks
+    prop_arr = LoadProperties("data/Property Values.txt") #Create array of Property objects
+    return createGameBoard(prop_arr, createPotLuckDeck(game_rng), createCouncilChestDeck(game_rng)), game_rng
 
 
 #------------------------------New Game Method------------------------------ 
 def NewGame(screen, clock):
     mainGame = None #Create new object that will eventually become a Game object
+    background_loader.wait('Sprite Atlas') #The pieces are in the atlas the loading screen started building (if it is not done yet, it soon will be)
     pieces = np.array([None] * 6) #Array to store the 6 images for the player icons that will be linked to the textboxes
     for p_counter in range(6):
-        pieces[p_counter] = pygame.transform.smoothscale(pygame.image.load("img/Pieces/" + str(p_counter+1) + ".png"), [50, 50]) #Load image into pygame and resize
+        pieces[p_counter] = loadSprite("img/Pieces/" + str(p_counter+1) + ".png", [50, 50]) #Load image into pygame and resize (or take it from the sprite atlas, already resized)
 
     box_arr = np.array([None] * 6) #Array of 6 textboxes - one to one correspondence with the elements of the pieces array
     for b_counter in range(6):
@@ -308,8 +308,8 @@ def NewGame(screen, clock):
     save_initial = 'C:/Users/' + getpass.getuser() + '/Dunfermline-opoly/' + str(now.year) + month[-2:] + day[-2:] + '_' + hour[-2:] + minute[-2:] + second[-2:] + '.dfo'
     save_path_box.buffer = list(save_initial)
 
-    font_48 = pygame.font.SysFont('Arial', 48) #Fonts used for texts
-    font_60 = pygame.font.SysFont('Arial', 60)
+    font_48 = text_cache.getFont('Arial', 48) #Fonts used for texts
+    font_60 = text_cache.getFont('Arial', 60)
 
     new_buts = [Button(150, 650, 300, 80, 'Create Game', font_60), #Create Game
                 Button(600, 650, 300, 80, 'Load Game', font_60), #Load Game
@@ -318,6 +318,7 @@ def NewGame(screen, clock):
 
     msgBox = None
     
+    frame_scheduler.setTimer('blink', 500) #Text box cursor blinks every 500ms
     screen_running = True
     while screen_running:
         for event in pygame.event.get():
@@ -346,13 +347,13 @@ def NewGame(screen, clock):
             but.render(screen)
 
         #Display pure text aspects of the screen
-        new_game_title = font_60.render("New Game:", True, (0,0,0))
+        new_game_title = text_cache.render(font_60, "New Game:", True, (0,0,0))
         screen.blit(new_game_title, [10, 10])
 
-        icon_title = font_48.render("Enter Player Names (max 12 characters)", True, (0,0,0))
+        icon_title = text_cache.render(font_48, "Enter Player Names (max 12 characters)", True, (0,0,0))
         screen.blit(icon_title, [30, 75])
 
-        save_title = font_48.render("Save File Path:", True, (0,0,0))
+        save_title = text_cache.render(font_48, "Save File Path:", True, (0,0,0))
         screen.blit(save_title, [50, 545])
         
         for box in box_arr:
@@ -374,27 +375,26 @@ def NewGame(screen, clock):
 
         if new_buts[0].clicked(): #If button to create the game itself was clicked
             valid = True #Whether the file part of the process is alright
-            if save_path_box.getContents()[-3:].lower() != "dfo": #Must have correct file ending, or invalid
-                msgBox = MessageBox(screen, 'Invalid file. Please ensure the entered file has the correct .dfo file ending.', 'File Error')
+            if not isSavePath(save_path_box.getContents()): #Must have correct file ending (.dfo for text, .dfb for binary), or invalid
+                msgBox = MessageBox(screen, 'Invalid file. Please ensure the entered file has the correct .dfo (or .dfb) file ending.', 'File Error')
                 valid = False
 
             if valid:   
                 try:
                     os.makedirs(os.path.dirname(save_path_box.getContents()), exist_ok=True)
-                    f = open(save_path_box.getContents(), 'w+')
+                    with open(save_path_box.getContents(), 'w+'): #Closed straight away, as saveGame below replaces the file and Windows cannot replace a file that is still open
+                        pass
                 except: #Any error occurs in creating the directory or file
                     msgBox = MessageBox(screen, 'Invalid save file entered. Please ensure the path entered exists and you have permissions to access it (the file does not have to)', 'Invalid Save File')
                     valid = False
 
             if valid:
                 if namesValid(box_arr): #Validate the player's username
-                    players = createPlayers(pieces, box_arr, 600, "data/Player_Data.txt") #Create array of Player objects
-                    prop_arr = LoadProperties("data/Property Values.txt") #Create array of Property objects
-                    Pot_Luck_Deck = createDeck("Pot Luck", "img/PL/Pot Luck ", "data/Card_Texts.txt", "data/PL Master.txt", 16) #Create Card_Deck object
-                    Council_Chest_Deck = createDeck("Council Chest", "img/CC/Council Chest ", "data/Card_Texts.txt", "data/CC Master.txt", 16) #Create Card_Deck object
-                    game_board = createBoard("data/Board_Data.txt", prop_arr, Pot_Luck_Deck, Council_Chest_Deck, "img/Board.png", 600) #Create Board object
+                    players = createPlayers(box_arr, 600, "data/Player_Data.txt") #Create array of Player objects
+                    game_board, game_rng = getGameBoard() #Board object (with the properties and decks), usually already made by the loading screen, and the new random seed for the dice and decks
 
-                    mainGame = createGame(players, game_board, save_path_box.getContents(), "img/Dice/") #Finally create the single, cohesive Game object that is the sole purpose of this screen/part of the game
+                    mainGame = createGame(players, game_board, save_path_box.getContents(), "img/Dice/", True, game_rng) #Finally create the single, cohesive Game object that is the sole purpose of this screen/part of the game
+                    mainGame.saveGame() #Start the save file afresh, so that any old turn journal at this path is not played back on top of the new game
                     
                     screen_running = False
                     gotoScreen = 1 #1=Main game screen
@@ -403,41 +403,40 @@ def NewGame(screen, clock):
 
         if new_buts[1].clicked():
             valid = True
-            if save_path_box.getContents()[-3:].lower() != "dfo": #Must have correct file ending, or invalid
+            if not isSavePath(save_path_box.getContents()): #Must have correct file ending, or invalid
                 msgBox = MessageBox(screen, 'Invalid file. Please select a different file or create a new game', 'File Error')
                 valid = False
-                
-            try:
-                f = open(save_path_box.getContents(), 'r')
-            except: #If an error occurs, then also invalid
-                msgBox = MessageBox(screen, 'Cannot open file. Please select a different file or create a new game', 'File Error')
-                valid = False
 
             if valid:
-                data_arr = []
-                for line in f:
-                    data_arr.append(line.strip().split(','))
-                data_arr = np.array(data_arr)
-                
+                try:
+                    data_arr = loadSave(save_path_box.getContents()) #Rows of the save file, in either format, with the numbers already read in and the turn journal (if any) played back on top
+                except Save_Error: #File is damaged or not a save file
+                    msgBox = MessageBox(screen, 'Save file is damaged. Please select a different file or create a new game', 'File Error')
+                    valid = False
+                except: #If an error occurs, then also invalid
+                    msgBox = MessageBox(screen, 'Cannot open file. Please select a different file or create a new game', 'File Error')
+                    valid = False
+
+            if valid:
                 players = LoadPlayers(data_arr)    
-                prop_arr = LoadProperties("data/Property Values.txt") #Create array of Property objects
-                Pot_Luck_Deck = createDeck("Pot Luck", "img/PL/Pot Luck ", "data/Card_Texts.txt", "data/PL Master.txt", 16) #Create Card_Deck object
-                Council_Chest_Deck = createDeck("Council Chest", "img/CC/Council Chest ", "data/Card_Texts.txt", "data/CC Master.txt", 16) #Create Card_Deck object
-                game_board = createBoard("data/Board_Data.txt", prop_arr, Pot_Luck_Deck, Council_Chest_Deck, "img/Board.png", 600) #Create Board object
+                game_board, game_rng = getGameBoard() #As above. A new random seed for the dice and decks, as where the random numbers had got to is not saved
 
                 for counter in range(int(data_arr[0][1])+1, len(data_arr)):
                     if game_board.getProp(int(data_arr[counter][0])).prop_type == Prop_Type.NORMAL:
-                        game_board.getProp(int(data_arr[counter][0])).buyProperty(int(data_arr[counter][1]))
+                        game_board.buyProperty(int(data_arr[counter][0]), int(data_arr[counter][1]))
                         game_board.getProp(int(data_arr[counter][0])).C_Houses = int(data_arr[counter][2])
                         game_board.getProp(int(data_arr[counter][0])).T_Blocks = int(data_arr[counter][3])
                         game_board.getProp(int(data_arr[counter][0])).mortgage_status = bool(int(data_arr[counter][4]))
                     elif game_board.getProp(int(data_arr[counter][0])).prop_type == Prop_Type.STATION or game_board.getProp(int(data_arr[counter][0])).prop_type == Prop_Type.SCHOOL:
-                        game_board.getProp(int(data_arr[counter][0])).buyProperty(int(data_arr[counter][1]))
+                        game_board.buyProperty(int(data_arr[counter][0]), int(data_arr[counter][1]))
                         game_board.getProp(int(data_arr[counter][0])).mortgage_status = bool(int(data_arr[counter][2]))
+                game_board.rebuildPortfolios() #Upgrades and mortgages were restored directly, so the players' running totals must be worked out again
                     
-                mainGame = createGame(players, game_board, save_path_box.getContents(), "img/Dice/") #Finally create the single, cohesive Game object that is the sole purpose of this screen/part of the game
+                mainGame = createGame(players, game_board, save_path_box.getContents(), "img/Dice/", True, game_rng) #Finally create the single, cohesive Game object that is the sole purpose of this screen/part of the game
                 mainGame.cur_player = int(data_arr[0][0]) #Positions in array as per the order of saving, which can be seen in the method within the Game class
                 mainGame.autosave = bool(int(data_arr[0][2]))
+                if mainGame.autosave:
+                    mainGame.saveGame() #Fold the played-back turn journal into the save file
                 
                 screen_running = False
                 gotoScreen = 1 #1=Main game screen            
@@ -447,7 +446,9 @@ def NewGame(screen, clock):
             if msgBox.should_exit == False:
                 msgBox.draw(screen)
 
-        clock.tick(30) #30 fps
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
         pygame.display.flip() #Refresh screen
+        frame_scheduler.waitForFrame(clock, 30, any(pygame.key.get_pressed())) #At most 30 fps, and sleeps until there is input or the text box cursor blinks (unless a key is held, which text boxes repeat)
 
+    frame_scheduler.clearTimers()
     return mainGame, gotoScreen #Pass the Game object and the integer storing where the game will go to next back out to the main game loop
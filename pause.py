@@ -4,6 +4,9 @@ import os
 
 from textbox import TextBox
 from msgbox import MessageBox
+from imgcache import text_cache
+from framesched import frame_scheduler
+from savefile import isSavePath
 from cls import *
 
 #------------------------------Pause Menu Method------------------------------ 
@@ -12,10 +15,10 @@ def PauseMenu(mainGame, screen, clock):
     save_file_box.buffer = list(mainGame.save_path) #list() is used to convert string into array of characters
 
     music_box = pygame.Rect(100,200,40,40)
-    font_48 = pygame.font.SysFont('Arial', 48) #Fonts used for texts, of various sizings
-    font_60 = pygame.font.SysFont('Arial', 60)
-    font_40 = pygame.font.SysFont('Arial', 40)
-    font_28 = pygame.font.SysFont('Arial', 28)
+    font_48 = text_cache.getFont('Arial', 48) #Fonts used for texts, of various sizings
+    font_60 = text_cache.getFont('Arial', 60)
+    font_40 = text_cache.getFont('Arial', 40)
+    font_28 = text_cache.getFont('Arial', 28)
 
     enable_txt = "Ensable"
     if mainGame.autosave:
@@ -31,16 +34,17 @@ def PauseMenu(mainGame, screen, clock):
 
     msgBox = None #Will become MessageBox object as required
     
-    pause_title = font_60.render("The Game is Paused", True, (0,0,0)) #Generate text for titles
-    settings_txt = font_60.render("Settings:", True, (0,0,0)) #Settings sub-heading
-    toggle_txt = font_48.render("Toggle Background Music", True, (0,0,0)) #Text next to check box
-    save_txt = font_60.render("Save Game:", True, (0,0,0)) #Save Game sub-heading
-    save_file_txt = font_48.render("Save File Path:", True, (0,0,0)) #Title of save path text box
-    new_txt = font_60.render("New Game:", True, (0,0,0)) #New game sub-heading
-    autosave_txt = [font_48.render("Autosave is currently off", True, (0,0,0)),font_48.render("Autosave is currently on", True, (0,0,0))]
+    pause_title = text_cache.render(font_60, "The Game is Paused", True, (0,0,0)) #Generate text for titles
+    settings_txt = text_cache.render(font_60, "Settings:", True, (0,0,0)) #Settings sub-heading
+    toggle_txt = text_cache.render(font_48, "Toggle Background Music", True, (0,0,0)) #Text next to check box
+    save_txt = text_cache.render(font_60, "Save Game:", True, (0,0,0)) #Save Game sub-heading
+    save_file_txt = text_cache.render(font_48, "Save File Path:", True, (0,0,0)) #Title of save path text box
+    new_txt = text_cache.render(font_60, "New Game:", True, (0,0,0)) #New game sub-heading
+    autosave_txt = [text_cache.render(font_48, "Autosave is currently off", True, (0,0,0)),text_cache.render(font_48, "Autosave is currently on", True, (0,0,0))]
                  
     music_box_click = False
     pause_menu_running = True
+    frame_scheduler.setTimer('blink', 500) #Text box cursor blinks every 500ms
     while pause_menu_running:
         for event in pygame.event.get():
             for but in pause_buts:
@@ -85,8 +89,8 @@ def PauseMenu(mainGame, screen, clock):
 
         if pause_buts[5].clicked(): #Button for updating save file path
             valid = True #Whether the file path entered is valid
-            if save_file_box.getContents()[-3:].lower() != "dfo": #Must have correct file ending, or invalid
-                msgBox = MessageBox(screen, 'Invalid file. Please ensure the entered file has the correct .dfo file ending.', 'File Error')
+            if not isSavePath(save_file_box.getContents()): #Must have correct file ending (.dfo for text, .dfb for binary), or invalid
+                msgBox = MessageBox(screen, 'Invalid file. Please ensure the entered file has the correct .dfo (or .dfb) file ending.', 'File Error')
                 valid = False #Path is not valid as wrong file ending
 
             if valid:   
@@ -104,6 +108,7 @@ def PauseMenu(mainGame, screen, clock):
         if pause_buts[6].clicked(): #Button for toggline autosave feature on/off
             mainGame.autosave = not mainGame.autosave #Toggle the boolean value of autosave
             if mainGame.autosave:
+                mainGame.saveGame() #Turn journal is only kept while autosave is on, so start it again from a full save
                 pause_buts[6].updateCap("Disable")
             else:
                 pause_buts[6].updateCap("Enable")
@@ -146,8 +151,10 @@ def PauseMenu(mainGame, screen, clock):
             but.render(screen)
 
         music_box_click = False 
-        clock.tick(10) #10 fps
+        text_cache.endFrame() #Count of texts rendered this frame; 0 once nothing on screen is changing
         pygame.display.flip() #Refresh screen
+        frame_scheduler.waitForFrame(clock, 10, any(pygame.key.get_pressed())) #At most 10 fps, and sleeps until there is input or the text box cursor blinks (unless a key is held, which text boxes repeat)
 
+    frame_scheduler.clearTimers()
     return mainGame, gotoScreen #Pass the Game object and the integer storing where the game will go to next back out to the main game loop
        
\ No newline at end of file
@@ -0,0 +1,89 @@
+#Records headless games to replay files and plays them back, checking that they end in exactly the same state
+#A replay file (.dfr) holds the game's seed, the players and every action taken, so the same game can be played again with no decisions left to make
+#Usage: python replay.py record FILE [--seed N] [--players N] [--props FILE] [--max-turns N]
+#       python replay.py play FILE [FILE ...]
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from cls import Turn_Engine
+from new import createHeadlessGame
+
+REPLAY_VERSION = 1
+#Game methods that a replay may call; anything else in a file is refused, so a replay file cannot run arbitrary methods
+REPLAY_ACTIONS = ['rollDice', 'useCard', 'buyCurProp', 'toggleMortgage', 'buyUpgrade', 'sellUpgrade', 'leaveBogside', 'bankruptCurPlayer', 'advancePlayer']
+
+class Replay_Error(Exception):
+    pass
+
+#------------------------------Replay Functions------------------------------
+#Play a game with the Turn_Engine, recording it. Returns the replay as a dictionary
+def recordGame(seed, no_of_players=4, props_path="data/Property Values.txt", max_turns=2000):
+    player_names = ['Player ' + str(counter+1) for counter in range(no_of_players)]
+    game = createHeadlessGame(player_names, props_path, seed)
+    game.startRecording()
+    engine = Turn_Engine(game, new_max_turns=max_turns)
+    winner = engine.playUntilDone()
+    return {'version': REPLAY_VERSION,
+            'seed': seed,
+            'players': player_names,
+            'props_path': props_path,
+            'actions': game.actions,
+            'turns': engine.turns_played,
+            'winner': winner,
+            'state_hash': game.getStateHash()}
+
+def writeReplay(path, replay):
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(replay, fh, separators=(',', ':'))
+
+def readReplay(path):
+    with open(path, encoding='utf-8') as fh:
+        replay = json.load(fh)
+    if replay.get('version') != REPLAY_VERSION:
+        raise Replay_Error('Replay file is version ' + str(replay.get('version')) + ', but only version ' + str(REPLAY_VERSION) + ' can be played')
+    return replay
+
+#Play a replay back on a new headless game, with no decisions made, and return the game
+#Raises Replay_Error if the game does not end up in the same state as when it was recorded
+def playReplay(replay):
+    game = createHeadlessGame(replay['players'], replay['props_path'], replay['seed'])
+    for action in replay['actions']:
+        if action[0] not in REPLAY_ACTIONS:
+            raise Replay_Error('Replay contains an unknown action: ' + str(action[0]))
+        getattr(game, action[0])(*action[1:])
+    if game.getStateHash() != replay['state_hash']:
+        raise Replay_Error('Replay did not end in the recorded state (the data files or game rules may have changed since it was recorded)')
+    return game
+
+
+#------------------------------Replay Entry Point------------------------------
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__))) #Data files are opened with paths relative to the repository root
+
+    parser = argparse.ArgumentParser(description='Record and play back replays of headless games of Dunfermline-opoly')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    record_parser = subparsers.add_parser('record', help='play a seeded game and save it as a replay')
+    record_parser.add_argument('file', help='replay file to write')
+    record_parser.add_argument('--seed', type=int, default=0, help='seed of the game')
+    record_parser.add_argument('--players', type=int, default=4, help='players in the game (2-6)')
+    record_parser.add_argument('--props', default='data/Property Values.txt', help='property values file to use')
+    record_parser.add_argument('--max-turns', type=int, default=2000, help='turns after which the game is stopped')
+    play_parser = subparsers.add_parser('play', help='play replays back and check they end in the recorded state')
+    play_parser.add_argument('files', nargs='+', help='replay files to play')
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        replay = recordGame(args.seed, args.players, args.props, args.max_turns)
+        writeReplay(args.file, replay)
+        print('Recorded %d turns (%d actions), state hash %s' % (replay['turns'], len(replay['actions']), replay['state_hash']))
+    else:
+        for path in args.files:
+            start = time.perf_counter()
+            replay = readReplay(path)
+            playReplay(replay)
+            elapsed = time.perf_counter() - start
+            print('%s: %d actions played in %.1f ms (%.0f actions/sec), final state matches' % (path, len(replay['actions']), 1000 * elapsed, len(replay['actions']) / max(elapsed, 1e-9)))
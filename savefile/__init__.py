@@ -0,0 +1,3 @@
+from .savefile import Save_Error, isBinaryPath, isSavePath, writeSave, readSave, convertSave, formatText, parseText, packBinary, unpackBinary
+from .savewriter import SaveWriter, save_writer
+from .journal import TurnJournal, getJournalPath, clearJournal, loadSave, readJournal, replayJournal
\ No newline at end of file
@@ -0,0 +1,9 @@
+#Converts a saved game between the text (.dfo) and binary (.dfb) formats
+#Usage: python -m savefile SOURCE DESTINATION, e.g. python -m savefile game.dfo game.dfb
+import sys
+from .savefile import convertSave, isSavePath
+
+if len(sys.argv) != 3 or not isSavePath(sys.argv[1]) or not isSavePath(sys.argv[2]):
+    print('Usage: python -m savefile SOURCE DESTINATION (each ending in .dfo or .dfb)')
+    sys.exit(1)
+convertSave(sys.argv[1], sys.argv[2])
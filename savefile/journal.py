@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+from .savefile import readSave, writeAtomic
+
+#------------------------------Turn Journal------------------------------
+#Append-only log of everything that happens in a game, kept next to its save file (game.dfo -> game.dfo.jnl) while autosave is on
+#A full save is only written once per round, so without the journal a crash could lose up to a whole round of play
+#Each event is one line of JSON:
+#   s - sequence number of the event
+#   e - kind of event: roll, move, rent, card, buy, mortgage, upgrade, bogside, leave_bogside, bankrupt, turn or miss_turn
+#   a - details of the event (dice scores, amount of rent, etc.), which are only there for reading the journal
+#   p - [player number, followed by the player's save row] for each player the event changed
+#   b - save row of each property the event changed, with owner -1 if it went back to the bank
+#   c - current player after the event
+#As the rows hold what the players and properties were left as (rather than what changed), replaying an event is just copying its rows,
+#and replaying events that are already part of the save file does no harm. So the journal only needs emptying once a save has safely been written
+
+JOURNAL_ENDING = '.jnl'
+
+def getJournalPath(save_path):
+    return save_path + JOURNAL_ENDING
+
+#Remove the journal of a save file, e.g. once a full save has been written by a game that has not logged any events yet
+def clearJournal(save_path):
+    if os.path.exists(getJournalPath(save_path)):
+        os.remove(getJournalPath(save_path))
+
+#Save rows of a game, from its save file with the journal of anything that happened after it played back on top
+#The journal is read before the save file: a save is always written before the journal is emptied, so whatever save is read next contains any events that have gone
+def loadSave(path):
+    journal_lines = readJournal(getJournalPath(path))
+    return replayJournal(readSave(path), journal_lines)
+
+#Lines of a journal file (none if there is no journal)
+def readJournal(journal_path):
+    if not os.path.exists(journal_path):
+        return []
+    with open(journal_path, encoding='utf-8') as fh:
+        return fh.readlines()
+
+#Play back the events in the lines of a journal on top of save rows (see savefile.py for their layout), returning the new rows
+def replayJournal(rows, journal_lines):
+    if len(journal_lines) == 0:
+        return rows
+    no_of_players = rows[0][1]
+    header = list(rows[0])
+    players = [list(row) for row in rows[1:no_of_players+1]]
+    props = {} #Save row of each property, by board position
+    for row in rows[no_of_players+1:]:
+        props[row[0]] = list(row)
+
+    for line in journal_lines:
+        try:
+            record = json.loads(line)
+        except ValueError: #Line was cut short by a crash; it can only be the last one, so everything before it is kept
+            break
+        for row in record['p']:
+            players[row[0]] = row[1:]
+        for row in record['b']:
+            props[row[0]] = row
+        header[0] = record['c']
+
+    return [header] + players + [props[b_pos] for b_pos in sorted(props) if props[b_pos][1] != -1] #Only owned properties are saved
+
+#------------------------------TurnJournal Class------------------------------
+#Journal of one save file. Events are added by the game's thread, and the SaveWriter thread empties it once a save has been written, hence the lock
+class TurnJournal:
+    def __init__(self, save_path, compact_every=250):
+        self.save_path = save_path
+        self.path = getJournalPath(save_path)
+        self.compact_every = compact_every #Events after which a new save should be written so that the journal can be emptied
+        self.lock = threading.Lock()
+        self.fh = None #Opened when the first event is added
+        self.seq = 0 #Sequence number of the last event added
+        self.lines = [] #(sequence number, line) of every event since the journal was last emptied
+        self.since_snapshot = 0 #Events added since the game last took a snapshot for saving
+
+    #Add an event to the end of the journal. Returns its sequence number
+    #Each line is flushed to the operating system straight away, so it survives the game crashing, but is not fsynced as that would cost as much as a full save
+    def append(self, kind, args, player_rows, prop_rows, cur_player):
+        with self.lock:
+            self.seq += 1
+            line = json.dumps({'s': self.seq, 'e': kind, 'a': args, 'p': player_rows, 'b': prop_rows, 'c': cur_player}, separators=(',', ':'), default=int) + '\n' #default=int for NumPy ints left by card effects
+            if self.fh == None:
+                self.fh = open(self.path, 'a', encoding='utf-8')
+            self.fh.write(line)
+            self.fh.flush()
+            self.lines.append((self.seq, line))
+            self.since_snapshot += 1
+            return self.seq
+
+    #Whether enough events have built up that a new save should be written
+    def needsCompacting(self):
+        return self.since_snapshot >= self.compact_every
+
+    #Called when the game takes a snapshot for saving. Returns the sequence number of the last event that the snapshot contains
+    def markSnapshot(self):
+        with self.lock:
+            self.since_snapshot = 0
+            return self.seq
+
+    #Remove the events up to and including a certain sequence number, once a save containing them has been written
+    def compact(self, upto_seq):
+        with self.lock:
+            self.lines = [(seq, line) for seq, line in self.lines if seq > upto_seq]
+            if self.fh != None:
+                self.fh.close()
+                self.fh = None
+            if len(self.lines) == 0:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+            else: #Events were added while the save was being written, so these must be kept
+                writeAtomic(self.path, ''.join(line for seq, line in self.lines).encode('utf-8'))
+
+    def close(self):
+        with self.lock:
+            if self.fh != None:
+                self.fh.close()
+                self.fh = None
@@ -0,0 +1,155 @@
+import os
+import struct
+import zlib
+
+#------------------------------Save File Functions------------------------------
+#Games can be saved in two formats, chosen by the file ending:
+#   .dfo - the original text format, with one comma-separated line for the game, each player and each owned property
+#   .dfb - a compact binary format with a version number and checksum, which is quicker to write and read
+#Both are read into the same save rows, laid out exactly as the lines of a .dfo file but with the numbers already converted to ints:
+#   row 0:             [current player, number of players, autosave]
+#   one per player:    [name, money, position, piece number, has Bogside map, next roll modifier, turns to miss, active, in Bogside]
+#   one per property:  [board position, owner, Council Houses, Tower Blocks, mortgaged] for NORMAL properties,
+#                      [board position, owner, mortgaged] for SCHOOL and STATION properties (only owned properties are saved)
+#so a save can be converted from one format to the other without knowing anything about the board
+
+TEXT_ENDING = 'dfo'
+BINARY_ENDING = 'dfb'
+
+BINARY_MAGIC = b'DFOB'
+BINARY_VERSION = 1 #Increase whenever the layout below changes, keeping the old reader so that older saves can still be loaded
+HEADER_STRUCT = struct.Struct('<4sHI') #Magic bytes, version, CRC-32 of everything after the header
+GAME_STRUCT = struct.Struct('<BBBH') #Current player, number of players, autosave, number of properties
+PLAYER_STRUCT = struct.Struct('<iHBBhhBB') #Player row after the name, which is stored before it as a length byte then UTF-8 bytes
+PROP_STRUCT = struct.Struct('<BBbBBB') #Board position, number of fields in the row (5 or 3), owner, Council Houses, Tower Blocks, mortgaged
+
+class Save_Error(Exception):
+    pass
+
+#Whether a save path uses the binary format
+def isBinaryPath(path):
+    return path[-3:].lower() == BINARY_ENDING
+
+#Whether a path has one of the save file endings
+def isSavePath(path):
+    return path[-3:].lower() == TEXT_ENDING or isBinaryPath(path)
+
+#Write save rows to a file in the format given by its ending
+#The rows are written to a temporary file next to the save, flushed to disk, then moved over the save in one step,
+#so a save is never left half-written if the game closes or the disk fills up part of the way through
+def writeSave(path, rows):
+    if isBinaryPath(path):
+        data = packBinary(rows)
+    else:
+        data = formatText(rows).encode('utf-8')
+    writeAtomic(path, data)
+
+def writeAtomic(path, data):
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(temp_path, path)
+    except:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+#Read the save rows from a file, whichever format it is in
+#Binary saves are recognised by their first bytes rather than the file ending, so a renamed file still loads
+def readSave(path):
+    with open(path, 'rb') as fh:
+        data = fh.read()
+    if data[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return unpackBinary(data)
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError: #Older text saves were written in the system's default encoding
+        text = data.decode('cp1252', 'replace')
+    return parseText(text)
+
+#Convert a save from one format to the other (or rewrite it in the same format). Formats come from the file endings
+def convertSave(src_path, dst_path):
+    writeSave(dst_path, readSave(src_path))
+
+
+#------------------------------Text Format------------------------------
+#',' is used to separate data within lines
+#Booleans are saved as a 0 or 1, where 0 is false and 1 true. This is because bool('False') returns True, meaning that saving them as strings does not allow for them to be read in with any real amount of ease.
+def formatText(rows):
+    return ''.join(','.join(str(value) for value in row) + '\n' for row in rows)
+
+def parseText(text):
+    rows = []
+    for line in text.splitlines():
+        if line.strip() == '':
+            continue
+        rows.append(line.strip().split(','))
+    if len(rows) == 0:
+        raise Save_Error('Save file is empty')
+
+    try:
+        no_of_players = int(rows[0][1])
+        for counter in range(len(rows)):
+            if counter >= 1 and counter <= no_of_players: #Player names are the only values that are not numbers
+                rows[counter] = [rows[counter][0]] + [int(value) for value in rows[counter][1:]]
+            else:
+                rows[counter] = [int(value) for value in rows[counter]]
+    except (ValueError, IndexError):
+        raise Save_Error('Save file contains data that is not a number')
+    return rows
+
+
+#------------------------------Binary Format------------------------------
+#File is a header followed by the game record, then one record per player and one per owned property, all little-endian
+def packBinary(rows):
+    no_of_players = rows[0][1]
+    payload = bytearray(GAME_STRUCT.pack(rows[0][0], no_of_players, rows[0][2], len(rows) - no_of_players - 1))
+    for row in rows[1:no_of_players+1]:
+        name = row[0].encode('utf-8')
+        payload += bytes([len(name)]) + name + PLAYER_STRUCT.pack(*row[1:])
+    for row in rows[no_of_players+1:]:
+        if len(row) == 5:
+            payload += PROP_STRUCT.pack(row[0], 5, row[1], row[2], row[3], row[4])
+        else:
+            payload += PROP_STRUCT.pack(row[0], 3, row[1], 0, 0, row[2])
+    return HEADER_STRUCT.pack(BINARY_MAGIC, BINARY_VERSION, zlib.crc32(payload)) + payload
+
+#Read save rows out of the bytes of a binary save. The records are unpacked straight out of a memoryview of the data, so nothing is copied apart from the names
+def unpackBinary(data):
+    view = memoryview(data)
+    if len(view) < HEADER_STRUCT.size:
+        raise Save_Error('Save file is too short to be a binary save')
+    magic, version, checksum = HEADER_STRUCT.unpack_from(view, 0)
+    if magic != BINARY_MAGIC:
+        raise Save_Error('Not a binary save file')
+    if version != BINARY_VERSION:
+        raise Save_Error('Binary save file is version ' + str(version) + ', but only version ' + str(BINARY_VERSION) + ' can be loaded')
+    if zlib.crc32(view[HEADER_STRUCT.size:]) != checksum:
+        raise Save_Error('Save file is corrupt (checksum does not match)')
+
+    try:
+        offset = HEADER_STRUCT.size
+        cur_player, no_of_players, autosave, no_of_props = GAME_STRUCT.unpack_from(view, offset)
+        offset += GAME_STRUCT.size
+        rows = [[cur_player, no_of_players, autosave]]
+        for counter in range(no_of_players):
+            name_len = view[offset]
+            name = str(view[offset+1:offset+1+name_len], 'utf-8')
+            offset += 1 + name_len
+            rows.append([name] + list(PLAYER_STRUCT.unpack_from(view, offset)))
+            offset += PLAYER_STRUCT.size
+        for counter in range(no_of_props):
+            b_pos, no_of_fields, owner, C_Houses, T_Blocks, mortgaged = PROP_STRUCT.unpack_from(view, offset)
+            offset += PROP_STRUCT.size
+            if no_of_fields == 5:
+                rows.append([b_pos, owner, C_Houses, T_Blocks, mortgaged])
+            else:
+                rows.append([b_pos, owner, mortgaged])
+    except (struct.error, IndexError, UnicodeDecodeError):
+        raise Save_Error('Save file is truncated')
+    if offset != len(view):
+        raise Save_Error('Save file has unexpected data at the end')
+    return rows
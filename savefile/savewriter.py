@@ -0,0 +1,86 @@
+import threading
+import time
+from .savefile import writeSave
+
+#------------------------------SaveWriter Class------------------------------
+#Writes autosaves on a background thread, so that a slow disk (e.g. a home directory on a network drive) does not hold up the screen
+#The game hands over a snapshot of its save rows, which are plain tuples of ints and strings and so cannot change while they are being written
+#Only the newest snapshot matters: if a save is still being written when more snapshots arrive, all but the last of them are skipped
+class SaveWriter:
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.pending = None #(path, rows, time submitted, on_written) of the next save to write, if any
+        self.writing = False #Whether a save is being written right now
+        self.thread = None #Started by the first save
+
+        #Counters used for reporting
+        self.saves = 0 #Saves written
+        self.coalesced = 0 #Snapshots skipped because a newer one arrived before they could be written
+        self.failures = 0
+        self.last_error = None #Exception from the last save that failed, if any
+        self.snapshot_time = 0 #Total seconds spent on the game's own thread taking snapshots
+        self.latencies = [] #Seconds from each snapshot being taken to it being safely on disk, for the last 100 saves
+        self.write_times = [] #Seconds spent writing each of the last 100 saves
+
+    #Queue a snapshot to be written to path; returns straight away
+    #on_written, if given, is called on the writer thread once the snapshot is safely on disk (e.g. to empty the game's TurnJournal)
+    def submit(self, path, rows, snapshot_secs=0, on_written=None):
+        with self.condition:
+            if self.pending != None:
+                self.coalesced += 1
+            self.pending = (path, rows, time.perf_counter(), on_written)
+            self.snapshot_time += snapshot_secs
+            if self.thread == None:
+                self.thread = threading.Thread(target=self.run, name='SaveWriter', daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    #Wait until every queued save has been written (e.g. before saving by hand, or before the game closes). Returns False if it timed out
+    def flush(self, timeout=None):
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending == None and not self.writing, timeout)
+
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending != None)
+                path, rows, submitted, on_written = self.pending
+                self.pending = None
+                self.writing = True
+
+            start = time.perf_counter()
+            error = None
+            try:
+                writeSave(path, rows)
+                if on_written != None:
+                    on_written()
+            except Exception as save_error: #Disk full, file no longer accessible, etc.; the next autosave will try again
+                error = save_error
+            end = time.perf_counter()
+
+            with self.condition:
+                if error == None:
+                    self.saves += 1
+                    self.latencies = self.latencies[-99:] + [end - submitted]
+                    self.write_times = self.write_times[-99:] + [end - start]
+                else:
+                    self.failures += 1
+                    self.last_error = error
+                self.writing = False
+                self.condition.notify_all()
+
+    #One line summary of the autosaves written so far
+    def getReport(self):
+        with self.condition:
+            if self.saves == 0:
+                report = 'Autosave: nothing written'
+            else:
+                report = 'Autosave: %d written, %d skipped for newer snapshots, latency %.1f ms mean / %.1f ms max (write %.1f ms mean), %.2f ms per snapshot on the game thread' % (
+                    self.saves, self.coalesced, 1000 * sum(self.latencies) / len(self.latencies), 1000 * max(self.latencies), 1000 * sum(self.write_times) / len(self.write_times),
+                    1000 * self.snapshot_time / (self.saves + self.coalesced + self.failures))
+            if self.failures > 0:
+                report += ', %d failed (last error: %s)' % (self.failures, self.last_error)
+            return report
+
+
+save_writer = SaveWriter() #Shared by every game
@@ -0,0 +1,165 @@
+#Runs large numbers of seeded headless games across all CPU cores, for balancing the rents, costs and card effects in the data files
+#Usage: python simulate.py [number of games] [--players N] [--props FILE [FILE ...]] [--workers N] [--seed N] [--max-turns N] [--stalemate-turns N] [--batch N]
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from cls import Game_RNG, Turn_Engine
+from new import createHeadlessGame
+
+#------------------------------Simulation Functions------------------------------
+#Play one game with a certain seed, returning its results as a dictionary
+def playGame(seed, no_of_players, props_path, max_turns, stalemate_turns=500):
+    engine = Turn_Engine(createHeadlessGame(['Player ' + str(counter+1) for counter in range(no_of_players)], props_path, seed), new_max_turns=max_turns, new_stalemate_turns=stalemate_turns) #Dice rolls and deck shuffles all come from the game's Game_RNG, so the whole game depends only on the seed
+    winner = engine.playUntilDone()
+    return {'seed': seed,
+            'winner': winner, #-1 if there was a stalemate or the turn limit was reached
+            'end': engine.getEndReason(), #'won', 'stalemate' or 'turn_limit'
+            'turns': engine.turns_played,
+            'bankrupt_order': list(engine.bankrupt_order),
+            'rent_collected': list(engine.game.rent_collected)}
+
+#Play a batch of games in one worker process, merging them into a single Sim_Summary so that only the summary has to be sent back
+def playBatch(seeds, no_of_players, props_path, max_turns, stalemate_turns=500):
+    start = time.perf_counter()
+    summary = Sim_Summary(no_of_players)
+    for seed in seeds:
+        summary.addGame(playGame(seed, no_of_players, props_path, max_turns, stalemate_turns))
+    summary.addWorkerTime(os.getpid(), len(seeds), time.perf_counter() - start)
+    return summary
+
+#Play no_of_games games spread across a pool of worker processes. Game n is seeded from substream n of a Game_RNG seeded with base_seed,
+#so every game has its own independent stream of random numbers, and the results do not depend on how many workers there are or which worker plays which game
+def runSimulation(no_of_games, no_of_players=4, props_path="data/Property Values.txt", workers=None, base_seed=0, max_turns=2000, batch_size=50, stalemate_turns=500):
+    if workers == None:
+        workers = os.cpu_count()
+    root_rng = Game_RNG(base_seed)
+    seeds = [root_rng.getSubstream(counter).seed for counter in range(no_of_games)]
+    batches = [seeds[counter:counter + batch_size] for counter in range(0, no_of_games, batch_size)]
+    total = Sim_Summary(no_of_players)
+
+    start = time.perf_counter()
+    if workers <= 1: #No pool needed, which also makes profiling easier
+        for batch in batches:
+            total.merge(playBatch(batch, no_of_players, props_path, max_turns, stalemate_turns))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(playBatch, batch, no_of_players, props_path, max_turns, stalemate_turns) for batch in batches]
+            for future in futures:
+                total.merge(future.result())
+    total.elapsed = time.perf_counter() - start
+    return total
+
+
+#------------------------------Sim Summary Class------------------------------
+#Summary statistics for any number of games. Summaries from different workers are combined with merge
+#Game lengths, wins and rents are only taken from games that were won, so that games stopped early do not skew them
+class Sim_Summary:
+    def __init__(self, no_of_players):
+        self.no_of_players = no_of_players
+        self.games = 0
+        self.finished = 0 #Games won by a player
+        self.stalemates = 0 #Games stopped because nothing had changed for a long time
+        self.unfinished = 0 #Games stopped by the turn limit
+        self.wins = [0] * no_of_players #Wins for each seat
+        self.total_turns = 0 #Over all games
+        self.finished_turns = 0 #Over games that were won
+        self.min_turns = -1
+        self.max_turns = 0
+        self.bankrupt_places = [[0] * no_of_players for counter in range(no_of_players)] #[n][p] is how often player p was the (n+1)th to go bankrupt
+        self.rent_collected = [] #Total rent paid on each square over games that were won
+        self.worker_games = {} #Games played by each worker process, keyed by process ID
+        self.worker_time = {} #Seconds spent playing games in each worker process
+        self.elapsed = 0 #Wall-clock time for the whole simulation
+
+    def addGame(self, result):
+        self.games += 1
+        self.total_turns += result['turns']
+        for place in range(len(result['bankrupt_order'])):
+            self.bankrupt_places[place][result['bankrupt_order'][place]] += 1
+        if len(self.rent_collected) == 0:
+            self.rent_collected = [0] * len(result['rent_collected'])
+        if result['end'] == 'stalemate':
+            self.stalemates += 1
+            return
+        if result['end'] == 'turn_limit':
+            self.unfinished += 1
+            return
+
+        self.finished += 1
+        self.wins[result['winner']] += 1
+        self.finished_turns += result['turns']
+        if self.min_turns == -1 or result['turns'] < self.min_turns:
+            self.min_turns = result['turns']
+        self.max_turns = max(self.max_turns, result['turns'])
+        for counter in range(len(result['rent_collected'])):
+            self.rent_collected[counter] += result['rent_collected'][counter]
+
+    def addWorkerTime(self, worker, games, seconds):
+        self.worker_games[worker] = self.worker_games.get(worker, 0) + games
+        self.worker_time[worker] = self.worker_time.get(worker, 0) + seconds
+
+    #Add the statistics of another summary (e.g. from another worker) into this one
+    def merge(self, other):
+        self.games += other.games
+        self.finished += other.finished
+        self.stalemates += other.stalemates
+        self.unfinished += other.unfinished
+        self.total_turns += other.total_turns
+        self.finished_turns += other.finished_turns
+        if self.min_turns == -1 or (other.min_turns != -1 and other.min_turns < self.min_turns):
+            self.min_turns = other.min_turns
+        self.max_turns = max(self.max_turns, other.max_turns)
+        for counter in range(self.no_of_players):
+            self.wins[counter] += other.wins[counter]
+            for place in range(self.no_of_players):
+                self.bankrupt_places[place][counter] += other.bankrupt_places[place][counter]
+        if len(self.rent_collected) == 0:
+            self.rent_collected = [0] * len(other.rent_collected)
+        for counter in range(len(other.rent_collected)):
+            self.rent_collected[counter] += other.rent_collected[counter]
+        for worker in other.worker_games:
+            self.addWorkerTime(worker, other.worker_games[worker], other.worker_time[worker])
+
+    #Human-readable report of the summary; prop_names gives the name of each square for the rent table
+    def report(self, prop_names):
+        lines = []
+        lines.append('Games played:      ' + str(self.games) + ' (' + str(self.finished) + ' won, ' + str(self.stalemates) + ' stopped as stalemates, ' + str(self.unfinished) + ' stopped by the turn limit)')
+        lines.append('Won game length:   %.1f turns on average (min %d, max %d)' % (self.finished_turns / max(self.finished, 1), self.min_turns, self.max_turns))
+        lines.append('Wins by seat:      ' + ', '.join('P' + str(counter+1) + ' %.1f%%' % (100 * self.wins[counter] / max(self.finished, 1)) for counter in range(self.no_of_players)) + ' of won games')
+        lines.append('First bankruptcy:  ' + ', '.join('P' + str(counter+1) + ' %.1f%%' % (100 * self.bankrupt_places[0][counter] / max(self.games, 1)) for counter in range(self.no_of_players)) + ' of all games')
+        lines.append('Rent per won game by square (highest first):')
+        order = sorted(range(len(self.rent_collected)), key=lambda counter: self.rent_collected[counter], reverse=True)
+        for counter in order:
+            if self.rent_collected[counter] > 0:
+                lines.append('    %-28s %10.1f' % (prop_names[counter], self.rent_collected[counter] / max(self.finished, 1)))
+        lines.append('Time taken:        %.2f s (%.1f games/sec, %.0f games/min, %.1f turns/sec)' % (self.elapsed, self.games / max(self.elapsed, 1e-9), 60 * self.games / max(self.elapsed, 1e-9), self.total_turns / max(self.elapsed, 1e-9)))
+        worker_rates = [self.worker_games[worker] / max(self.worker_time[worker], 1e-9) for worker in self.worker_games]
+        if len(worker_rates) > 0:
+            lines.append('Workers:           %d, %.1f games/sec per worker (min %.1f, max %.1f)' % (len(worker_rates), sum(worker_rates) / len(worker_rates), min(worker_rates), max(worker_rates)))
+        return '\n'.join(lines)
+
+
+#------------------------------Simulation Entry Point------------------------------
+if __name__ == '__main__':
+    os.chdir(os.path.dirname(os.path.abspath(__file__))) #Data files are opened with paths relative to the repository root
+
+    parser = argparse.ArgumentParser(description='Run seeded headless games of Dunfermline-opoly in parallel and summarise the results')
+    parser.add_argument('games', type=int, nargs='?', default=1000, help='number of games to play')
+    parser.add_argument('--players', type=int, default=4, help='players per game (2-6)')
+    parser.add_argument('--props', nargs='+', default=['data/Property Values.txt'], help='property values file(s) to use; each one is simulated with the same seeds so variants can be compared')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per CPU core)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the simulation; game n is seeded from substream n of it')
+    parser.add_argument('--max-turns', type=int, default=2000, help='turns after which a game is stopped')
+    parser.add_argument('--stalemate-turns', type=int, default=500, help='turns without anything being bought, built, mortgaged or lost after which a game is stopped as a stalemate')
+    parser.add_argument('--batch', type=int, default=50, help='games handed to a worker at a time')
+    args = parser.parse_args()
+
+    for props_path in args.props:
+        summary = runSimulation(args.games, args.players, props_path, args.workers, args.seed, args.max_turns, args.batch, args.stalemate_turns)
+        names_game = createHeadlessGame(['Player 1', 'Player 2'], props_path) #Only used for the property names in the report
+        print('------------------------------' + props_path + '------------------------------')
+        print(summary.report([names_game.board.getProp(counter).prop_title.strip() for counter in range(names_game.board.max_pos + 1)]))
@@ -0,0 +1 @@
+from .spriteatlas import SpriteAtlas, sprite_atlas, loadSprite
\ No newline at end of file
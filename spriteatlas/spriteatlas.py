@@ -0,0 +1,102 @@
+import threading
+import pygame
+from assetbundle import getImageKey, loadImage, toDisplayFormat
+
+#------------------------------SpriteAtlas Class------------------------------
+#Packs the small images that are loaded many at a time (cards, dice, pieces, thumbnails, coin frames) into a few large pages, each converted to the display's pixel format
+#Each image is then a subsurface of its page: drawing it blits a rectangle straight out of the page, with no pixel format conversion, and the images are
+#held in a few large blocks of memory rather than dozens of small ones
+#Pages are packed in shelves: images are sorted tallest first and placed left to right, starting a new shelf (and a new page when one is full) when the current one runs out of room
+class SpriteAtlas:
+    def __init__(self, page_size=2048, padding=2):
+        self.page_size = page_size #Width and greatest height of a page. 2048 is within the limits of any graphics card
+        self.padding = padding #Gap left around each image
+        self.lock = threading.Lock() #Built on the background loader while the loading screen draws sprites from earlier pages
+        self.pages = [] #Surfaces holding the images
+        self.sprites = {} #Key (see getImageKey) -> subsurface of a page
+        self.rects = {} #Key -> (page number, Rect of the image within the page)
+
+    #Load images (as [path, size, smooth], see loadImage) and pack them into new pages. Images already in the atlas are skipped
+    #Pages are converted to the display's format (see setDisplayFormat in assetbundle), so can be built on any thread once the display exists
+    #Images with per-pixel alpha and those without go on separate pages, so the opaque ones can use the faster format with no alpha
+    def build(self, images):
+        loaded = {}
+        for path, size, smooth in images:
+            key = getImageKey(path, size, smooth)
+            if key not in self.sprites and key not in loaded:
+                loaded[key] = loadImage(path, size, smooth)
+        alpha_keys = [key for key in loaded if loaded[key].get_flags() & pygame.SRCALPHA]
+        opaque_keys = [key for key in loaded if key not in alpha_keys]
+
+        with self.lock:
+            for keys, has_alpha in [[alpha_keys, True], [opaque_keys, False]]:
+                for page, placed in self.packPages([[key, loaded[key].get_size()] for key in keys], has_alpha):
+                    for key, rect in placed:
+                        page.blit(loaded[key], rect)
+                    page = toDisplayFormat(page)
+                    self.pages.append(page)
+                    for key, rect in placed:
+                        self.rects[key] = (len(self.pages) - 1, rect)
+                        self.sprites[key] = page.subsurface(rect)
+        return len(loaded)
+
+    #Work out where each image ([key, (width, height)]) goes, returning [page Surface, [[key, Rect], ...]] for each new page
+    def packPages(self, sizes, has_alpha):
+        sizes = sorted(sizes, key=lambda item: (item[1][1], item[1][0]), reverse=True) #Tallest first, so each shelf wastes little height
+        new_pages = []
+        placed = []
+        x_pos = y_pos = shelf_height = 0
+        for key, (width, height) in sizes:
+            if width + self.padding > self.page_size or height + self.padding > self.page_size: #Too big for a page, so kept as it is
+                continue
+            if x_pos + width + self.padding > self.page_size: #Next shelf
+                x_pos = 0
+                y_pos += shelf_height
+                shelf_height = 0
+            if y_pos + height + self.padding > self.page_size: #Next page
+                new_pages.append(placed)
+                placed = []
+                x_pos = y_pos = shelf_height = 0
+            placed.append([key, pygame.Rect(x_pos + self.padding, y_pos + self.padding, width, height)])
+            x_pos += width + self.padding
+            shelf_height = max(shelf_height, height + self.padding)
+        if len(placed) > 0:
+            new_pages.append(placed)
+
+        ret_pages = []
+        for placed in new_pages:
+            page_height = max(rect.bottom for key, rect in placed) + self.padding #Only as tall as it needs to be
+            flags = pygame.SRCALPHA if has_alpha else 0
+            page = pygame.Surface((self.page_size, page_height), flags, 32)
+            if has_alpha:
+                page.fill((0, 0, 0, 0))
+            ret_pages.append([page, placed])
+        return ret_pages
+
+    #Image in the atlas, as a subsurface of its page, or None if it has not been put in the atlas
+    def get(self, key):
+        return self.sprites.get(key)
+
+    def clear(self):
+        with self.lock:
+            self.pages = []
+            self.sprites = {}
+            self.rects = {}
+
+    #One line summary of the atlas' pages
+    def getReport(self):
+        used = sum(rect.width * rect.height for page_no, rect in self.rects.values())
+        total = sum(page.get_width() * page.get_height() for page in self.pages)
+        if total == 0:
+            return 'Sprite atlas: empty'
+        return 'Sprite atlas: %d images on %d pages, %.1f MB, %.0f%% of the pages used' % (len(self.sprites), len(self.pages), sum(page.get_bytesize() * page.get_width() * page.get_height() for page in self.pages) / 1e6, 100 * used / total)
+
+
+sprite_atlas = SpriteAtlas() #Shared by every screen
+
+#An image, from the shared atlas if it has been put in it, or loaded with loadImage otherwise (e.g. in headless games and benchmarks, which never build the atlas)
+def loadSprite(path, size=None, smooth=True):
+    ret_surface = sprite_atlas.get(getImageKey(path, size, smooth))
+    if ret_surface != None:
+        return ret_surface
+    return loadImage(path, size, smooth)